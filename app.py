@@ -1,6 +1,8 @@
 import os
+import time
 from dotenv import load_dotenv
-from flask import Flask, request, render_template, jsonify, send_file, session
+from flask import Flask, Response, g, request, render_template, jsonify, send_file, session, stream_with_context
+import backend
 from backend import *
 
 load_dotenv()
@@ -11,9 +13,47 @@ os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.getenv("GCP_CREDENTIALS_PATH")
 app = Flask(__name__)
 app.secret_key = os.getenv("SECRET_KEY")
 
-database_manager = DatabaseManager()
-gemini_chat = GeminiChat()
+connection_registry = ConnectionRegistry()
+if os.getenv("CONNECTION_REGISTRY_PATH"):
+    connection_registry = SQLiteConnectionRegistry(
+        os.getenv("CONNECTION_REGISTRY_PATH"), os.getenv("CONNECTION_REGISTRY_KEY") or app.secret_key
+    )
+
+database_manager = DatabaseManager(
+    slow_query_ms=int(os.getenv("SLOW_QUERY_MS", "1000")),
+    slow_query_log_path=os.getenv("SLOW_QUERY_LOG_PATH", "logs/slow_queries.log"),
+    registry=connection_registry
+)
+result_cursor_store = ResultCursorStore(max_per_owner=int(os.getenv("MAX_CURSORS_PER_SESSION", "2")))
+job_runner = JobRunner()
+job_tasks = JobTasks(job_runner)
+gemini_chat = GeminiChat(
+    model=FakeChatModel() if os.getenv("CHAT_MODEL") == "fake" else None,
+    max_concurrent=int(os.getenv("CHAT_MAX_CONCURRENT", "4")),
+    max_streams=int(os.getenv("CHAT_MAX_STREAMS", "16"))
+)
 request_handler = RequestHandler(database_manager)
+metrics.add_gauge_collector(database_manager.collect_metrics)
+metrics.add_gauge_collector(gemini_chat.collect_metrics)
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    request_start = g.pop("request_start", None)
+    if request_start is not None:
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        payload_bytes = None if response.is_streamed else response.calculate_content_length()
+        metrics.observe_request(
+            endpoint, request.method, response.status_code, time.perf_counter() - request_start, payload_bytes
+        )
+    return response
+
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
     
 @app.route("/")
 def index():
@@ -21,20 +61,7 @@ def index():
 
 @app.route("/connect_db", methods=["POST"])
 def connect_db():
-    connection_mode = request.form.get("connection_mode")
-    
-    kwargs = {}
-    if connection_mode == "url":
-        kwargs["db_url"] = request.form.get("dbURLInput", "").strip()
-    elif connection_mode == "custom":
-        kwargs.update({
-            "username": request.form.get("username", "").strip(),
-            "password": request.form.get("password", "").strip(),
-            "host": request.form.get("host", "").strip(),
-            "port": request.form.get("port", "").strip(),
-            "database": request.form.get("database", "").strip(),
-        })
-
+    connection_mode, kwargs = request_handler.parse_connect_form(request.form)
     session_key, message = database_manager.connect_database(connection_mode, **kwargs)
     
     if session_key:
@@ -54,6 +81,40 @@ def dispose_db():
     else:
         return request_handler.error_response(message)
 
+@app.route("/pool_stats", methods=["GET"])
+def pool_stats():
+    hashed_session_key = session.get("hashed_session_key")
+    stats = database_manager.get_pool_stats(hashed_session_key)
+    return request_handler.success_response("Succeed: Pool Stats", stats=stats)
+
+@app.route("/slow_queries", methods=["GET"])
+@request_handler.require_db_connection
+def slow_queries(engine):
+    limit = min(request.args.get("limit", 20, type=int), database_manager.slow_query_log.max_entries)
+    entries = database_manager.slow_query_log.top(limit, session.get("hashed_session_key"))
+    return request_handler.success_response(
+        "Succeed: Slow Queries", threshold_ms=database_manager.slow_query_log.threshold_ms, slow_queries=entries
+    )
+
+@app.route("/query_timeout", methods=["POST"])
+@request_handler.require_db_connection
+def query_timeout(engine):
+    timeout_ms = request.form.get("queryTimeoutMsInput", type=int)
+    hashed_session_key = session.get("hashed_session_key")
+    database_manager.set_query_timeout(hashed_session_key, timeout_ms)
+    return request_handler.success_response(f"Succeed: Query Timeout {timeout_ms or 'Unlimited'} ms")
+
+@app.route("/cancel_query", methods=["POST"])
+@request_handler.require_db_connection
+def cancel_query(engine):
+    query_id = request.form.get("queryIdInput")
+    hashed_session_key = session.get("hashed_session_key")
+
+    if database_manager.query_guard.cancel(query_id, hashed_session_key):
+        return request_handler.success_response("Succeed: Cancelled Query")
+    else:
+        return request_handler.error_response("Failed: No Running Query")
+
 @app.route("/create_table", methods=["POST"])
 @request_handler.require_db_connection
 def create_table(engine):
@@ -61,7 +122,7 @@ def create_table(engine):
     column_names = request.form.getlist("columnNameInput")
     column_types = request.form.getlist("columnTypeInput")
     
-    table_creation_service = TableCreationService(engine)
+    table_creation_service = TableCreationService(engine, request_handler.get_schema_cache())
     message, query = table_creation_service.create_table_with_constraints(
         table_name, column_names, column_types, request.form
     )
@@ -71,66 +132,73 @@ def create_table(engine):
 @app.route("/drop_table", methods=["POST"])
 @request_handler.require_db_connection
 def drop_table(engine):
-    table_name = request.form.get("dropTableNameInput")
-    
-    is_valid, error_msg = request_handler.validate_required_fields({"table_name": table_name})
-    if not is_valid:
+    fields, error_msg = request_handler.parse_drop_table_form(request.form)
+    if not fields:
         return request_handler.error_response(error_msg)
     
-    drop_table_query = DropTableQuery(engine, table_name)
+    drop_table_query = DropTableQuery(engine, fields["table_name"])
     message, query = drop_table_query.execute()
     return request_handler.handle_query_response(message, query)
 
 @app.route("/insert_data", methods=["POST"])
 @request_handler.require_db_connection
 def insert_data(engine):
-    table_name = request.form.get("tableNameInput")
-    column_names = request.form.getlist("columnNameInput")
-    column_values = request.form.getlist("columnValueInput")
-    
-    is_valid, error_msg = request_handler.validate_required_fields({
-        "table_name": table_name,
-        "column_names": column_names,
-        "column_values": column_values
-    })
-    if not is_valid:
+    fields, error_msg = request_handler.parse_insert_form(request.form)
+    if not fields:
         return request_handler.error_response(error_msg)
     
-    data = request_handler.parse_insert_data(column_names, column_values)
-    insert_data_query = InsertDataQuery(engine, table_name, column_names, data)
+    insert_data_query = InsertDataQuery(engine, fields["table_name"], fields["column_names"], fields["data"])
     message, query = insert_data_query.execute()
     return request_handler.handle_query_response(message, query)
 
 @app.route("/get_db_info", methods=["GET"])
 def get_db_info():
     engine = request_handler.get_db_engine()
-    table_info_service = TableInfoService(engine)
+    table_info_service = TableInfoService(engine, request_handler.get_schema_cache())
     return jsonify(table_info_service.get_db_info())
 
+@app.route("/result_cache_stats", methods=["GET"])
+@request_handler.require_db_connection
+def result_cache_stats(engine):
+    result_cache = database_manager.get_result_cache(session.get("hashed_session_key"))
+    if result_cache is None:
+        return request_handler.error_response("Failed: Result Cache Disabled")
+    return request_handler.success_response("Succeed: Result Cache Stats", stats=result_cache.stats())
+
+@app.route("/schema_cache_stats", methods=["GET"])
+@request_handler.require_db_connection
+def schema_cache_stats(engine):
+    schema_cache = request_handler.get_schema_cache()
+    return request_handler.success_response("Succeed: Schema Cache Stats", stats=schema_cache.stats())
+
 @app.route("/get_table_data/<table_name>", methods=["GET"])
 def get_table_data(table_name):
     engine = request_handler.get_db_engine()
-    table_info_service = TableInfoService(engine)
-    result = table_info_service.get_table_data(table_name)
-    
+    table_info_service = TableInfoService(engine, request_handler.get_schema_cache())
+    page_size = request.args.get("page_size", type=int)
+    cursor = request.args.get("cursor")
+
+    try:
+        result = table_info_service.get_table_data(table_name, page_size, cursor)
+    except ValueError as e:
+        return request_handler.error_response(f"Failed: {str(e)}")
+
     if result:
-        return jsonify(result)
+        return request_handler.data_response(result)
     else:
         return request_handler.error_response("Failed: No Active DB Connection")
 
 @app.route("/update_data", methods=["POST"])
 @request_handler.require_db_connection
 def update_data(engine):
-    fields = {
-        "table_name": request.form.get("tableNameInput"),
-        "condition_column": request.form.get("conditionColInput"),
-        "condition_value": request.form.get("conditionValueInput"),
-        "target_columns": request.form.getlist("targetColInput"),
-        "target_values": request.form.getlist("targetValueInput")
-    }
-
-    is_valid, error_msg = request_handler.validate_required_fields(fields)
-    if not is_valid:
+    if request.is_json:
+        return update_data_batch(engine, request.get_json())
+    batch_data = request_handler.batch_update_from_form(request.form)
+    if batch_data:
+        return update_data_batch(engine, batch_data)
+
+    fields, error_msg = request_handler.parse_update_form(request.form)
+    if not fields:
         return request_handler.error_response(error_msg)
     
     update_data_query = UpdateDataQuery(
@@ -140,48 +208,38 @@ def update_data(engine):
     message, query = update_data_query.execute()
     return request_handler.handle_query_response(message, query)
 
+def update_data_batch(engine, data):
+    fields, error_msg = request_handler.parse_batch_update(data)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    bulk_update_query = BulkUpdateDataQuery(
+        engine, fields["table_name"], fields["key_column"], fields["updates"], fields["chunk_size"]
+    )
+    message, query = bulk_update_query.execute()
+    return request_handler.bulk_update_response(message, query, bulk_update_query)
+
 @app.route("/delete_data", methods=["POST"])
 @request_handler.require_db_connection
 def delete_data(engine):
-    fields = {
-        "table_name": request.form.get("tableNameInput"),
-        "columns": request.form.getlist("columnInput"),
-        "operators": request.form.getlist("operatorInput"),
-        "values": request.form.getlist("valueInput")
-    }
-
-    is_valid, error_msg = request_handler.validate_required_fields(fields)
-    if not is_valid:
+    fields, error_msg = request_handler.parse_delete_form(request.form)
+    if not fields:
         return request_handler.error_response(error_msg)
     
-    logical_operators = request.form.getlist("logicalOperatorInput")
-    conditions = request_handler.parse_delete_conditions(
-        fields["columns"], fields["operators"], fields["values"], logical_operators
-    )
-    
-    delete_data_query = DeleteDataQuery(engine, fields["table_name"], conditions)
+    delete_data_query = DeleteDataQuery(engine, fields["table_name"], fields["conditions"])
     message, query = delete_data_query.execute()
     return request_handler.handle_query_response(message, query)
 
 @app.route("/modify_table", methods=["POST"])
 @request_handler.require_db_connection
 def modify_table(engine):
-    fields = {
-        "table_name": request.form.get("tableNameInput"),
-        "command": request.form.get("commandInput"),
-        "column_name": request.form.get("columnNameInput")
-    }
-
-    is_valid, error_msg = request_handler.validate_required_fields(fields)
-    if not is_valid:
+    fields, error_msg = request_handler.parse_modify_form(request.form)
+    if not fields:
         return request_handler.error_response(error_msg)
-    
-    column_type = request.form.get("columnTypeInput")
-    column_new_name = request.form.get("columnNewNameInput")
 
     modify_table_query = ModifyTableQuery(
         engine, fields["table_name"], fields["command"], 
-        fields["column_name"], column_type, column_new_name
+        fields["column_name"], fields["column_type"], fields["column_new_name"]
     )
     message, query = modify_table_query.execute()
     return request_handler.handle_query_response(message, query)
@@ -189,91 +247,139 @@ def modify_table(engine):
 @app.route("/join_table", methods=["POST"])
 @request_handler.require_db_connection
 def join_table(engine):
-    fields = {
-        "table_name": request.form.get("tableNameInput"),
-        "join_types": request.form.getlist("joinTypes"),
-        "join_tables": request.form.getlist("joinTables"),
-        "join_conditions": request.form.getlist("joinConditions"),
-        "select_columns": request.form.getlist("selectColumns")
-    }
-    
-    is_valid, error_msg = request_handler.validate_required_fields(fields)
-    if not is_valid:
+    fields, error_msg = request_handler.parse_join_form(request.form)
+    if not fields:
         return request_handler.error_response(error_msg)
 
-    where_conditions = request.form.getlist("whereConditions")
     join_query = JoinTableQuery(
         engine, fields["table_name"], fields["join_types"], 
         fields["join_tables"], fields["join_conditions"], 
-        fields["select_columns"], where_conditions
+        fields["select_columns"], fields["where_conditions"], request_handler.get_result_cache()
     )
     message, query, rows, column_names = join_query.execute()
-    
-    return request_handler.success_response(
-        message, query,
-        rows=[dict(row._mapping) for row in rows],
-        column_names=column_names
-    )
+    return request_handler.join_response(message, query, rows, column_names, join_query)
 
 @app.route("/sorting_table", methods=["POST"])
 @request_handler.require_db_connection
 def sorting_table(engine):
-    fields = {
-        "table_name": request.form.get("tableNameInput"),
-        "order_columns": request.form.getlist("orderColumnNameInput"),
-        "order_sortings": request.form.getlist("sortingInput"),
-        "select_columns": request.form.getlist("selectColumnNameInput")
-    }
-
-    is_valid, error_msg = request_handler.validate_required_fields(fields)
-    if not is_valid:
+    fields, error_msg = request_handler.parse_sorting_form(request.form)
+    if not fields:
         return request_handler.error_response(error_msg)
 
     sorting_query = SortingTableQuery(
         engine, fields["table_name"], fields["order_columns"], 
-        fields["order_sortings"], fields["select_columns"]
+        fields["order_sortings"], fields["select_columns"], request_handler.get_result_cache(),
+        page_size=fields["page_size"],
+        cursor=fields["cursor"],
+        schema_cache=request_handler.get_schema_cache()
     )
     message, query, rows, column_names = sorting_query.execute()
-
-    return request_handler.success_response(
-        message, query,
-        rows=[dict(row._mapping) for row in rows],
-        column_names=column_names
-    )
+    return request_handler.sorting_response(message, query, rows, column_names, sorting_query)
 
 @app.route("/export_table", methods=["POST"])
 @request_handler.require_db_connection
 def export_table(engine):
-    table_name = request.form.get("exportTableNameInput")
-    file_service = FileService(engine)
-    
-    excel_data, message = file_service.export_table_to_excel(table_name)
+    fields, error_msg = request_handler.parse_export_form(request.form, backend.FileService.EXPORT_FORMATS)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    file_service = backend.FileService(engine)
+    chunks, message = file_service.export_table_stream(fields["table_name"], fields["file_format"])
     
-    if excel_data:
-            return send_file(
-                excel_data,
-                download_name=f"{table_name}.xlsx",
-                as_attachment=True,
-                mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
+    if chunks:
+        extension, mimetype = backend.FileService.EXPORT_FORMATS[fields["file_format"]]
+        return Response(
+            stream_with_context(chunks),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename={fields['table_name']}.{extension}"}
+        )
     else:
         return request_handler.error_response(message)
 
 @app.route("/import_excel", methods=["POST"])
 @request_handler.require_db_connection
 def import_excel(engine):
-    table_name = request.form.get("importTableNameInput")
-    file = request.files.get("importExcelFile")
-    file_service = FileService(engine)
+    fields, error_msg = request_handler.parse_import_form(request.form, request.files)
+    if not fields:
+        return request_handler.error_response(error_msg)
 
-    message, query = file_service.import_excel_to_table(table_name, file)
+    file_service = backend.FileService(engine)
+    message, query = file_service.import_excel_to_table(
+        fields["table_name"], fields["file"], fields["batch_size"],
+        fields["commit_per_batch"], fields["sheet_name"], fields["all_sheets"]
+    )
     return request_handler.handle_query_response(message, query)
 
+@app.route("/import_excel_job", methods=["POST"])
+@request_handler.require_db_connection
+def import_excel_job(engine):
+    fields, error_msg = request_handler.parse_import_form(request.form, request.files)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    filename = fields["file"].filename
+    upload_path = job_runner.save_upload(fields["file"])
+    job_id, message = job_tasks.submit_import(
+        session.get("hashed_session_key"), engine, upload_path, filename, fields
+    )
+    return request_handler.job_response(job_id, message)
+
+@app.route("/export_table_job", methods=["POST"])
+@request_handler.require_db_connection
+def export_table_job(engine):
+    fields, error_msg = request_handler.parse_export_form(request.form, backend.FileService.EXPORT_FORMATS)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    job_id, message = job_tasks.submit_export(
+        session.get("hashed_session_key"), engine, fields["table_name"], fields["file_format"]
+    )
+    return request_handler.job_response(job_id, message)
+
+@app.route("/execute_sql_script_job", methods=["POST"])
+@request_handler.require_db_connection
+def execute_sql_script_job(engine):
+    fields, error_msg = request_handler.parse_script_form(request.form, request.files)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    filename = fields["file"].filename
+    upload_path = job_runner.save_upload(fields["file"])
+    job_id, message = job_tasks.submit_script(
+        session.get("hashed_session_key"), engine, upload_path, filename, fields
+    )
+    return request_handler.job_response(job_id, message)
+
+@app.route("/job_status/<job_id>", methods=["GET"])
+def job_status(job_id):
+    status = job_runner.get_status(job_id, session.get("hashed_session_key"))
+
+    if status:
+        return request_handler.success_response("Succeed: Job Status", job=status)
+    else:
+        return request_handler.error_response("Failed: Expired or Unknown Job")
+
+@app.route("/cancel_job/<job_id>", methods=["POST"])
+def cancel_job(job_id):
+    if job_runner.cancel(job_id, session.get("hashed_session_key")):
+        return request_handler.success_response("Succeed: Cancelling Job")
+    else:
+        return request_handler.error_response("Failed: No Running Job")
+
+@app.route("/job_result/<job_id>", methods=["GET"])
+def job_result(job_id):
+    result = job_runner.get_result(job_id, session.get("hashed_session_key"))
+    if not result:
+        return request_handler.error_response("Failed: No Job Result")
+
+    result_path, download_name, mimetype = result
+    return send_file(result_path, mimetype=mimetype, as_attachment=True, download_name=download_name)
+
 @app.route("/generate_uml", methods=["POST"])
 @request_handler.require_db_connection
 def generate_uml(engine):
     start_table = request.form.get("umlTableNameInput")
-    uml_service = UMLService(engine)
+    uml_service = UMLService(engine, request_handler.get_schema_cache())
     
     message, uml_text = uml_service.generate_uml(start_table)
     return jsonify({"message": message, "uml": uml_text})
@@ -283,20 +389,47 @@ def generate_uml(engine):
 def execute_custom_query(engine):
     data = request.get_json()
     sql_query = data.get('query', '').strip()
-    query_executor = QueryExecutor(engine)
+    try:
+        query_executor = QueryExecutor(
+            engine, result_cursor_store, session.get("hashed_session_key"),
+            data.get("max_rows"), data.get("max_bytes")
+        )
+    except ValueError as e:
+        return request_handler.error_response(f"Failed: {str(e)}")
     
     message, query, rows, column_names = query_executor.execute_custom_query(sql_query)
     
     if rows is not None and column_names is not None:
-        return request_handler.success_response(message, query, rows=rows, column_names=column_names)
+        return request_handler.query_rows_response(message, query, rows, column_names, query_executor)
     else:
         return request_handler.success_response(message, query)
-    
+
+@app.route("/fetch_query_rows", methods=["POST"])
+@request_handler.require_db_connection
+def fetch_query_rows(engine):
+    data = request.get_json()
+    try:
+        query_executor = QueryExecutor(
+            engine, result_cursor_store, session.get("hashed_session_key"),
+            data.get("max_rows"), data.get("max_bytes")
+        )
+    except ValueError as e:
+        return request_handler.error_response(f"Failed: {str(e)}")
+
+    message, query, rows, column_names = query_executor.fetch_next_rows(data.get("cursor"))
+
+    if rows is not None:
+        return request_handler.query_rows_response(message, query, rows, column_names, query_executor)
+    else:
+        return request_handler.error_response(message)
+
 @app.route('/chat_with_vertex', methods=['POST'])
 def chat_with_vertex():
     try:
         data = request.get_json()
         user_message = data.get('message', '')
+        if data.get('stream') or request.accept_mimetypes.best == 'text/event-stream':
+            return request_handler.sse_response(gemini_chat.stream_events(user_message))
         response = gemini_chat.get_response(user_message)
         return jsonify({'response': response})
     except Exception as e:
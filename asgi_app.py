@@ -0,0 +1,446 @@
+import os
+import time
+from dotenv import load_dotenv
+from quart import Quart, Response, g, request, render_template, jsonify, send_file, session
+from quart.utils import run_sync, run_sync_iterable
+import backend
+from backend import *
+
+load_dotenv()
+
+os.environ["GOOGLE_CLOUD_PROJECT"] = os.getenv("GCP_PROJECT_ID")
+os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.getenv("GCP_CREDENTIALS_PATH")
+
+app = Quart(__name__)
+app.secret_key = os.getenv("SECRET_KEY")
+
+connection_registry = ConnectionRegistry()
+if os.getenv("CONNECTION_REGISTRY_PATH"):
+    connection_registry = SQLiteConnectionRegistry(
+        os.getenv("CONNECTION_REGISTRY_PATH"), os.getenv("CONNECTION_REGISTRY_KEY") or app.secret_key
+    )
+
+database_manager = DatabaseManager(
+    slow_query_ms=int(os.getenv("SLOW_QUERY_MS", "1000")),
+    slow_query_log_path=os.getenv("SLOW_QUERY_LOG_PATH", "logs/slow_queries.log"),
+    registry=connection_registry
+)
+result_cursor_store = ResultCursorStore(
+    max_open=int(os.getenv("ASYNC_MAX_OPEN_CURSORS", "256")),
+    max_per_owner=int(os.getenv("MAX_CURSORS_PER_SESSION", "2"))
+)
+job_runner = JobRunner()
+job_tasks = JobTasks(job_runner)
+gemini_chat = GeminiChat(
+    model=FakeChatModel() if os.getenv("CHAT_MODEL") == "fake" else None,
+    max_concurrent=int(os.getenv("CHAT_MAX_CONCURRENT", "4")),
+    max_streams=int(os.getenv("CHAT_MAX_STREAMS", "16"))
+)
+request_handler = backend.AsyncRequestHandler(database_manager)
+metrics.add_gauge_collector(database_manager.collect_metrics)
+metrics.add_gauge_collector(gemini_chat.collect_metrics)
+
+@app.before_request
+async def start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+async def record_request_metrics(response):
+    request_start = g.pop("request_start", None)
+    if request_start is not None:
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.observe_request(
+            endpoint, request.method, response.status_code, time.perf_counter() - request_start, response.content_length
+        )
+    return response
+
+@app.route("/metrics", methods=["GET"])
+async def prometheus_metrics():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+@app.route("/")
+async def index():
+    return await render_template("index.html")
+
+@app.route("/connect_db", methods=["POST"])
+async def connect_db():
+    connection_mode, kwargs = request_handler.parse_connect_form(await request.form)
+    session_key, message = await run_sync(database_manager.connect_database)(connection_mode, **kwargs)
+
+    if session_key:
+        session["hashed_session_key"] = session_key
+        return request_handler.success_response(message, "CONNECT TO DATABASE")
+    else:
+        return request_handler.error_response(message)
+
+@app.route("/dispose_db", methods=["POST"])
+async def dispose_db():
+    hashed_session_key = session.get("hashed_session_key")
+    message = await run_sync(database_manager.dispose_database)(hashed_session_key)
+
+    if "Succeed" in message:
+        session.pop("hashed_session_key", None)
+        return request_handler.success_response(message, "DISPOSE DATABASE CONNECTION")
+    else:
+        return request_handler.error_response(message)
+
+@app.route("/pool_stats", methods=["GET"])
+async def pool_stats():
+    hashed_session_key = session.get("hashed_session_key")
+    stats = database_manager.get_pool_stats(hashed_session_key)
+    return request_handler.success_response("Succeed: Pool Stats", stats=stats)
+
+@app.route("/slow_queries", methods=["GET"])
+@request_handler.require_db_connection
+async def slow_queries(engine):
+    limit = min(request.args.get("limit", 20, type=int), database_manager.slow_query_log.max_entries)
+    entries = database_manager.slow_query_log.top(limit, session.get("hashed_session_key"))
+    return request_handler.success_response(
+        "Succeed: Slow Queries", threshold_ms=database_manager.slow_query_log.threshold_ms, slow_queries=entries
+    )
+
+@app.route("/query_timeout", methods=["POST"])
+@request_handler.require_db_connection
+async def query_timeout(engine):
+    timeout_ms = (await request.form).get("queryTimeoutMsInput", type=int)
+    hashed_session_key = session.get("hashed_session_key")
+    database_manager.set_query_timeout(hashed_session_key, timeout_ms)
+    return request_handler.success_response(f"Succeed: Query Timeout {timeout_ms or 'Unlimited'} ms")
+
+@app.route("/cancel_query", methods=["POST"])
+@request_handler.require_db_connection
+async def cancel_query(engine):
+    query_id = (await request.form).get("queryIdInput")
+    hashed_session_key = session.get("hashed_session_key")
+
+    if await run_sync(database_manager.query_guard.cancel)(query_id, hashed_session_key):
+        return request_handler.success_response("Succeed: Cancelled Query")
+    else:
+        return request_handler.error_response("Failed: No Running Query")
+
+@app.route("/create_table", methods=["POST"])
+@request_handler.require_db_connection
+async def create_table(engine):
+    form = await request.form
+    table_name = form.get("tableNameInput")
+    column_names = form.getlist("columnNameInput")
+    column_types = form.getlist("columnTypeInput")
+
+    table_creation_service = TableCreationService(request_handler.get_db_engine(), request_handler.get_schema_cache())
+    message, query = await run_sync(table_creation_service.create_table_with_constraints)(
+        table_name, column_names, column_types, form
+    )
+
+    return request_handler.handle_query_response(message, query)
+
+@app.route("/drop_table", methods=["POST"])
+@request_handler.require_db_connection
+async def drop_table(engine):
+    fields, error_msg = request_handler.parse_drop_table_form(await request.form)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    drop_table_query = DropTableQuery(engine, fields["table_name"])
+    message, query = await drop_table_query.execute_async()
+    return request_handler.handle_query_response(message, query)
+
+@app.route("/insert_data", methods=["POST"])
+@request_handler.require_db_connection
+async def insert_data(engine):
+    fields, error_msg = request_handler.parse_insert_form(await request.form)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    insert_data_query = InsertDataQuery(engine, fields["table_name"], fields["column_names"], fields["data"])
+    message, query = await insert_data_query.execute_async()
+    return request_handler.handle_query_response(message, query)
+
+@app.route("/get_db_info", methods=["GET"])
+async def get_db_info():
+    engine = request_handler.get_db_engine()
+    table_info_service = TableInfoService(engine, request_handler.get_schema_cache())
+    return jsonify(await run_sync(table_info_service.get_db_info)())
+
+@app.route("/result_cache_stats", methods=["GET"])
+@request_handler.require_db_connection
+async def result_cache_stats(engine):
+    result_cache = database_manager.get_result_cache(session.get("hashed_session_key"))
+    if result_cache is None:
+        return request_handler.error_response("Failed: Result Cache Disabled")
+    return request_handler.success_response("Succeed: Result Cache Stats", stats=result_cache.stats())
+
+@app.route("/schema_cache_stats", methods=["GET"])
+@request_handler.require_db_connection
+async def schema_cache_stats(engine):
+    schema_cache = request_handler.get_schema_cache()
+    return request_handler.success_response("Succeed: Schema Cache Stats", stats=schema_cache.stats())
+
+@app.route("/get_table_data/<table_name>", methods=["GET"])
+async def get_table_data(table_name):
+    engine = request_handler.get_db_engine()
+    table_info_service = TableInfoService(engine, request_handler.get_schema_cache())
+    page_size = request.args.get("page_size", type=int)
+    cursor = request.args.get("cursor")
+
+    try:
+        result = await run_sync(table_info_service.get_table_data)(table_name, page_size, cursor)
+    except ValueError as e:
+        return request_handler.error_response(f"Failed: {str(e)}")
+
+    if result:
+        return request_handler.data_response(result)
+    else:
+        return request_handler.error_response("Failed: No Active DB Connection")
+
+@app.route("/update_data", methods=["POST"])
+@request_handler.require_db_connection
+async def update_data(engine):
+    if request.is_json:
+        return await update_data_batch(engine, await request.get_json())
+    form = await request.form
+    batch_data = request_handler.batch_update_from_form(form)
+    if batch_data:
+        return await update_data_batch(engine, batch_data)
+
+    fields, error_msg = request_handler.parse_update_form(form)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    update_data_query = UpdateDataQuery(
+        engine, fields["table_name"], fields["condition_column"],
+        fields["condition_value"], fields["target_columns"], fields["target_values"]
+    )
+    message, query = await update_data_query.execute_async()
+    return request_handler.handle_query_response(message, query)
+
+async def update_data_batch(engine, data):
+    fields, error_msg = request_handler.parse_batch_update(data)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    bulk_update_query = BulkUpdateDataQuery(
+        engine, fields["table_name"], fields["key_column"], fields["updates"], fields["chunk_size"]
+    )
+    message, query = await bulk_update_query.execute_async()
+    return request_handler.bulk_update_response(message, query, bulk_update_query)
+
+@app.route("/delete_data", methods=["POST"])
+@request_handler.require_db_connection
+async def delete_data(engine):
+    fields, error_msg = request_handler.parse_delete_form(await request.form)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    delete_data_query = DeleteDataQuery(engine, fields["table_name"], fields["conditions"])
+    message, query = await delete_data_query.execute_async()
+    return request_handler.handle_query_response(message, query)
+
+@app.route("/modify_table", methods=["POST"])
+@request_handler.require_db_connection
+async def modify_table(engine):
+    fields, error_msg = request_handler.parse_modify_form(await request.form)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    modify_table_query = ModifyTableQuery(
+        engine, fields["table_name"], fields["command"],
+        fields["column_name"], fields["column_type"], fields["column_new_name"]
+    )
+    message, query = await modify_table_query.execute_async()
+    return request_handler.handle_query_response(message, query)
+
+@app.route("/join_table", methods=["POST"])
+@request_handler.require_db_connection
+async def join_table(engine):
+    fields, error_msg = request_handler.parse_join_form(await request.form)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    join_query = JoinTableQuery(
+        engine, fields["table_name"], fields["join_types"],
+        fields["join_tables"], fields["join_conditions"],
+        fields["select_columns"], fields["where_conditions"], request_handler.get_result_cache()
+    )
+    message, query, rows, column_names = await join_query.execute_async()
+    return request_handler.join_response(message, query, rows, column_names, join_query)
+
+@app.route("/sorting_table", methods=["POST"])
+@request_handler.require_db_connection
+async def sorting_table(engine):
+    fields, error_msg = request_handler.parse_sorting_form(await request.form)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    sorting_query = SortingTableQuery(
+        engine, fields["table_name"], fields["order_columns"],
+        fields["order_sortings"], fields["select_columns"], request_handler.get_result_cache(),
+        page_size=fields["page_size"],
+        cursor=fields["cursor"],
+        schema_cache=request_handler.get_schema_cache()
+    )
+    message, query, rows, column_names = await sorting_query.execute_async()
+    return request_handler.sorting_response(message, query, rows, column_names, sorting_query)
+
+@app.route("/export_table", methods=["POST"])
+@request_handler.require_db_connection
+async def export_table(engine):
+    fields, error_msg = request_handler.parse_export_form(await request.form, backend.FileService.EXPORT_FORMATS)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    file_service = backend.FileService(request_handler.get_db_engine())
+    chunks, message = await run_sync(file_service.export_table_stream)(fields["table_name"], fields["file_format"])
+
+    if chunks:
+        extension, mimetype = backend.FileService.EXPORT_FORMATS[fields["file_format"]]
+        return Response(
+            run_sync_iterable(chunks),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename={fields['table_name']}.{extension}"}
+        )
+    else:
+        return request_handler.error_response(message)
+
+@app.route("/import_excel", methods=["POST"])
+@request_handler.require_db_connection
+async def import_excel(engine):
+    fields, error_msg = request_handler.parse_import_form(await request.form, await request.files)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    file_service = backend.FileService(request_handler.get_db_engine())
+    message, query = await run_sync(file_service.import_excel_to_table)(
+        fields["table_name"], fields["file"], fields["batch_size"],
+        fields["commit_per_batch"], fields["sheet_name"], fields["all_sheets"]
+    )
+    return request_handler.handle_query_response(message, query)
+
+@app.route("/import_excel_job", methods=["POST"])
+@request_handler.require_db_connection
+async def import_excel_job(engine):
+    fields, error_msg = request_handler.parse_import_form(await request.form, await request.files)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    filename = fields["file"].filename
+    upload_path = job_runner.new_result_path(os.path.splitext(filename)[1])
+    await fields["file"].save(upload_path)
+    job_id, message = job_tasks.submit_import(
+        session.get("hashed_session_key"), request_handler.get_db_engine(), upload_path, filename, fields
+    )
+    return request_handler.job_response(job_id, message)
+
+@app.route("/export_table_job", methods=["POST"])
+@request_handler.require_db_connection
+async def export_table_job(engine):
+    fields, error_msg = request_handler.parse_export_form(await request.form, backend.FileService.EXPORT_FORMATS)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    job_id, message = job_tasks.submit_export(
+        session.get("hashed_session_key"), request_handler.get_db_engine(), fields["table_name"], fields["file_format"]
+    )
+    return request_handler.job_response(job_id, message)
+
+@app.route("/execute_sql_script_job", methods=["POST"])
+@request_handler.require_db_connection
+async def execute_sql_script_job(engine):
+    fields, error_msg = request_handler.parse_script_form(await request.form, await request.files)
+    if not fields:
+        return request_handler.error_response(error_msg)
+
+    filename = fields["file"].filename
+    upload_path = job_runner.new_result_path(os.path.splitext(filename)[1])
+    await fields["file"].save(upload_path)
+    job_id, message = job_tasks.submit_script(
+        session.get("hashed_session_key"), request_handler.get_db_engine(), upload_path, filename, fields
+    )
+    return request_handler.job_response(job_id, message)
+
+@app.route("/job_status/<job_id>", methods=["GET"])
+async def job_status(job_id):
+    status = job_runner.get_status(job_id, session.get("hashed_session_key"))
+
+    if status:
+        return request_handler.success_response("Succeed: Job Status", job=status)
+    else:
+        return request_handler.error_response("Failed: Expired or Unknown Job")
+
+@app.route("/cancel_job/<job_id>", methods=["POST"])
+async def cancel_job(job_id):
+    if job_runner.cancel(job_id, session.get("hashed_session_key")):
+        return request_handler.success_response("Succeed: Cancelling Job")
+    else:
+        return request_handler.error_response("Failed: No Running Job")
+
+@app.route("/job_result/<job_id>", methods=["GET"])
+async def job_result(job_id):
+    result = job_runner.get_result(job_id, session.get("hashed_session_key"))
+    if not result:
+        return request_handler.error_response("Failed: No Job Result")
+
+    result_path, download_name, mimetype = result
+    return await send_file(result_path, mimetype=mimetype, as_attachment=True, attachment_filename=download_name)
+
+@app.route("/generate_uml", methods=["POST"])
+@request_handler.require_db_connection
+async def generate_uml(engine):
+    start_table = (await request.form).get("umlTableNameInput")
+    uml_service = UMLService(request_handler.get_db_engine(), request_handler.get_schema_cache())
+
+    message, uml_text = await run_sync(uml_service.generate_uml)(start_table)
+    return jsonify({"message": message, "uml": uml_text})
+
+@app.route("/execute_custom_query", methods=["POST"])
+@request_handler.require_db_connection
+async def execute_custom_query(engine):
+    data = await request.get_json()
+    sql_query = data.get('query', '').strip()
+    try:
+        query_executor = QueryExecutor(
+            engine, result_cursor_store, session.get("hashed_session_key"),
+            data.get("max_rows"), data.get("max_bytes")
+        )
+    except ValueError as e:
+        return request_handler.error_response(f"Failed: {str(e)}")
+
+    message, query, rows, column_names = await query_executor.execute_custom_query_async(sql_query)
+
+    if rows is not None and column_names is not None:
+        return request_handler.query_rows_response(message, query, rows, column_names, query_executor)
+    else:
+        return request_handler.success_response(message, query)
+
+@app.route("/fetch_query_rows", methods=["POST"])
+@request_handler.require_db_connection
+async def fetch_query_rows(engine):
+    data = await request.get_json()
+    try:
+        query_executor = QueryExecutor(
+            engine, result_cursor_store, session.get("hashed_session_key"),
+            data.get("max_rows"), data.get("max_bytes")
+        )
+    except ValueError as e:
+        return request_handler.error_response(f"Failed: {str(e)}")
+
+    message, query, rows, column_names = await query_executor.fetch_next_rows_async(data.get("cursor"))
+
+    if rows is not None:
+        return request_handler.query_rows_response(message, query, rows, column_names, query_executor)
+    else:
+        return request_handler.error_response(message)
+
+@app.route('/chat_with_vertex', methods=['POST'])
+async def chat_with_vertex():
+    try:
+        data = await request.get_json()
+        user_message = data.get('message', '')
+        if data.get('stream') or request.accept_mimetypes.best == 'text/event-stream':
+            return request_handler.sse_response(gemini_chat.stream_events(user_message))
+        response = await run_sync(gemini_chat.get_response)(user_message)
+        return jsonify({'response': response})
+    except Exception as e:
+        return jsonify({'response': f'Failed: {str(e)}'}), 500
+
+if __name__ == "__main__":
+    app.run()
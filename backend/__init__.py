@@ -1,41 +1,88 @@
+from importlib import import_module
 # from .connect_sql import ConnectSQL
 # from .dispose_sql import DisposeSQL
 from .queries.create_table import CreateTableQuery
 from .queries.drop_table import DropTableQuery
 from .queries.insert_data import InsertDataQuery
+from .queries.bulk_insert_data import BulkInsertDataQuery
 from .queries.update_data import UpdateDataQuery
+from .queries.bulk_update_data import BulkUpdateDataQuery
 from .queries.delete_data import DeleteDataQuery
 from .queries.modify_table import ModifyTableQuery
 from .queries.join_table import JoinTableQuery
 from .queries.sorting_table import SortingTableQuery
-from .gemini_chat import GeminiChat
+from .gemini_chat import GeminiChat, FakeChatModel
+from .metrics import MetricsRegistry, metrics
 from .database_manager import DatabaseManager
+from .connection_registry import ConnectionRegistry, SQLiteConnectionRegistry
+from .schema_cache import SchemaCache
+from .result_cache import ResultCache
+from .query_guard import QueryGuard
+from .slow_query_log import SlowQueryLog
 from .table_info_service import TableInfoService
-from .file_service import FileService
 from .uml_service import UMLService
+from .sql_script_service import SQLScriptService, SQLScriptSplitter
 from .query_executor import QueryExecutor
+from .result_cursor_store import ResultCursorStore
+from .cursor_codec import CursorCodec
+from .job_runner import JobRunner, JobProgress, ProgressFile, JobCancelled
+from .job_tasks import JobTasks
 from .foreign_key_validator import ForeignKeyValidator
 from .table_creation_service import TableCreationService
 from .request_handler import RequestHandler
 
+LAZY_EXPORTS = {
+    "FileService": ".file_service",
+    "AsyncRequestHandler": ".async_request_handler",
+}
+
 __all__ = [ 
     # "ConnectSQL",
     # "DisposeSQL",
     "CreateTableQuery",
     "DropTableQuery",
     "InsertDataQuery",
+    "BulkInsertDataQuery",
     "UpdateDataQuery",
+    "BulkUpdateDataQuery",
     "DeleteDataQuery",
     "ModifyTableQuery",
     "JoinTableQuery",
     "SortingTableQuery",
     "GeminiChat",
+    "FakeChatModel",
+    "MetricsRegistry",
+    "metrics",
     "DatabaseManager",
+    "ConnectionRegistry",
+    "SQLiteConnectionRegistry",
+    "SchemaCache",
+    "ResultCache",
+    "QueryGuard",
+    "SlowQueryLog",
     "TableInfoService",
-    "FileService",
     "UMLService",
+    "SQLScriptService",
+    "SQLScriptSplitter",
     "QueryExecutor",
+    "ResultCursorStore",
+    "CursorCodec",
+    "JobRunner",
+    "JobProgress",
+    "ProgressFile",
+    "JobCancelled",
+    "JobTasks",
     "ForeignKeyValidator",
     "TableCreationService",
     "RequestHandler",
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name in LAZY_EXPORTS:
+        value = getattr(import_module(LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_EXPORTS))
@@ -0,0 +1,75 @@
+from functools import wraps
+from quart import current_app, jsonify, request, session
+from quart.utils import run_sync_iterable
+from .request_handler import RequestHandler
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class AsyncRequestHandler(RequestHandler):
+    def require_db_connection(self, f):
+        @wraps(f)
+        async def decorated_function(*args, **kwargs):
+            engine = self.get_async_engine()
+            if not engine:
+                return self.error_response("Failed: No Active DB Connection")
+
+            hashed_session_key = session.get("hashed_session_key")
+            timeout_ms = request.headers.get("X-Query-Timeout-Ms", type=int)
+            if timeout_ms is None:
+                timeout_ms = self.database_manager.get_query_timeout(hashed_session_key)
+
+            with self.database_manager.query_guard.track(
+                request.headers.get("X-Query-Id"), hashed_session_key, timeout_ms
+            ):
+                return await f(engine, *args, **kwargs)
+        return decorated_function
+
+    def get_async_engine(self):
+        hashed_session_key = session.get("hashed_session_key")
+        return self.database_manager.get_async_engine(hashed_session_key)
+
+    def get_db_engine(self):
+        hashed_session_key = session.get("hashed_session_key")
+        return self.database_manager.get_db_engine(hashed_session_key)
+
+    def get_schema_cache(self):
+        hashed_session_key = session.get("hashed_session_key")
+        return self.database_manager.get_schema_cache(hashed_session_key)
+
+    def get_result_cache(self):
+        if request.headers.get("Cache-Control", "").lower() == "no-cache":
+            return None
+        hashed_session_key = session.get("hashed_session_key")
+        return self.database_manager.get_result_cache(hashed_session_key)
+
+    @staticmethod
+    def get_result_format():
+        result_format = request.headers.get("X-Result-Format") or request.args.get("format")
+        return result_format if result_format in RequestHandler.RESULT_FORMATS else "objects"
+
+    @staticmethod
+    def sse_response(events):
+        async def encode():
+            async for event, payload in run_sync_iterable(events):
+                yield f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        return current_app.response_class(
+            encode(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    @staticmethod
+    def json_response(payload):
+        if orjson is not None:
+            body = orjson.dumps(payload, default=RequestHandler._json_default)
+        else:
+            body = json.dumps(payload, default=RequestHandler._json_default, separators=(",", ":"))
+        return current_app.response_class(body, mimetype="application/json")
+
+    @staticmethod
+    def error_response(message, query=None):
+        return jsonify({"message": message, "query": query})
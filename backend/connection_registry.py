@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import base64
+import sqlite3
+import hashlib
+import threading
+
+class ConnectionRegistry:
+    shared = False
+
+    def __init__(self):
+        self._sessions = {}
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def register(self, session_key, descriptor):
+        with self._lock:
+            self._sessions[session_key] = {
+                "descriptor": dict(descriptor),
+                "last_used": time.time(),
+                "query_timeout_ms": None,
+            }
+
+    def lookup(self, session_key):
+        with self._lock:
+            record = self._sessions.get(session_key)
+            return dict(record["descriptor"]) if record else None
+
+    def state(self, session_key):
+        with self._lock:
+            record = self._sessions.get(session_key)
+            if not record:
+                return None
+            return {"last_used": record["last_used"], "query_timeout_ms": record["query_timeout_ms"]}
+
+    def touch(self, session_key):
+        with self._lock:
+            record = self._sessions.get(session_key)
+            if record:
+                record["last_used"] = time.time()
+            return record is not None
+
+    def set_query_timeout(self, session_key, timeout_ms):
+        with self._lock:
+            record = self._sessions.get(session_key)
+            if record:
+                record["query_timeout_ms"] = timeout_ms
+            return record is not None
+
+    def remove(self, session_key):
+        with self._lock:
+            return self._sessions.pop(session_key, None) is not None
+
+    def expire(self, deadline):
+        with self._lock:
+            expired = [key for key, record in self._sessions.items() if record["last_used"] < deadline]
+            for key in expired:
+                del self._sessions[key]
+            return len(expired)
+
+    def count(self):
+        with self._lock:
+            return len(self._sessions)
+
+    def bump_generations(self, scope, names):
+        with self._lock:
+            for name in names:
+                self._generations[(scope, name)] = self._generations.get((scope, name), 0) + 1
+
+    def generations(self, scope, names):
+        with self._lock:
+            return {name: self._generations.get((scope, name), 0) for name in names}
+
+    def close(self):
+        pass
+
+class SQLiteConnectionRegistry:
+    KEY_CONTEXT = b"ezdb-connection-registry:"
+    shared = True
+
+    def __init__(self, path, secret_key, busy_timeout=5.0):
+        from cryptography.fernet import Fernet
+
+        if not secret_key:
+            raise ValueError("Connection registry requires a secret key")
+        if isinstance(secret_key, str):
+            secret_key = secret_key.encode()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._fernet = Fernet(base64.urlsafe_b64encode(hashlib.sha256(self.KEY_CONTEXT + secret_key).digest()))
+        self._local = threading.local()
+        c = self._connect()
+        c.execute(
+            "CREATE TABLE IF NOT EXISTS connection_registry ("
+            "session_id TEXT PRIMARY KEY, descriptor BLOB NOT NULL, "
+            "last_used REAL NOT NULL, query_timeout_ms INTEGER)"
+        )
+        c.execute("CREATE INDEX IF NOT EXISTS connection_registry_last_used ON connection_registry (last_used)")
+        c.execute(
+            "CREATE TABLE IF NOT EXISTS cache_generations ("
+            "generation_id TEXT PRIMARY KEY, generation INTEGER NOT NULL)"
+        )
+
+    def _connect(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _session_id(session_key):
+        return hashlib.sha256(session_key.encode()).hexdigest()
+
+    def register(self, session_key, descriptor):
+        token = self._fernet.encrypt(json.dumps(descriptor).encode())
+        self._connect().execute(
+            "INSERT OR REPLACE INTO connection_registry (session_id, descriptor, last_used, query_timeout_ms) "
+            "VALUES (?, ?, ?, NULL)",
+            (self._session_id(session_key), token, time.time()),
+        )
+
+    def lookup(self, session_key):
+        from cryptography.fernet import InvalidToken
+
+        row = self._connect().execute(
+            "SELECT descriptor FROM connection_registry WHERE session_id = ?", (self._session_id(session_key),)
+        ).fetchone()
+        if not row:
+            return None
+        try:
+            return json.loads(self._fernet.decrypt(row[0]))
+        except InvalidToken:
+            return None
+
+    def state(self, session_key):
+        row = self._connect().execute(
+            "SELECT last_used, query_timeout_ms FROM connection_registry WHERE session_id = ?",
+            (self._session_id(session_key),),
+        ).fetchone()
+        return {"last_used": row[0], "query_timeout_ms": row[1]} if row else None
+
+    def touch(self, session_key):
+        cursor = self._connect().execute(
+            "UPDATE connection_registry SET last_used = ? WHERE session_id = ?",
+            (time.time(), self._session_id(session_key)),
+        )
+        return cursor.rowcount > 0
+
+    def set_query_timeout(self, session_key, timeout_ms):
+        cursor = self._connect().execute(
+            "UPDATE connection_registry SET query_timeout_ms = ? WHERE session_id = ?",
+            (timeout_ms, self._session_id(session_key)),
+        )
+        return cursor.rowcount > 0
+
+    def remove(self, session_key):
+        cursor = self._connect().execute(
+            "DELETE FROM connection_registry WHERE session_id = ?", (self._session_id(session_key),)
+        )
+        return cursor.rowcount > 0
+
+    def expire(self, deadline):
+        return self._connect().execute("DELETE FROM connection_registry WHERE last_used < ?", (deadline,)).rowcount
+
+    def count(self):
+        return self._connect().execute("SELECT COUNT(*) FROM connection_registry").fetchone()[0]
+
+    @staticmethod
+    def _generation_id(scope, name):
+        return hashlib.sha256(f"{scope}\0{name}".encode()).hexdigest()
+
+    def bump_generations(self, scope, names):
+        self._connect().executemany(
+            "INSERT INTO cache_generations (generation_id, generation) VALUES (?, 1) "
+            "ON CONFLICT (generation_id) DO UPDATE SET generation = generation + 1",
+            [(self._generation_id(scope, name),) for name in names],
+        )
+
+    def generations(self, scope, names):
+        ids = {self._generation_id(scope, name): name for name in names}
+        rows = self._connect().execute(
+            f"SELECT generation_id, generation FROM cache_generations WHERE generation_id IN ({', '.join('?' * len(ids))})",
+            list(ids),
+        ).fetchall()
+        found = {ids[generation_id]: generation for generation_id, generation in rows}
+        return {name: found.get(name, 0) for name in names}
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,21 @@
+import json
+import base64
+
+class CursorCodec:
+    @staticmethod
+    def encode(state):
+        raw = json.dumps(state, default=str, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor):
+        if not cursor:
+            return {}
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            state = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (ValueError, TypeError):
+            raise ValueError("Invalid Cursor")
+        if not isinstance(state, dict):
+            raise ValueError("Invalid Cursor")
+        return state
@@ -1,11 +1,49 @@
 import time
+import asyncio
 import secrets
 import hashlib
+import threading
+from collections import OrderedDict
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from .schema_cache import SchemaCache
+from .result_cache import ResultCache
+from .query_guard import QueryGuard
+from .slow_query_log import SlowQueryLog
+from .connection_registry import ConnectionRegistry
 
 class DatabaseManager:
-    def __init__(self):
+    POOL_OPTIONS = ("pool_size", "max_overflow", "pool_timeout", "pool_recycle")
+    ASYNC_DRIVERS = {"mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
+
+    def __init__(self, schema_cache_ttl=300, schema_cache_size=4096, pool_size=5, max_overflow=5,
+                 pool_timeout=30, pool_recycle=1800, idle_ttl=1800, max_engines=100, reaper_interval=60,
+                 query_timeout_ms=None, result_cache_ttl=60, result_cache_bytes=16 * 1024 * 1024,
+                 slow_query_ms=1000, slow_query_log_path=None, registry=None,
+                 registry_touch_interval=30):
         self.db_connections = {}
+        self.registry = registry or ConnectionRegistry()
+        self.registry_touch_interval = registry_touch_interval
+        self.shared_engines = OrderedDict()
+        self.schema_cache_ttl = schema_cache_ttl
+        self.schema_cache_size = schema_cache_size
+        self.result_cache_ttl = result_cache_ttl
+        self.result_cache_bytes = result_cache_bytes
+        self.pool_defaults = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            "pool_recycle": pool_recycle,
+        }
+        self.idle_ttl = idle_ttl
+        self.max_engines = max_engines
+        self.reaper_interval = reaper_interval
+        self.query_guard = QueryGuard(query_timeout_ms)
+        self.slow_query_log = SlowQueryLog(slow_query_ms, slow_query_log_path, owner_getter=self.query_guard.current_owner)
+        self._lock = threading.RLock()
+        self._reaper = None
+        self._stop_reaper = threading.Event()
+        self._disposing = set()
 
     def generate_session_key(self):
         current_time = str(time.time_ns())
@@ -21,53 +59,383 @@ class DatabaseManager:
 
     def connect_database(self, connection_mode, **kwargs):
         db_url = None
-        
+
         if connection_mode == "url":
             db_url = kwargs.get("db_url", "").strip()
             if not db_url:
                 return None, "Failed: Required DB URL"
-                
+
         elif connection_mode == "custom":
             username = kwargs.get("username", "").strip()
             password = kwargs.get("password", "").strip()
             host = kwargs.get("host", "").strip()
             port = kwargs.get("port", "").strip()
             database = kwargs.get("database", "").strip()
-            
+
             if not all([username, password, host, port, database]):
                 return None, "Failed: Required custom connection details"
-                
+
             db_url = f"mysql+pymysql://{username}:{password}@{host}:{port}/{database}"
 
         try:
             if db_url.startswith("mysql://"):
                 db_url = db_url.replace("mysql://", "mysql+pymysql://")
 
-            engine = create_engine(db_url, echo=False)
-
-            with engine.connect() as c:
-                c.execute(text("SELECT 1"))
-
+            pool_options = self._pool_options(db_url, kwargs)
             session_key = self.generate_session_key()
-            self.db_connections[session_key] = {"engine": engine}
+            self._open_session(session_key, db_url, pool_options, verify=True)
+
+            try:
+                self.registry.register(session_key, {"db_url": db_url, "pool_options": pool_options})
+            except Exception:
+                self._drop_session(session_key)
+                raise
 
             return session_key, "Succeed: Connected DB"
-            
+
         except Exception as e:
             return None, f"Failed: {str(e)}"
 
+    def _open_session(self, session_key, db_url, pool_options, verify):
+        engine_key = self._engine_key(db_url, pool_options)
+
+        with self._lock:
+            shared_engine = self.shared_engines.get(engine_key)
+            if shared_engine:
+                self._attach_session(session_key, engine_key, shared_engine)
+                return
+
+        engine = create_engine(db_url, echo=False, **pool_options)
+
+        if verify:
+            with engine.connect() as c:
+                c.execute(text("SELECT 1"))
+
+        evicted = []
+        duplicate_engine = None
+        with self._lock:
+            shared_engine = self.shared_engines.get(engine_key)
+            if shared_engine:
+                duplicate_engine = engine
+            else:
+                while len(self.shared_engines) >= self.max_engines:
+                    evicted.append(self._evict_shared_engine())
+                self.query_guard.install(engine)
+                self.slow_query_log.install(engine)
+                shared_engine = {
+                    "engine": engine,
+                    "schema_cache": SchemaCache(
+                        engine, self.schema_cache_ttl, self.schema_cache_size, **self._shared_cache_options(engine_key)
+                    ),
+                    "result_cache": ResultCache(
+                        engine, self.result_cache_ttl, self.result_cache_bytes, **self._shared_cache_options(engine_key)
+                    ) if self.result_cache_bytes else None,
+                    "async_engine": None,
+                    "async_loop": None,
+                    "pool_options": pool_options,
+                    "sessions": set(),
+                }
+                self.shared_engines[engine_key] = shared_engine
+            self._attach_session(session_key, engine_key, shared_engine)
+
+        if duplicate_engine:
+            duplicate_engine.dispose()
+        for shared_engine in evicted:
+            self._release(shared_engine)
+        self._start_reaper()
+
+    def _shared_cache_options(self, engine_key):
+        if not self.registry.shared:
+            return {}
+        return {"registry": self.registry, "scope": engine_key[0]}
+
+    def _pool_options(self, db_url, kwargs):
+        if make_url(db_url).get_backend_name() == "sqlite":
+            return {}
+
+        options = {}
+        for option in self.POOL_OPTIONS:
+            value = kwargs.get(option)
+            options[option] = int(value) if value not in (None, "") else self.pool_defaults[option]
+        return options
+
+    def _engine_key(self, db_url, pool_options):
+        url = make_url(db_url)
+        url = url.set(drivername=url.drivername.lower(), host=url.host.lower() if url.host else url.host)
+        if url.port is None and url.get_backend_name() == "mysql":
+            url = url.set(port=3306)
+
+        credential_fingerprint = hashlib.sha256(f"{url.username}:{url.password}".encode()).hexdigest()
+        normalized_url = url.render_as_string(hide_password=True)
+        return normalized_url, credential_fingerprint, tuple(sorted(pool_options.items()))
+
+    def _attach_session(self, session_key, engine_key, shared_engine):
+        shared_engine["sessions"].add(session_key)
+        self.shared_engines.move_to_end(engine_key)
+        self.db_connections[session_key] = {
+            "engine": shared_engine["engine"],
+            "schema_cache": shared_engine["schema_cache"],
+            "result_cache": shared_engine["result_cache"],
+            "engine_key": engine_key,
+            "last_used": time.monotonic(),
+            "touched_at": time.monotonic(),
+            "query_timeout_ms": None,
+        }
+
+    def _detach_session(self, session_key):
+        connection = self.db_connections.pop(session_key)
+        shared_engine = self.shared_engines.get(connection["engine_key"])
+        if shared_engine is None:
+            return None
+
+        shared_engine["sessions"].discard(session_key)
+        if shared_engine["sessions"]:
+            return None
+        return self.shared_engines.pop(connection["engine_key"])
+
+    def _drop_session(self, session_key):
+        with self._lock:
+            if session_key not in self.db_connections:
+                return
+            released = self._detach_session(session_key)
+        if released:
+            self._release(released)
+
+    def _resolve(self, session_key):
+        if not session_key:
+            return None
+
+        state = self.registry.state(session_key)
+        if state is None:
+            self._drop_session(session_key)
+            return None
+
+        with self._lock:
+            connection = self.db_connections.get(session_key)
+        if connection is None:
+            descriptor = self.registry.lookup(session_key)
+            if descriptor is None:
+                return None
+            self._open_session(session_key, descriptor["db_url"], descriptor["pool_options"], verify=False)
+
+        now = time.monotonic()
+        with self._lock:
+            connection = self.db_connections.get(session_key)
+            if connection is None:
+                return None
+            connection["last_used"] = now
+            connection["query_timeout_ms"] = state["query_timeout_ms"]
+            self.shared_engines.move_to_end(connection["engine_key"])
+            touch = now - connection["touched_at"] >= self.registry_touch_interval
+            if touch:
+                connection["touched_at"] = now
+
+        if touch:
+            self.registry.touch(session_key)
+        return connection
+
+    def _evict_shared_engine(self):
+        _, shared_engine = self.shared_engines.popitem(last=False)
+        for session_key in shared_engine["sessions"]:
+            self.db_connections.pop(session_key, None)
+        return shared_engine
+
     def get_db_engine(self, session_key):
-        if not session_key or session_key not in self.db_connections:
+        connection = self._resolve(session_key)
+        return connection["engine"] if connection else None
+
+    def get_async_engine(self, session_key):
+        connection = self._resolve(session_key)
+        if not connection:
             return None
-        return self.db_connections[session_key]["engine"]
+
+        with self._lock:
+            shared_engine = self.shared_engines.get(connection["engine_key"])
+            if shared_engine is None:
+                return None
+            if shared_engine["async_engine"] is None:
+                shared_engine["async_engine"] = self._create_async_engine(shared_engine)
+                shared_engine["async_loop"] = self._running_loop()
+            return shared_engine["async_engine"]
+
+    def _create_async_engine(self, shared_engine):
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine = shared_engine["engine"]
+        drivername = self.ASYNC_DRIVERS.get(engine.url.get_backend_name())
+        if drivername is None:
+            raise ValueError(f"Unsupported Async Backend {engine.url.get_backend_name()}")
+
+        async_engine = create_async_engine(
+            engine.url.set(drivername=drivername), echo=False, **shared_engine["pool_options"]
+        )
+
+        self.query_guard.install(async_engine.sync_engine, kill_engine=engine)
+        self.slow_query_log.install(async_engine.sync_engine, explain_engine=engine)
+        shared_engine["schema_cache"].watch(async_engine.sync_engine)
+        if shared_engine["result_cache"] is not None:
+            shared_engine["result_cache"].watch(async_engine.sync_engine)
+        return async_engine
+
+    def get_schema_cache(self, session_key):
+        with self._lock:
+            if not session_key or session_key not in self.db_connections:
+                return None
+            return self.db_connections[session_key]["schema_cache"]
+
+    def get_result_cache(self, session_key):
+        with self._lock:
+            if not session_key or session_key not in self.db_connections:
+                return None
+            return self.db_connections[session_key]["result_cache"]
+
+    def set_query_timeout(self, session_key, timeout_ms):
+        if not session_key or not self.registry.set_query_timeout(session_key, timeout_ms or None):
+            return False
+        with self._lock:
+            if session_key in self.db_connections:
+                self.db_connections[session_key]["query_timeout_ms"] = timeout_ms or None
+        return True
+
+    def get_query_timeout(self, session_key):
+        with self._lock:
+            if not session_key or session_key not in self.db_connections:
+                return None
+            return self.db_connections[session_key]["query_timeout_ms"]
 
     def dispose_database(self, session_key):
-        if not session_key or session_key not in self.db_connections:
+        if not session_key or not self.registry.remove(session_key):
             return "Failed: No Active DB Connection"
 
-        if session_key in self.db_connections:
-            self.db_connections[session_key]["engine"].dispose()
-            del self.db_connections[session_key]
-            return "Succeed: Disposed DB"
+        self._drop_session(session_key)
+        return "Succeed: Disposed DB"
+
+    def get_pool_stats(self, session_key=None):
+        with self._lock:
+            shared_engines = list(self.shared_engines.values())
+            session_count = len(self.db_connections)
+            session_engine = self.db_connections.get(session_key, {}).get("engine")
+
+        stats = {
+            "engines": len(shared_engines),
+            "sessions": session_count,
+            "registered_sessions": self.registry.count(),
+            "open": 0,
+            "checked_out": 0,
+            "idle": 0,
+            "overflow": 0,
+        }
+        for shared_engine in shared_engines:
+            pool_stats = self._engine_pool_stats(shared_engine["engine"])
+            pool_stats["sessions"] = len(shared_engine["sessions"])
+            for name in ("open", "checked_out", "idle", "overflow"):
+                stats[name] += pool_stats[name]
+            if shared_engine["engine"] is session_engine:
+                stats["session"] = pool_stats
+        return stats
+
+    def collect_metrics(self):
+        stats = self.get_pool_stats()
+        return [
+            ("db_engines", "Shared engines held by the connection manager.", (), stats["engines"]),
+            ("db_sessions", "Sessions attached to shared engines.", (), stats["sessions"]),
+            ("db_registered_sessions", "Sessions held in the connection registry.", (), stats["registered_sessions"]),
+            ("db_pool_connections_open", "Open pooled connections across all engines.", (), stats["open"]),
+            ("db_pool_connections_checked_out", "Pooled connections currently in use.", (), stats["checked_out"]),
+            ("db_pool_connections_idle", "Pooled connections waiting in the pool.", (), stats["idle"]),
+            ("db_pool_overflow", "Connections opened beyond the pool size.", (), stats["overflow"]),
+        ]
+
+    def _engine_pool_stats(self, engine):
+        pool = engine.pool
+        checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+        idle = pool.checkedin() if hasattr(pool, "checkedin") else 0
+        return {
+            "pool_class": type(pool).__name__,
+            "size": pool.size() if hasattr(pool, "size") else None,
+            "open": checked_out + idle,
+            "checked_out": checked_out,
+            "idle": idle,
+            "overflow": max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0,
+        }
+
+    def reap_idle_engines(self):
+        self.registry.expire(time.time() - self.idle_ttl)
+        deadline = time.monotonic() - self.idle_ttl
+        with self._lock:
+            session_keys = list(self.db_connections)
+        removed_keys = {key for key in session_keys if self.registry.state(key) is None}
+
+        released = []
+        with self._lock:
+            expired_keys = [
+                key for key, connection in self.db_connections.items()
+                if connection["last_used"] < deadline or key in removed_keys
+            ]
+            for key in expired_keys:
+                shared_engine = self._detach_session(key)
+                if shared_engine:
+                    released.append(shared_engine)
+
+        for shared_engine in released:
+            self._release(shared_engine)
+        return len(released)
+
+    def close(self):
+        self._stop_reaper.set()
+        with self._lock:
+            shared_engines = list(self.shared_engines.values())
+            self.shared_engines.clear()
+            self.db_connections.clear()
+        for shared_engine in shared_engines:
+            self._release(shared_engine)
+        self.slow_query_log.close()
+        self.registry.close()
+
+    def _release(self, shared_engine):
+        self.query_guard.uninstall(shared_engine["engine"])
+        self.slow_query_log.uninstall(shared_engine["engine"])
+        shared_engine["schema_cache"].close()
+        if shared_engine["result_cache"] is not None:
+            shared_engine["result_cache"].close()
+        shared_engine["engine"].dispose()
+
+        async_engine = shared_engine.get("async_engine")
+        if async_engine is not None:
+            self.query_guard.uninstall(async_engine.sync_engine)
+            self.slow_query_log.uninstall(async_engine.sync_engine)
+            self._dispose_async_engine(async_engine, shared_engine["async_loop"])
+
+    @staticmethod
+    def _running_loop():
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _dispose_async_engine(self, async_engine, loop):
+        if loop is None or loop.is_closed():
+            async_engine.sync_engine.dispose(close=False)
+            return
+
+        if self._running_loop() is loop:
+            task = loop.create_task(async_engine.dispose())
+            self._disposing.add(task)
+            task.add_done_callback(self._disposing.discard)
         else:
-            return "Failed: No Active DB Connection" 
\ No newline at end of file
+            asyncio.run_coroutine_threadsafe(async_engine.dispose(), loop)
+
+    def _start_reaper(self):
+        with self._lock:
+            if self._reaper and self._reaper.is_alive():
+                return
+            self._stop_reaper.clear()
+            self._reaper = threading.Thread(target=self._reap_loop, name="db-engine-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self):
+        while not self._stop_reaper.wait(self.reaper_interval):
+            try:
+                self.reap_idle_engines()
+            except Exception:
+                continue
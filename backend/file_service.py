@@ -3,38 +3,199 @@ import numpy as np
 import chardet
 import re
 import datetime
+import decimal
 import io
+import os
+import csv
+import json
+import tempfile
+import time
+import queue
+import codecs
+import pickle
+import shutil
+import threading
+import multiprocessing
+import xlsxwriter
+from concurrent.futures import ProcessPoolExecutor, wait
 from sqlalchemy import text
 from .queries.create_table import CreateTableQuery
-from .queries.insert_data import InsertDataQuery
+from .queries.bulk_insert_data import BulkInsertDataQuery
+from .metrics import metrics
+from .spreadsheet_reader import SpreadsheetReader
 
 class FileService:
-    def __init__(self, db_engine):
+    IMPORT_BATCH_SIZE = 1000
+    INFERENCE_SAMPLE_SIZE = 5000
+    VARCHAR_SIZES = (16, 32, 64, 128, 255)
+    BOOLEAN_VALUES = ("true", "false")
+    DATE_FORMATS = {"date": "%Y-%m-%d", "datetime": "%Y-%m-%d %H:%M:%S"}
+    KIND_FALLBACKS = {
+        "boolean": ("boolean",),
+        "integer": ("integer", "decimal"),
+        "date": ("date", "datetime"),
+        "datetime": ("datetime",),
+        "string": (),
+    }
+    INT_RANGE = (-2**31, 2**31 - 1)
+    BIGINT_RANGE = (-2**63, 2**63 - 1)
+    EXPORT_CHUNK_SIZE = 2000
+    SPREADSHEET_EXTENSIONS = (".xlsx", ".xls")
+    SHEET_WORKERS = 4
+    SHEET_POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    CSV_SAMPLE_BYTES = 64 * 1024
+    CSV_CHUNK_SIZE = 50000
+    CSV_QUEUE_CHUNKS = 4
+    CSV_DELIMITERS = ",;\t|"
+    CSV_ENCODINGS = ("utf-8", "windows-1252", "latin1")
+    IMPLICIT_COMMIT_DIALECTS = ("mysql",)
+    NUMERIC_TYPE_DIGITS = {"INT": 10, "BIGINT": 19}
+    STRING_TYPES = ("VARCHAR", "TEXT", "MEDIUMTEXT")
+    EXPORT_FORMATS = {
+        "csv": ("csv", "text/csv"),
+        "ndjson": ("ndjson", "application/x-ndjson"),
+        "xlsx": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    }
+
+    def __init__(self, db_engine, progress=None):
         self.db_engine = db_engine
+        self.progress = progress
+        self.rows_exported = 0
+
+    def _report_progress(self, **counts):
+        if self.progress is not None:
+            self.progress.update(**counts)
 
-    def export_table_to_excel(self, table_name):
+    def export_table_stream(self, table_name, file_format="xlsx"):
         if not self.db_engine:
             return None, "Failed: No Active DB Connection"
-        
+
         if not table_name or not table_name.strip():
             return None, "Failed: Undefined Table Name"
-        
+
+        if file_format not in self.EXPORT_FORMATS:
+            return None, f"Failed: Unsupported Export Format {file_format}"
+
         try:
             with self.db_engine.connect() as c:
-                query = f"SELECT * FROM {table_name}"
-                output = c.execute(text(query))
-                df = pd.DataFrame(output.fetchall(), columns=output.keys())
-                
-                excel_data = io.BytesIO()
-                with pd.ExcelWriter(excel_data, engine="xlsxwriter") as w:
-                    df.to_excel(w, index=False, sheet_name=table_name)
-                excel_data.seek(0)
-                
-                return excel_data, "Succeed: Table exported to Excel"
+                c.execute(text(f"SELECT * FROM {table_name} WHERE 1 = 0"))
         except Exception as e:
             return None, f"Failed: {str(e)}"
 
-    def import_excel_to_table(self, table_name, file):
+        return self._stream_export(table_name, file_format), f"Succeed: Table exported to {file_format.upper()}"
+
+    def export_table_to_file(self, table_name, file_format, path):
+        chunks, message = self.export_table_stream(table_name, file_format)
+        if not chunks:
+            return message
+
+        try:
+            with open(path, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    self._report_progress(bytes_written=len(chunk))
+        except Exception as e:
+            return f"Failed: {str(e)}"
+        finally:
+            chunks.close()
+        return message
+
+    def _stream_export(self, table_name, file_format):
+        writers = {
+            "csv": self._stream_csv,
+            "ndjson": self._stream_ndjson,
+            "xlsx": self._stream_xlsx,
+        }
+        start = time.perf_counter()
+        payload_bytes = 0
+        failed = True
+        try:
+            with self.db_engine.connect() as c:
+                query = f"SELECT * FROM {table_name}"
+                output = c.execution_options(stream_results=True, max_row_buffer=self.EXPORT_CHUNK_SIZE).execute(text(query))
+                for chunk in writers[file_format](output, table_name):
+                    payload_bytes += len(chunk)
+                    yield chunk
+            failed = False
+        finally:
+            metrics.observe_operation(
+                "export", time.perf_counter() - start, self.rows_exported, payload_bytes, failed
+            )
+
+    def _iter_row_chunks(self, output):
+        while True:
+            rows = output.fetchmany(self.EXPORT_CHUNK_SIZE)
+            if not rows:
+                break
+            self.rows_exported += len(rows)
+            yield rows
+            self._report_progress(rows=len(rows))
+
+    def _stream_csv(self, output, table_name):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(output.keys())
+
+        for rows in self._iter_row_chunks(output):
+            writer.writerows(rows)
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    def _stream_ndjson(self, output, table_name):
+        column_names = list(output.keys())
+
+        for rows in self._iter_row_chunks(output):
+            lines = [
+                json.dumps(dict(zip(column_names, row)), default=str, ensure_ascii=False)
+                for row in rows
+            ]
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    def _stream_xlsx(self, output, table_name):
+        fd, path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+        try:
+            workbook = xlsxwriter.Workbook(path, {
+                "constant_memory": True,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+                "strings_to_numbers": False,
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+            })
+            worksheet = workbook.add_worksheet(table_name[:31])
+            worksheet.write_row(0, 0, list(output.keys()))
+
+            row_index = 1
+            for rows in self._iter_row_chunks(output):
+                for row in rows:
+                    worksheet.write_row(row_index, 0, [self._to_excel_value(value) for value in row])
+                    row_index += 1
+            workbook.close()
+
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(64 * 1024)
+                    if not chunk:
+                        break
+                    yield chunk
+        finally:
+            os.remove(path)
+
+    def _to_excel_value(self, value):
+        if isinstance(value, (int, float, str, bool, datetime.date, datetime.datetime)) or value is None:
+            return value
+        if isinstance(value, decimal.Decimal):
+            return float(value)
+        if isinstance(value, bytes):
+            return value.hex()
+        return str(value)
+
+    @metrics.instrument("import")
+    def import_excel_to_table(self, table_name, file, batch_size=None, commit_per_batch=False, sheet_name=None, all_sheets=False):
         if not self.db_engine:
             return "Failed: No Active DB Connection", None
         
@@ -44,74 +205,382 @@ class FileService:
             return "Failed: Undefined Excel File", None
 
         try:
-            df = self._read_file(file)
-            df = self._normalize_dataframe(df)
-            data = self._prepare_data_for_insert(df)
-            column_types = self._infer_column_types(df)
-
-            message, query = self._create_and_populate_table(table_name, df, column_types, data)
-            return message, query
+            filename = file.filename.lower()
+            if filename.endswith(self.SPREADSHEET_EXTENSIONS):
+                return self._import_spreadsheet(
+                    table_name, file, batch_size or self.IMPORT_BATCH_SIZE, commit_per_batch, sheet_name, all_sheets
+                )
+            if filename.endswith(".csv"):
+                return self._import_csv(table_name, file, batch_size or self.IMPORT_BATCH_SIZE, commit_per_batch)
+            raise ValueError("Unsupported file format")
             
         except Exception as e:
             return f"Failed: {str(e)}", None
 
-    def _read_file(self, file):
-        filename = file.filename.lower()
-        
-        if filename.endswith(".csv"):
-            return self._read_csv_with_encoding_detection(file)
-        elif filename.endswith(".xlsx"):
-            file.seek(0)
-            return pd.read_excel(file, engine="openpyxl")
-        elif filename.endswith(".xls"):
-            file.seek(0)
-            return pd.read_excel(file, engine="xlrd")
+    def _import_csv(self, table_name, file, batch_size, commit_per_batch):
+        file.seek(0)
+        sample = file.read(self.CSV_SAMPLE_BYTES)
+        file.seek(0)
+        encoding, sample_text = self._detect_csv_encoding(sample)
+        dialect = self._detect_csv_dialect(sample_text)
+
+        chunks = queue.Queue(maxsize=self.CSV_QUEUE_CHUNKS)
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=self._produce_csv_chunks, args=(file, encoding, dialect, batch_size, chunks, stop), daemon=True
+        )
+        producer.start()
+        try:
+            stream = self._iter_csv_chunks(chunks)
+            first = next(stream, None)
+            if first is None:
+                return "Failed: Empty CSV File", None
+
+            columns, batches, chunk_types, max_lengths = first
+            state = {
+                "table_name": table_name,
+                "columns": columns,
+                "column_types": list(chunk_types),
+                "max_lengths": max_lengths,
+                "pending": [],
+            }
+            if not commit_per_batch and self.db_engine.dialect.name in self.IMPLICIT_COMMIT_DIALECTS:
+                return self._import_spooled_csv(batches, stream, state)
+            return self._create_and_populate_table(
+                table_name, columns, self._default_column_types(state["column_types"]),
+                self._iter_csv_batches(batches, stream, state), commit_per_batch,
+                lambda c: self._apply_column_widening(c, state)
+            )
+        finally:
+            stop.set()
+            producer.join()
+
+    def _import_spooled_csv(self, batches, stream, state):
+        spool_dir = tempfile.mkdtemp(prefix="ezdb-import-")
+        try:
+            spool_path = os.path.join(spool_dir, "csv.spool")
+            with open(spool_path, "wb") as spool:
+                while True:
+                    for batch in batches:
+                        pickle.dump(batch, spool, protocol=pickle.HIGHEST_PROTOCOL)
+                    self._report_progress()
+
+                    chunk = next(stream, None)
+                    if chunk is None:
+                        break
+                    _, batches, chunk_types, max_lengths = chunk
+                    self._widen_column_types(state, chunk_types, max_lengths)
+
+            return self._create_and_populate_table(
+                state["table_name"], state["columns"], self._default_column_types(state["column_types"]),
+                self._iter_spooled_batches(spool_path)
+            )
+        finally:
+            shutil.rmtree(spool_dir, ignore_errors=True)
+
+    def _detect_csv_encoding(self, sample):
+        if sample.startswith(codecs.BOM_UTF8):
+            candidates = ["utf-8-sig"]
+        elif sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            candidates = ["utf-16"]
         else:
-            raise ValueError("Unsupported file format")
+            detected = (chardet.detect(sample).get("encoding") or "utf-8").lower()
+            candidates = list(dict.fromkeys(["utf-8" if detected == "ascii" else detected, *self.CSV_ENCODINGS]))
 
-    def _read_csv_with_encoding_detection(self, file):
-        encoding_sample = file.read(7000)
-        file.seek(0)
-        
-        detected_encoding = chardet.detect(encoding_sample).get("encoding", "utf-8")
-        encodings = list(dict.fromkeys([
-            detected_encoding, "utf-8", "utf-8-sig", "latin1", "iso-8859-1", "windows-1252"
-        ]))
+        for encoding in candidates:
+            try:
+                return encoding, codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            except (UnicodeDecodeError, LookupError):
+                continue
+        raise ValueError("Undecoded CSV file")
+
+    def _detect_csv_dialect(self, sample_text):
+        lines = sample_text[:sample_text.rfind("\n") + 1] or sample_text
+        try:
+            return csv.Sniffer().sniff(lines, delimiters=self.CSV_DELIMITERS)
+        except csv.Error:
+            return csv.excel
 
-        for encoding in encodings:
+    def _produce_csv_chunks(self, file, encoding, dialect, batch_size, chunks, stop):
+        try:
+            reader = pd.read_csv(
+                file, encoding=encoding, encoding_errors="strict", engine="c", chunksize=self.CSV_CHUNK_SIZE,
+                sep=dialect.delimiter, quotechar=dialect.quotechar or '"', doublequote=dialect.doublequote,
+                escapechar=dialect.escapechar, skipinitialspace=dialect.skipinitialspace
+            )
+            columns = None
+            with reader:
+                for df in reader:
+                    if columns is None:
+                        columns = self._normalize_columns(list(df.columns))
+                    df.columns = columns
+                    df = df.replace({"N/A": None})
+                    chunk_types, max_lengths = self._infer_chunk_types(df)
+                    rows = self._to_insert_rows(df)
+                    batches = [rows[start:start + batch_size] for start in range(0, len(rows), batch_size)]
+                    if not self._put_chunk(chunks, (columns, batches, chunk_types, max_lengths), stop):
+                        return
+            self._put_chunk(chunks, None, stop)
+        except UnicodeDecodeError as e:
+            byte = e.object[e.start:e.start + 1].hex()
+            self._put_chunk(chunks, ValueError(
+                f"Undecoded CSV file: not valid {encoding} after the first {self.CSV_SAMPLE_BYTES // 1024} KB "
+                f"(byte 0x{byte}: {e.reason})"
+            ), stop)
+        except BaseException as e:
+            self._put_chunk(chunks, e, stop)
+
+    def _put_chunk(self, chunks, item, stop):
+        while not stop.is_set():
             try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _iter_csv_chunks(self, chunks):
+        while True:
+            item = chunks.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def _iter_csv_batches(self, batches, stream, state):
+        while True:
+            for batch in batches:
+                yield batch
+                self._report_progress(rows=len(batch))
+
+            chunk = next(stream, None)
+            if chunk is None:
+                return
+            _, batches, chunk_types, max_lengths = chunk
+            self._widen_column_types(state, chunk_types, max_lengths)
+
+    def _widen_column_types(self, state, chunk_types, max_lengths):
+        for index, (chunk_type, max_length) in enumerate(zip(chunk_types, max_lengths)):
+            state["max_lengths"][index] = max(state["max_lengths"][index], max_length)
+            if chunk_type is None:
+                continue
+            current = state["column_types"][index]
+            widened = self._merge_column_types(current, chunk_type, state["max_lengths"][index])
+            if widened != current:
+                state["column_types"][index] = widened
+                state["pending"].append(index)
+
+    def _default_column_types(self, column_types):
+        return [column_type or "VARCHAR(255)" for column_type in column_types]
+
+    def _apply_column_widening(self, c, state):
+        if not state["pending"]:
+            return
+        dialect = self.db_engine.dialect.name
+        for index in dict.fromkeys(state["pending"]):
+            column, column_type = state["columns"][index], state["column_types"][index]
+            if dialect == "mysql":
+                c.execute(text(f"ALTER TABLE {state['table_name']} MODIFY COLUMN {column} {column_type}"))
+            elif dialect != "sqlite":
+                c.execute(text(f"ALTER TABLE {state['table_name']} ALTER COLUMN {column} TYPE {column_type}"))
+        state["pending"] = []
+
+    def _import_spreadsheet(self, table_name, file, batch_size, commit_per_batch, sheet_name, all_sheets):
+        spool_dir = tempfile.mkdtemp(prefix="ezdb-import-")
+        try:
+            if all_sheets:
+                workbook_path = os.path.join(spool_dir, "workbook" + os.path.splitext(file.filename.lower())[1])
+                with open(workbook_path, "wb") as f:
+                    shutil.copyfileobj(file, f)
+                with SpreadsheetReader(workbook_path, file.filename) as reader:
+                    sheet_names = reader.sheet_names()
+                parsed_sheets = self._parse_sheets_in_pool(workbook_path, file.filename, sheet_names, batch_size, spool_dir)
+                table_names = [f"{table_name}_{self._normalize_name(name)}" for name in sheet_names]
+            else:
                 file.seek(0)
-                return pd.read_csv(file, encoding=encoding, engine="python")
-            except Exception:
+                spool_path = os.path.join(spool_dir, "sheet-0.spool")
+                parsed_sheets = [self._parse_sheet(file, file.filename, sheet_name, batch_size, spool_path) + (spool_path,)]
+                table_names = [table_name]
+
+            results = []
+            skipped = []
+            for target, (columns, column_types, row_count, spool_path) in zip(table_names, parsed_sheets):
+                if not columns:
+                    if not all_sheets:
+                        return "Failed: Empty Sheet", None
+                    skipped.append(target)
+                    continue
+                message, query = self._create_and_populate_table(
+                    target, columns, column_types, self._iter_spooled_batches(spool_path), commit_per_batch
+                )
+                results.append((target, message, query))
+
+            if not all_sheets:
+                return results[0][1], results[0][2]
+
+            queries = "\n".join(query for _, _, query in results if query) or None
+            failures = [f"{target} - {message}" for target, message, _ in results if "Failed" in message]
+            if failures:
+                return f"Failed: {len(failures)} of {len(results)} Sheet(s) Not Imported ({'; '.join(failures)})", queries
+            message = f"Succeed: Imported {len(results)} Sheet(s) into {', '.join(target for target, _, _ in results)}"
+            if skipped:
+                message += f" (Skipped Empty: {', '.join(skipped)})"
+            return message, queries
+        finally:
+            shutil.rmtree(spool_dir, ignore_errors=True)
+
+    def _parse_sheets_in_pool(self, workbook_path, filename, sheet_names, batch_size, spool_dir):
+        spool_paths = [os.path.join(spool_dir, f"sheet-{index}.spool") for index in range(len(sheet_names))]
+        workers = max(1, min(len(sheet_names), self.SHEET_WORKERS, os.cpu_count() or 1))
+
+        mp_context = multiprocessing.get_context(self.SHEET_POOL_START_METHOD)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+            futures = [
+                pool.submit(FileService._parse_sheet_worker, workbook_path, filename, name, batch_size, path)
+                for name, path in zip(sheet_names, spool_paths)
+            ]
+            try:
+                pending = set(futures)
+                while pending:
+                    _, pending = wait(pending, timeout=0.5)
+                    self._report_progress()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+            return [future.result() + (path,) for future, path in zip(futures, spool_paths)]
+
+    @staticmethod
+    def _parse_sheet_worker(workbook_path, filename, sheet_name, batch_size, spool_path):
+        return FileService(None)._parse_sheet(workbook_path, filename, sheet_name, batch_size, spool_path)
+
+    def _parse_sheet(self, source, filename, sheet_name, batch_size, spool_path):
+        row_count = 0
+        column_types = None
+        max_lengths = None
+
+        with SpreadsheetReader(source, filename) as reader, open(spool_path, "wb") as spool:
+            header, chunks = reader.iter_batches(sheet_name, self.INFERENCE_SAMPLE_SIZE)
+            columns = self._normalize_columns(header)
+
+            for rows in chunks:
+                chunk_types, chunk_lengths = self._infer_chunk_types(pd.DataFrame(rows, columns=columns, dtype=object))
+                if column_types is None:
+                    column_types, max_lengths = chunk_types, chunk_lengths
+                else:
+                    max_lengths = [max(a, b) for a, b in zip(max_lengths, chunk_lengths)]
+                    column_types = [
+                        self._merge_column_types(a, b, length)
+                        for a, b, length in zip(column_types, chunk_types, max_lengths)
+                    ]
+
+                for start in range(0, len(rows), batch_size):
+                    pickle.dump(rows[start:start + batch_size], spool, protocol=pickle.HIGHEST_PROTOCOL)
+                row_count += len(rows)
+                self._report_progress()
+
+        column_types = [column_type or "VARCHAR(255)" for column_type in (column_types or [None] * len(columns))]
+        return columns, column_types, row_count
+
+    def _iter_spooled_batches(self, spool_path):
+        with open(spool_path, "rb") as spool:
+            while True:
+                try:
+                    batch = pickle.load(spool)
+                except EOFError:
+                    break
+                yield batch
+                self._report_progress(rows=len(batch))
+
+    def _infer_chunk_types(self, df):
+        column_types = []
+        max_lengths = []
+        for column in df.columns:
+            values = df[column].dropna()
+            if len(values) == 0:
+                column_types.append(None)
+                max_lengths.append(0)
                 continue
-        
-        raise ValueError("Undecoded CSV file")
+            column_types.append(self._determine_column_type(values, self.INFERENCE_SAMPLE_SIZE))
+            max_lengths.append(int(values.astype(str).str.len().max()))
+        return column_types, max_lengths
 
-    def _normalize_dataframe(self, df):
-        df.columns = df.columns.str.strip().str.lower()
-        normalized_columns = [re.sub(r"\W+", "_", col.strip()) for col in df.columns]
-        df.columns = normalized_columns
-        return df.replace({"N/A": None, np.nan: None})
+    def _merge_column_types(self, current, new, max_length):
+        if current is None or current == new:
+            return current or new
+        if new is None:
+            return current
 
-    def _prepare_data_for_insert(self, df):
-        data = df.to_dict(orient="records")
-        
-        for row in data:
-            for key, value in row.items():
-                if isinstance(value, str):
-                    row[key] = f"'{value.replace(chr(39), chr(39)*2)}'"
-                elif isinstance(value, (datetime.date, datetime.datetime)):
-                    row[key] = f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
-                elif value is None:
-                    row[key] = None
-        
-        return data
+        current_base, new_base = current.split("(")[0], new.split("(")[0]
+        string_length = max(max_length, self._string_type_capacity(current), self._string_type_capacity(new))
+        if current_base in self.STRING_TYPES or new_base in self.STRING_TYPES:
+            return self._string_type_for_length(string_length)
+        if {current_base, new_base} == {"DATE", "DATETIME"}:
+            return "DATETIME"
+
+        numeric_types = ("INT", "BIGINT", "DECIMAL", "DOUBLE")
+        if current_base not in numeric_types or new_base not in numeric_types:
+            return self._string_type_for_length(string_length)
+        if "DOUBLE" in (current_base, new_base):
+            return "DOUBLE"
+        if current_base != "DECIMAL" and new_base != "DECIMAL":
+            return "BIGINT"
+
+        integer_digits, scale = zip(*(self._numeric_digits(column_type) for column_type in (current, new)))
+        precision = max(integer_digits) + max(scale)
+        if precision > 65 or max(scale) > 30:
+            return "DOUBLE"
+        return f"DECIMAL({precision},{max(scale)})"
+
+    def _string_type_capacity(self, column_type):
+        if column_type.startswith("VARCHAR("):
+            return int(column_type[len("VARCHAR("):-1])
+        return {"TEXT": 65535, "MEDIUMTEXT": 16777215}.get(column_type, 0)
 
-    def _create_and_populate_table(self, table_name, df, column_types, data):
+    def _numeric_digits(self, column_type):
+        if column_type in self.NUMERIC_TYPE_DIGITS:
+            return self.NUMERIC_TYPE_DIGITS[column_type], 0
+        precision, scale = (int(part) for part in column_type[len("DECIMAL("):-1].split(","))
+        return precision - scale, scale
+
+    def _normalize_columns(self, header):
+        columns = []
+        for index, name in enumerate(header):
+            name = self._normalize_name(str(name)) if name is not None else ""
+            name = name or f"unnamed_{index}"
+            candidate, suffix = name, 1
+            while candidate in columns:
+                candidate = f"{name}_{suffix}"
+                suffix += 1
+            columns.append(candidate)
+        return columns
+
+    def _normalize_name(self, name):
+        return re.sub(r"\W+", "_", name.strip().lower())
+
+    def _to_insert_rows(self, df):
+        return [
+            tuple(self._to_db_value(value) for value in row)
+            for row in df.itertuples(index=False, name=None)
+        ]
+
+    def _to_db_value(self, value):
+        if value is None or value is pd.NaT:
+            return None
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float) and np.isnan(value):
+            return None
+        if isinstance(value, pd.Timestamp):
+            return value.to_pydatetime()
+        return value
+
+    def _create_and_populate_table(self, table_name, columns, column_types, batches, commit_per_batch=False, before_batch=None):
         create_table_query = CreateTableQuery(
             self.db_engine, 
             table_name, 
-            list(zip(df.columns, column_types, [None] * len(df.columns))),  
+            list(zip(columns, column_types, [None] * len(columns))),  
             []
         )
         message, query = create_table_query.execute()
@@ -119,87 +588,121 @@ class FileService:
         if "Failed" in message:
             return message, query
 
-        insert_data_query = InsertDataQuery(self.db_engine, table_name, df.columns.tolist(), data)
-        return insert_data_query.execute()
-
-    def _infer_column_types(self, df):
-        column_types = []
-        df_data = df.iloc[1:].reset_index(drop=True) if len(df) > 1 else df
-        
-        type_patterns = {
-            'DATE': r"\d{4}-\d{2}-\d{2}",
-            'DATETIME': r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}",
-            'BOOLEAN': r"(?i)TRUE|FALSE"
-        }
-
-        for column in df.columns:
-            col_type = self._determine_column_type(df_data[column], type_patterns)
-            column_types.append(col_type)
-
-        return column_types
+        bulk_insert_query = BulkInsertDataQuery(
+            self.db_engine, table_name, columns, batches, commit_per_batch, before_batch
+        )
+        return bulk_insert_query.execute()
 
-    def _determine_column_type(self, col_data, type_patterns):
-        dtype = col_data.dtype
+    def _determine_column_type(self, col_data, sample_size):
         col_data_clean = col_data.dropna()
         
         if len(col_data_clean) == 0:
             return "VARCHAR(255)"
-            
-        col_str = col_data_clean.astype(str)
 
-        if np.issubdtype(dtype, np.integer):
+        sample = col_data_clean
+        if len(sample) > sample_size:
+            sample = sample.sample(n=sample_size, random_state=0)
+
+        candidate = self._guess_column_kind(sample)
+        for kind in self.KIND_FALLBACKS[candidate]:
+            column_type = self._resolve_column_type(col_data_clean, kind)
+            if column_type:
+                return column_type
+
+        return self._string_column_type(col_data_clean)
+
+    def _guess_column_kind(self, sample):
+        inferred = pd.api.types.infer_dtype(sample, skipna=True)
+
+        if inferred == "boolean":
+            return "boolean"
+        if inferred in ("integer", "floating", "mixed-integer-float", "decimal"):
+            return "integer"
+        if inferred in ("datetime64", "datetime", "date"):
+            return "date"
+        if inferred != "string":
+            return "string"
+
+        values = sample.str.strip()
+        if values.str.lower().isin(self.BOOLEAN_VALUES).all():
+            return "boolean"
+        if pd.to_numeric(values, errors="coerce").notna().all():
+            return "integer"
+        for kind, date_format in self.DATE_FORMATS.items():
+            if pd.to_datetime(values, format=date_format, errors="coerce").notna().all():
+                return kind
+        return "string"
+
+    def _resolve_column_type(self, values, kind):
+        if kind == "boolean":
+            if pd.api.types.infer_dtype(values, skipna=True) == "boolean":
+                return "TINYINT(1)"
+            if values.astype(str).str.strip().str.lower().isin(self.BOOLEAN_VALUES).all():
+                return "TINYINT(1)"
+            return None
+
+        if kind in ("integer", "decimal"):
+            numbers = self._to_numeric(values)
+            if numbers.isna().any():
+                return None
+            if kind == "integer":
+                return self._integer_column_type(numbers)
+            return self._decimal_column_type(values, numbers)
+
+        timestamps = self._to_datetime(values, kind)
+        if timestamps.isna().any():
+            return None
+        if kind == "date" and not (timestamps == timestamps.dt.normalize()).all():
+            return None
+        return kind.upper()
+
+    def _to_numeric(self, values):
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            return values
+        if pd.api.types.infer_dtype(values, skipna=True) in ("integer", "floating", "mixed-integer-float", "decimal"):
+            return pd.to_numeric(values, errors="coerce")
+        return pd.to_numeric(values.astype(str).str.strip(), errors="coerce")
+
+    def _to_datetime(self, values, kind):
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        if pd.api.types.infer_dtype(values, skipna=True) in ("datetime64", "datetime", "date"):
+            return pd.to_datetime(values, errors="coerce")
+        return pd.to_datetime(values.astype(str).str.strip(), format=self.DATE_FORMATS[kind], errors="coerce")
+
+    def _integer_column_type(self, numbers):
+        if not (numbers % 1 == 0).all():
+            return None
+
+        min_value, max_value = numbers.min(), numbers.max()
+        if self.INT_RANGE[0] <= min_value and max_value <= self.INT_RANGE[1]:
             return "INT"
-        elif np.issubdtype(dtype, np.floating):
-            return "FLOAT"
-        elif np.issubdtype(dtype, np.bool_):
-            return "TINYINT(1)"
-        elif np.issubdtype(dtype, np.datetime64):
-            if col_str.str.fullmatch(type_patterns['DATE']).all():
-                return "DATE"
-            elif col_str.str.fullmatch(type_patterns['DATETIME']).all():
-                return "DATETIME"
-            return "VARCHAR(255)"
-        
-        if col_data_clean.apply(self._is_numeric_type).all():
-            if col_data_clean.apply(self._is_integer).all():
-                return "INT"
-            return "FLOAT"
-        
-        for pattern_name, pattern in type_patterns.items():
-            if col_str.str.fullmatch(pattern).all():
-                if pattern_name == 'BOOLEAN':
-                    return "TINYINT(1)"
-                return pattern_name
-        
-        max_length = col_str.str.len().max()
-        return "VARCHAR(255)" if max_length is not None and max_length <= 255 else "TEXT"
-
-    def _is_numeric_type(self, val):
-        return self._is_integer(val) or self._is_float(val)
-
-    def _is_integer(self, val):
-        if isinstance(val, int):
-            return True
-        if isinstance(val, float):
-            return False
-        if isinstance(val, str) and val.isdigit():
-            return True
-        try:
-            return float(val).is_integer()
-        except (ValueError, TypeError):
-            return False
-
-    def _is_float(self, val):
-        if isinstance(val, float):
-            return True
-        if isinstance(val, int):
-            return False
-        if isinstance(val, str):
-            val = val.strip()
-            if val.count(".") == 1 and val.replace(".", "").isdigit():
-                return True
-        try:
-            float(val)
-            return True
-        except (ValueError, TypeError):
-            return False 
\ No newline at end of file
+        if self.BIGINT_RANGE[0] <= min_value and max_value <= self.BIGINT_RANGE[1]:
+            return "BIGINT"
+        return None
+
+    def _decimal_column_type(self, values, numbers):
+        if not np.isfinite(numbers.astype(float)).all():
+            return "DOUBLE"
+
+        digits = values.astype(str).str.strip().str.lstrip("+-")
+        if digits.str.contains(r"[eE]").any():
+            return "DOUBLE"
+
+        parts = digits.str.split(".", n=1, expand=True)
+        integer_digits = int(parts[0].str.lstrip("0").str.len().max())
+        scale = int(parts[1].fillna("").str.len().max()) if parts.shape[1] > 1 else 0
+        precision = max(integer_digits + scale, 1)
+
+        if precision > 65 or scale > 30:
+            return "DOUBLE"
+        return f"DECIMAL({precision},{scale})"
+
+    def _string_column_type(self, values):
+        return self._string_type_for_length(int(values.astype(str).str.len().max()))
+
+    def _string_type_for_length(self, max_length):
+        for size in self.VARCHAR_SIZES:
+            if max_length <= size:
+                return f"VARCHAR({size})"
+        return "TEXT" if max_length <= 65535 else "MEDIUMTEXT"
@@ -1,11 +1,12 @@
 from sqlalchemy import inspect
 
 class ForeignKeyValidator:
-    def __init__(self, db_engine):
+    def __init__(self, db_engine, schema_cache=None):
         self.db_engine = db_engine
+        self.schema_cache = schema_cache
 
     def validate_foreign_key(self, foreign_table, foreign_column):
-        inspector = inspect(self.db_engine)
+        inspector = self.schema_cache if self.schema_cache is not None else inspect(self.db_engine)
         
         if foreign_table not in inspector.get_table_names():
             return False, f"Referenced Table {foreign_table} Unexist"
@@ -1,19 +1,207 @@
-from vertexai.preview.generative_models import GenerativeModel
+import time
+import threading
+from types import SimpleNamespace
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-class GeminiChat:
+class ChatFlight:
     def __init__(self):
-        self.model = GenerativeModel("gemini-2.0-flash-lite-001")
-    
-    def get_response(self, user_message: str) -> str:
-        try:
-            prompt = f"""You are a MySQL database expert. 
+        self.chunks = []
+        self.done = False
+        self.error = None
+        self._condition = threading.Condition()
+
+    def append(self, text):
+        with self._condition:
+            self.chunks.append(text)
+            self._condition.notify_all()
+
+    def finish(self, error=None):
+        with self._condition:
+            self.error = error
+            self.done = True
+            self._condition.notify_all()
+
+    def follow(self, timeout):
+        index = 0
+        while True:
+            with self._condition:
+                while index >= len(self.chunks) and not self.done:
+                    if not self._condition.wait(timeout):
+                        raise TimeoutError("Chat Response Timed Out")
+                chunks = self.chunks[index:]
+                index = len(self.chunks)
+                finished = self.done
+
+            for text in chunks:
+                yield text
+
+            if finished and index >= len(self.chunks):
+                if self.error is not None:
+                    raise self.error
+                return
+
+class FakeChatModel:
+    def __init__(self, reply=None, chunk_size=16, delay=0.0):
+        self.reply = reply
+        self.chunk_size = chunk_size
+        self.delay = delay
+        self.calls = 0
+
+    def generate_content(self, prompt, stream=False):
+        self.calls += 1
+        text = self.reply or f"Echo: {prompt.rsplit('User question:', 1)[-1].strip()}"
+        if not stream:
+            time.sleep(self.delay)
+            return SimpleNamespace(text=text)
+        return self._stream(text)
+
+    def _stream(self, text):
+        for start in range(0, len(text), self.chunk_size):
+            time.sleep(self.delay)
+            yield SimpleNamespace(text=text[start:start + self.chunk_size])
+
+class GeminiChat:
+    MODEL_NAME = "gemini-2.0-flash-lite-001"
+
+    def __init__(self, model=None, max_concurrent=4, max_streams=16, cache_size=256, cache_ttl=3600, response_timeout=120):
+        self.model = model
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.response_timeout = response_timeout
+        self.active_streams = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self._cache = OrderedDict()
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        self._stream_slots = threading.BoundedSemaphore(max_streams)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="chat-model")
+
+    def _get_model(self):
+        if self.model is None:
+            with self._model_lock:
+                if self.model is None:
+                    from vertexai.preview.generative_models import GenerativeModel
+                    self.model = GenerativeModel(self.MODEL_NAME)
+        return self.model
+
+    def build_prompt(self, user_message):
+        return f"""You are a MySQL database expert.
             Provide clear and accurate answers to the user's questions.
             Your answers should be concise and relevant to the user's query.
             Include example queries whenever possible.
 
             User question: {user_message}"""
-            
-            response = self.model.generate_content(prompt)
-            return response.text
+
+    @staticmethod
+    def normalize_prompt(user_message):
+        return " ".join((user_message or "").split()).casefold()
+
+    def get_response(self, user_message: str) -> str:
+        chunks = []
+        for event, payload in self.stream_events(user_message):
+            if event == "error":
+                return payload["message"]
+            if event == "chunk":
+                chunks.append(payload["text"])
+        return "".join(chunks)
+
+    def stream_events(self, user_message):
+        if not self._stream_slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            yield "error", {"message": "Failed: Too Many Chat Requests"}
+            return
+
+        with self._lock:
+            self.active_streams += 1
+        try:
+            key = self.normalize_prompt(user_message)
+            if not key:
+                yield "error", {"message": "Failed: Empty Message"}
+                return
+
+            flight, source = self._join_flight(key, user_message)
+            yield "meta", {"source": source}
+            if source == "cache":
+                yield "chunk", {"text": flight}
+            else:
+                for text in flight.follow(self.response_timeout):
+                    yield "chunk", {"text": text}
+            yield "done", {}
         except Exception as e:
-            return f'Failed: {str(e)}' 
\ No newline at end of file
+            yield "error", {"message": f"Failed: {str(e)}"}
+        finally:
+            with self._lock:
+                self.active_streams -= 1
+            self._stream_slots.release()
+
+    def _join_flight(self, key, user_message):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry[1], "cache"
+            if entry:
+                del self._cache[key]
+
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                return flight, "shared"
+
+            flight = self._flights[key] = ChatFlight()
+            self.misses += 1
+
+        try:
+            self._executor.submit(self._generate, key, user_message, flight)
+        except RuntimeError as e:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.finish(e)
+        return flight, "model"
+
+    def _generate(self, key, user_message, flight):
+        error = None
+        try:
+            response = self._get_model().generate_content(self.build_prompt(user_message), stream=True)
+            for chunk in ([response] if hasattr(response, "text") else response):
+                text = getattr(chunk, "text", "")
+                if text:
+                    flight.append(text)
+        except Exception as e:
+            error = e
+
+        with self._lock:
+            if error is None:
+                self._cache[key] = (time.monotonic() + self.cache_ttl, "".join(flight.chunks))
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            self._flights.pop(key, None)
+        flight.finish(error)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "rejected": self.rejected,
+                "active_streams": self.active_streams,
+                "in_flight": len(self._flights),
+                "cache_entries": len(self._cache),
+            }
+
+    def collect_metrics(self):
+        stats = self.stats()
+        return [
+            ("chat_active_streams", "Chat responses currently streaming to clients.", (), stats["active_streams"]),
+            ("chat_in_flight_prompts", "Distinct prompts waiting on the model.", (), stats["in_flight"]),
+            ("chat_cache_entries", "Chat responses held in the response cache.", (), stats["cache_entries"]),
+        ]
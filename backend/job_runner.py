@@ -0,0 +1,225 @@
+import os
+import time
+import secrets
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+class JobCancelled(Exception):
+    pass
+
+class JobProgress:
+    def __init__(self):
+        self.rows_processed = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.statements_executed = 0
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def update(self, rows=0, bytes_read=0, bytes_written=0, statements=0):
+        with self._lock:
+            self.rows_processed += rows
+            self.bytes_read += bytes_read
+            self.bytes_written += bytes_written
+            self.statements_executed += statements
+        if self.cancel_event.is_set():
+            raise JobCancelled("Job Cancelled")
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "rows_processed": self.rows_processed,
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+                "statements_executed": self.statements_executed,
+            }
+
+class ProgressFile:
+    def __init__(self, raw, filename, progress):
+        self._raw = raw
+        self._high_water = 0
+        self.filename = filename
+        self.progress = progress
+
+    def read(self, size=-1):
+        return self._track(self._raw.read(size))
+
+    def read1(self, size=-1):
+        return self._track(self._raw.read1(size))
+
+    def readinto(self, buffer):
+        return self._track(self._raw.readinto(buffer))
+
+    def readline(self, size=-1):
+        return self._track(self._raw.readline(size))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def _track(self, data):
+        position = self._raw.tell()
+        if position > self._high_water:
+            self.progress.update(bytes_read=position - self._high_water)
+            self._high_water = position
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+class JobRunner:
+    FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+    def __init__(self, max_workers=4, max_jobs=200, ttl=3600):
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self.jobs = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job-runner")
+        self._lock = threading.Lock()
+
+    def submit(self, owner, kind, func, cleanup_paths=(), keep_failed_result=False):
+        with self._lock:
+            expired = self._pop_expired()
+            if len(self.jobs) >= self.max_jobs:
+                expired.extend(self._pop_oldest_finished(len(self.jobs) - self.max_jobs + 1))
+            if len(self.jobs) >= self.max_jobs:
+                self._remove_files(expired)
+                self._remove_paths(cleanup_paths)
+                return None, "Failed: Too Many Running Jobs"
+
+            job_id = secrets.token_urlsafe(16)
+            job = {
+                "job_id": job_id,
+                "owner": owner,
+                "kind": kind,
+                "status": "queued",
+                "message": None,
+                "progress": JobProgress(),
+                "result_path": None,
+                "download_name": None,
+                "mimetype": None,
+                "cleanup_paths": list(cleanup_paths),
+                "keep_failed_result": keep_failed_result,
+                "created_at": time.time(),
+                "finished_at": None,
+            }
+            self.jobs[job_id] = job
+
+        self._remove_files(expired)
+        self._executor.submit(self._run, job, func)
+        return job_id, f"Succeed: Queued {kind.title()} Job"
+
+    def get_status(self, job_id, owner):
+        job = self._get(job_id, owner)
+        if not job:
+            return None
+        return {
+            "job_id": job["job_id"],
+            "kind": job["kind"],
+            "status": job["status"],
+            "message": job["message"],
+            "progress": job["progress"].to_dict(),
+            "has_result": job["result_path"] is not None,
+            "created_at": job["created_at"],
+            "finished_at": job["finished_at"],
+        }
+
+    def cancel(self, job_id, owner):
+        job = self._get(job_id, owner)
+        if not job or job["status"] in self.FINISHED_STATUSES:
+            return False
+        job["progress"].cancel_event.set()
+        return True
+
+    def get_result(self, job_id, owner):
+        job = self._get(job_id, owner)
+        if not job or job["status"] not in ("succeeded", "failed") or not job["result_path"]:
+            return None
+        return job["result_path"], job["download_name"], job["mimetype"]
+
+    def new_result_path(self, suffix=""):
+        fd, path = tempfile.mkstemp(prefix="ezdb-job-", suffix=suffix)
+        os.close(fd)
+        return path
+
+    def save_upload(self, file):
+        path = self.new_result_path(os.path.splitext(file.filename or "")[1])
+        file.save(path)
+        return path
+
+    def _get(self, job_id, owner):
+        with self._lock:
+            expired = self._pop_expired()
+            job = self.jobs.get(job_id)
+        self._remove_files(expired)
+        if not job or job["owner"] != owner:
+            return None
+        return job
+
+    def _run(self, job, func):
+        progress = job["progress"]
+        if progress.cancel_event.is_set():
+            self._finish(job, "cancelled", "Failed: Job Cancelled")
+            return
+
+        job["status"] = "running"
+        result = None
+        try:
+            message, result = func(progress)
+            if progress.cancel_event.is_set():
+                self._finish(job, "cancelled", "Failed: Job Cancelled")
+            elif "Succeed" in message:
+                if result:
+                    job["result_path"], job["download_name"], job["mimetype"] = result
+                self._finish(job, "succeeded", message)
+            else:
+                if result and job["keep_failed_result"]:
+                    job["result_path"], job["download_name"], job["mimetype"] = result
+                self._finish(job, "failed", message)
+        except JobCancelled:
+            self._finish(job, "cancelled", "Failed: Job Cancelled")
+        except Exception as e:
+            self._finish(job, "failed", f"Failed: {str(e)}")
+        finally:
+            self._remove_paths(job["cleanup_paths"])
+            if result and job["result_path"] != result[0]:
+                self._remove_paths([result[0]])
+
+    def _finish(self, job, status, message):
+        job["message"] = message
+        job["finished_at"] = time.time()
+        job["status"] = status
+
+    def _pop_expired(self):
+        deadline = time.time() - self.ttl
+        expired_ids = [
+            job_id for job_id, job in self.jobs.items()
+            if job["finished_at"] is not None and job["finished_at"] < deadline
+        ]
+        return [self.jobs.pop(job_id) for job_id in expired_ids]
+
+    def _pop_oldest_finished(self, count):
+        finished_ids = [
+            job_id for job_id, job in self.jobs.items()
+            if job["status"] in self.FINISHED_STATUSES
+        ][:count]
+        return [self.jobs.pop(job_id) for job_id in finished_ids]
+
+    def _remove_files(self, jobs):
+        for job in jobs:
+            if job["result_path"]:
+                self._remove_paths([job["result_path"]])
+
+    def _remove_paths(self, paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
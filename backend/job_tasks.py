@@ -0,0 +1,46 @@
+import os
+from .job_runner import ProgressFile
+from .sql_script_service import SQLScriptService
+
+class JobTasks:
+    def __init__(self, job_runner):
+        self.job_runner = job_runner
+
+    def submit_import(self, owner, db_engine, upload_path, filename, fields):
+        from .file_service import FileService
+
+        def run_import(progress):
+            file_service = FileService(db_engine, progress)
+            with open(upload_path, "rb") as raw:
+                message, _ = file_service.import_excel_to_table(
+                    fields["table_name"], ProgressFile(raw, filename, progress), fields["batch_size"],
+                    fields["commit_per_batch"], fields["sheet_name"], fields["all_sheets"]
+                )
+            return message, None
+
+        return self.job_runner.submit(owner, "import", run_import, [upload_path])
+
+    def submit_export(self, owner, db_engine, table_name, file_format):
+        from .file_service import FileService
+        extension, mimetype = FileService.EXPORT_FORMATS[file_format]
+
+        def run_export(progress):
+            file_service = FileService(db_engine, progress)
+            result_path = self.job_runner.new_result_path(f".{extension}")
+            message = file_service.export_table_to_file(table_name, file_format, result_path)
+            return message, (result_path, f"{table_name}.{extension}", mimetype)
+
+        return self.job_runner.submit(owner, "export", run_export)
+
+    def submit_script(self, owner, db_engine, upload_path, filename, fields):
+        def run_script(progress):
+            sql_script_service = SQLScriptService(db_engine, progress)
+            report_path = self.job_runner.new_result_path(".ndjson")
+            with open(upload_path, "rb") as raw:
+                message = sql_script_service.execute_script(
+                    ProgressFile(raw, filename, progress), report_path,
+                    fields["batch_size"], fields["continue_on_error"]
+                )
+            return message, (report_path, f"{os.path.splitext(filename)[0]}.report.ndjson", "application/x-ndjson")
+
+        return self.job_runner.submit(owner, "script", run_script, [upload_path], keep_failed_result=True)
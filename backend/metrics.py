@@ -0,0 +1,168 @@
+import time
+import bisect
+import inspect
+import threading
+from functools import wraps
+
+class MetricsRegistry:
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    ROW_BUCKETS = (0, 1, 10, 100, 1000, 10000, 100000, 1000000)
+    BYTE_BUCKETS = (256, 1024, 8192, 65536, 524288, 4194304, 33554432, 268435456)
+    HISTOGRAMS = {
+        "operation_duration_seconds": ("Latency of backend operations.", LATENCY_BUCKETS),
+        "operation_rows": ("Rows returned or written by backend operations.", ROW_BUCKETS),
+        "operation_payload_bytes": ("Bytes produced by backend operations.", BYTE_BUCKETS),
+        "http_request_duration_seconds": ("Latency of HTTP requests.", LATENCY_BUCKETS),
+        "http_response_bytes": ("Size of HTTP response bodies.", BYTE_BUCKETS),
+    }
+    COUNTERS = {
+        "operation_errors_total": "Backend operations that returned or raised a failure.",
+        "http_requests_total": "HTTP requests by endpoint, method and status.",
+    }
+
+    def __init__(self, prefix="ezdb"):
+        self.prefix = prefix
+        self._histograms = {name: {} for name in self.HISTOGRAMS}
+        self._counters = {name: {} for name in self.COUNTERS}
+        self._gauge_collectors = []
+        self._lock = threading.Lock()
+
+    def instrument(self, operation):
+        def decorator(f):
+            if inspect.iscoroutinefunction(f):
+                @wraps(f)
+                async def async_wrapper(instance, *args, **kwargs):
+                    start = time.perf_counter()
+                    try:
+                        result = await f(instance, *args, **kwargs)
+                    except Exception:
+                        self.observe_operation(operation, time.perf_counter() - start, error=True)
+                        raise
+                    self._observe_result(operation, start, instance, result)
+                    return result
+                return async_wrapper
+
+            @wraps(f)
+            def wrapper(instance, *args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    result = f(instance, *args, **kwargs)
+                except Exception:
+                    self.observe_operation(operation, time.perf_counter() - start, error=True)
+                    raise
+                self._observe_result(operation, start, instance, result)
+                return result
+            return wrapper
+        return decorator
+
+    def _observe_result(self, operation, start, instance, result):
+        self.observe_operation(
+            operation, time.perf_counter() - start,
+            rows=self._count_rows(instance, result), error=self._is_failure(result)
+        )
+
+    def observe_operation(self, operation, seconds, rows=None, payload_bytes=None, error=False):
+        labels = (("operation", operation),)
+        with self._lock:
+            self._observe("operation_duration_seconds", labels, seconds)
+            if rows is not None:
+                self._observe("operation_rows", labels, rows)
+            if payload_bytes is not None:
+                self._observe("operation_payload_bytes", labels, payload_bytes)
+            if error:
+                self._increment("operation_errors_total", labels)
+
+    def observe_request(self, endpoint, method, status, seconds, payload_bytes=None):
+        labels = (("endpoint", endpoint), ("method", method))
+        with self._lock:
+            self._observe("http_request_duration_seconds", labels, seconds)
+            if payload_bytes is not None:
+                self._observe("http_response_bytes", labels, payload_bytes)
+            self._increment("http_requests_total", labels + (("status", str(status)),))
+
+    def add_gauge_collector(self, collector):
+        self._gauge_collectors.append(collector)
+
+    def render(self):
+        with self._lock:
+            histograms = {
+                name: {labels: (list(series[0]), series[1], series[2]) for labels, series in values.items()}
+                for name, values in self._histograms.items()
+            }
+            counters = {name: dict(values) for name, values in self._counters.items()}
+
+        lines = []
+        for name, (help_text, buckets) in self.HISTOGRAMS.items():
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            for labels, (bucket_counts, total, count) in sorted(histograms[name].items()):
+                cumulative = 0
+                for bound, bucket_count in zip(buckets + (float("inf"),), bucket_counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    lines.append(f"{metric}_bucket{self._format_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{metric}_sum{self._format_labels(labels)} {total}")
+                lines.append(f"{metric}_count{self._format_labels(labels)} {count}")
+
+        for name, help_text in self.COUNTERS.items():
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for labels, value in sorted(counters[name].items()):
+                lines.append(f"{metric}{self._format_labels(labels)} {value}")
+
+        gauges = {}
+        for collector in self._gauge_collectors:
+            try:
+                for name, help_text, labels, value in collector():
+                    gauges.setdefault(name, (help_text, []))[1].append((labels, value))
+            except Exception:
+                continue
+        for name, (help_text, samples) in gauges.items():
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+            for labels, value in samples:
+                lines.append(f"{metric}{self._format_labels(tuple(labels))} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def _observe(self, name, labels, value):
+        series = self._histograms[name].get(labels)
+        if series is None:
+            series = self._histograms[name][labels] = [[0] * (len(self.HISTOGRAMS[name][1]) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.HISTOGRAMS[name][1], value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def _increment(self, name, labels):
+        self._counters[name][labels] = self._counters[name].get(labels, 0) + 1
+
+    @staticmethod
+    def _format_labels(labels):
+        if not labels:
+            return ""
+        pairs = ",".join(f'{key}="{MetricsRegistry._escape_label(value)}"' for key, value in labels)
+        return "{" + pairs + "}"
+
+    @staticmethod
+    def _escape_label(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @staticmethod
+    def _is_failure(result):
+        message = next((item for item in result if isinstance(item, str)), None) if isinstance(result, tuple) else result
+        return isinstance(message, str) and message.startswith("Failed")
+
+    @staticmethod
+    def _count_rows(instance, result):
+        if isinstance(result, tuple) and len(result) >= 3 and isinstance(result[2], list):
+            return len(result[2])
+        for attribute in ("rows_inserted", "rows_updated", "row_count"):
+            value = getattr(instance, attribute, None)
+            if isinstance(value, int):
+                return value
+        return None
+
+metrics = MetricsRegistry()
@@ -0,0 +1,72 @@
+import time
+from sqlalchemy import text
+from ..metrics import metrics
+
+class BulkInsertDataQuery:
+    def __init__(self, db_engine, table_name, column_names, batches, commit_per_batch=False, before_batch=None):
+        self.db_engine = db_engine
+        self.table_name = table_name
+        self.column_names = column_names
+        self.batches = batches
+        self.commit_per_batch = commit_per_batch
+        self.before_batch = before_batch
+        self.rows_inserted = 0
+        self.elapsed_seconds = 0.0
+
+    @metrics.instrument("bulk_insert")
+    def execute(self):
+        columns_str = ", ".join(self.column_names)
+        binds_str = ", ".join(f":p{i}" for i in range(len(self.column_names)))
+        query = f"INSERT INTO {self.table_name} ({columns_str}) VALUES ({binds_str})"
+        statement = text(query)
+        start_time = time.perf_counter()
+
+        try:
+            with self.db_engine.connect() as c:
+                if self.commit_per_batch:
+                    for batch in self.batches:
+                        with c.begin():
+                            self._insert_batch(c, statement, batch)
+                else:
+                    with c.begin():
+                        for batch in self.batches:
+                            self._insert_batch(c, statement, batch)
+
+            self.elapsed_seconds = time.perf_counter() - start_time
+            return f"Succeed: Inserted {self.rows_inserted} Row(s) in {self.elapsed_seconds:.2f}s ({self.rows_per_second():.0f} rows/s)", query
+        except Exception as e:
+            self.elapsed_seconds = time.perf_counter() - start_time
+            error_message = str(e)
+
+            if "(pymysql.err.OperationalError)" in error_message:
+                error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+
+            if "(pymysql.err.ProgrammingError)" in error_message:
+                error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
+
+            if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
+                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
+
+            if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
+                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
+
+            error_message = error_message.strip()
+            if self.commit_per_batch and self.rows_inserted:
+                return f"Failed: Uninserted Data after {self.rows_inserted} Committed Row(s) - {error_message}", None
+            return f"Failed: Uninserted Data - {error_message}", None
+
+    def _insert_batch(self, c, statement, batch):
+        if self.before_batch is not None:
+            self.before_batch(c)
+        params = [
+            {f"p{i}": value for i, value in enumerate(row)}
+            for row in batch
+        ]
+        if params:
+            c.execute(statement, params)
+        self.rows_inserted += len(params)
+
+    def rows_per_second(self):
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.rows_inserted / self.elapsed_seconds
@@ -0,0 +1,175 @@
+import time
+from sqlalchemy import text
+from ..metrics import metrics
+
+class BulkUpdateDataQuery:
+    DEFAULT_CHUNK_SIZE = 1000
+    MAX_CHUNK_SIZE = 10000
+    MAX_CHUNK_BYTES = 1024 * 1024
+
+    def __init__(self, db_engine, table_name, key_column, updates, chunk_size=None):
+        self.db_engine = db_engine
+        self.table_name = table_name
+        self.key_column = key_column
+        self.updates = updates
+        self.chunk_size = max(1, min(int(chunk_size), self.MAX_CHUNK_SIZE)) if chunk_size else self.DEFAULT_CHUNK_SIZE
+        self.rows_updated = 0
+        self.rows_submitted = 0
+        self.chunks = []
+        self.statements = []
+        self.chunk_index = 0
+        self.committing = False
+        self.elapsed_seconds = 0.0
+
+    @metrics.instrument("bulk_update")
+    def execute(self):
+        start_time = time.perf_counter()
+        try:
+            groups = self._group_updates()
+            with self.db_engine.connect() as c:
+                with c.begin():
+                    for query, params, row_count in self._iter_chunks(groups, c.dialect.name):
+                        self.chunk_index += 1
+                        chunk_start = time.perf_counter()
+                        output = c.execute(text(query), params)
+                        self._record_chunk(row_count, output.rowcount, chunk_start)
+                    self.committing = True
+
+            return self._success_message(start_time), self._describe()
+        except Exception as e:
+            return self._failure_message(start_time, e), None
+
+    @metrics.instrument("bulk_update")
+    async def execute_async(self):
+        start_time = time.perf_counter()
+        try:
+            groups = self._group_updates()
+            async with self.db_engine.connect() as c:
+                async with c.begin():
+                    for query, params, row_count in self._iter_chunks(groups, c.dialect.name):
+                        self.chunk_index += 1
+                        chunk_start = time.perf_counter()
+                        output = await c.execute(text(query), params)
+                        self._record_chunk(row_count, output.rowcount, chunk_start)
+                    self.committing = True
+
+            return self._success_message(start_time), self._describe()
+        except Exception as e:
+            return self._failure_message(start_time, e), None
+
+    def _group_updates(self):
+        collapsed = {}
+        for key, values in self.updates:
+            if not values:
+                raise ValueError(f"No Target Columns for Key {key}")
+            collapsed.setdefault(key, {}).update(values)
+        self.rows_submitted = len(collapsed)
+
+        groups = {}
+        for key, values in collapsed.items():
+            column_names = tuple(sorted(values))
+            groups.setdefault(column_names, []).append((key, tuple(values[column] for column in column_names)))
+        return list(groups.items())
+
+    def _iter_chunks(self, groups, dialect_name):
+        for column_names, rows in groups:
+            for chunk in self._split(rows):
+                if dialect_name == "mysql":
+                    query, params = self._build_join_query(column_names, chunk), self._join_params(chunk)
+                else:
+                    query, params = self._build_query(column_names), self._executemany_params(chunk)
+                if query not in self.statements:
+                    self.statements.append(query)
+                yield query, params, len(chunk)
+
+    def _split(self, rows):
+        chunk = []
+        chunk_bytes = 0
+        for key, values in rows:
+            row_bytes = sum(len(str(value)) + 16 for value in (key, *values))
+            if chunk and (len(chunk) >= self.chunk_size or chunk_bytes + row_bytes > self.MAX_CHUNK_BYTES):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+            chunk.append((key, values))
+            chunk_bytes += row_bytes
+        if chunk:
+            yield chunk
+
+    def _build_query(self, column_names):
+        target_data = ", ".join(f"{column} = :v{i}" for i, column in enumerate(column_names))
+        return f"UPDATE {self.table_name} SET {target_data} WHERE {self.key_column} = :k"
+
+    @staticmethod
+    def _executemany_params(chunk):
+        return [
+            {"k": key, **{f"v{i}": value for i, value in enumerate(values)}}
+            for key, values in chunk
+        ]
+
+    def _build_join_query(self, column_names, chunk):
+        selects = []
+        for row_index, (_, values) in enumerate(chunk):
+            if row_index == 0:
+                columns = [f":k{row_index} AS __key"] + [f":v{row_index}_{i} AS __v{i}" for i in range(len(values))]
+            else:
+                columns = [f":k{row_index}"] + [f":v{row_index}_{i}" for i in range(len(values))]
+            selects.append(f"SELECT {', '.join(columns)}")
+
+        target_data = ", ".join(f"__target.{column} = __batch.__v{i}" for i, column in enumerate(column_names))
+        return (
+            f"UPDATE {self.table_name} AS __target JOIN ({' UNION ALL '.join(selects)}) AS __batch "
+            f"ON __target.{self.key_column} = __batch.__key SET {target_data}"
+        )
+
+    @staticmethod
+    def _join_params(chunk):
+        params = {}
+        for row_index, (key, values) in enumerate(chunk):
+            params[f"k{row_index}"] = key
+            for i, value in enumerate(values):
+                params[f"v{row_index}_{i}"] = value
+        return params
+
+    def _record_chunk(self, row_count, rowcount, chunk_start):
+        affected_rows = rowcount if rowcount is not None and rowcount >= 0 else None
+        self.rows_updated += affected_rows or 0
+        self.chunks.append({
+            "rows": row_count,
+            "affected_rows": affected_rows,
+            "elapsed_ms": round((time.perf_counter() - chunk_start) * 1000, 2),
+        })
+
+    def _describe(self):
+        return ";\n".join(self.statements)
+
+    def _success_message(self, start_time):
+        self.elapsed_seconds = time.perf_counter() - start_time
+        return (
+            f"Succeed: Updated {self.rows_updated} Row(s) from {self.rows_submitted} Key(s) "
+            f"in {len(self.chunks)} Chunk(s) in {self.elapsed_seconds:.2f}s"
+        )
+
+    def _failure_message(self, start_time, e):
+        self.elapsed_seconds = time.perf_counter() - start_time
+        self.rows_updated = 0
+        error_message = str(e)
+
+        if "(pymysql.err.OperationalError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+
+        if "(pymysql.err.ProgrammingError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
+
+        if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
+
+        if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
+
+        error_message = error_message.strip()
+        if self.committing:
+            return f"Failed: Data Unupdated at Commit - {error_message}"
+        if self.chunk_index:
+            return f"Failed: Data Unupdated at Chunk {self.chunk_index} - {error_message}"
+        return f"Failed: Data Unupdated - {error_message}"
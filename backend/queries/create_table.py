@@ -1,4 +1,5 @@
 from sqlalchemy import text
+from ..metrics import metrics
 
 class CreateTableQuery:
     def __init__(self, db_engine, table_name, columns, foreign_keys):
@@ -7,37 +8,54 @@ class CreateTableQuery:
         self.columns = columns
         self.foreign_keys = foreign_keys
 
+    @metrics.instrument("create")
     def execute(self):
         try:
+            query = self._build_query()
             with self.__db_engine.connect() as c:
-                column_defs = []
-                for name, type, constraints in self.columns:
-                    if name and type:
-                        if constraints:
-                            constraints_str = " ".join(constraints)
-                        else:
-                            constraints_str = ""
-                        column_defs.append(f"{name} {type} {constraints_str}")
-                
-                column_defs.extend(self.foreign_keys)
-                
-                query = f"CREATE TABLE {self.table_name} ({', '.join(column_defs)});"
                 c.execute(text(query))
             return "Succeed: Created Table", query
         except Exception as e:
-            error_message = str(e)
+            return f"Failed: Uncreated Table - {self._error_message(e)}", None
 
-            if "(pymysql.err.OperationalError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+    @metrics.instrument("create")
+    async def execute_async(self):
+        try:
+            query = self._build_query()
+            async with self.__db_engine.connect() as c:
+                await c.execute(text(query))
+            return "Succeed: Created Table", query
+        except Exception as e:
+            return f"Failed: Uncreated Table - {self._error_message(e)}", None
+
+    def _build_query(self):
+        column_defs = []
+        for name, type, constraints in self.columns:
+            if name and type:
+                if constraints:
+                    constraints_str = " ".join(constraints)
+                else:
+                    constraints_str = ""
+                column_defs.append(f"{name} {type} {constraints_str}")
+
+        column_defs.extend(self.foreign_keys)
+
+        return f"CREATE TABLE {self.table_name} ({', '.join(column_defs)});"
+
+    @staticmethod
+    def _error_message(e):
+        error_message = str(e)
+
+        if "(pymysql.err.OperationalError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+
+        if "(pymysql.err.ProgrammingError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
 
-            if "(pymysql.err.ProgrammingError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
-                
-            error_message = error_message.strip()
-            return f"Failed: Uncreated Table - {error_message}", None
\ No newline at end of file
+        return error_message.strip()
@@ -1,4 +1,5 @@
 from sqlalchemy import text
+from ..metrics import metrics
 
 class DeleteDataQuery:
     def __init__(self, db_engine, table_name, conditions):
@@ -6,33 +7,57 @@ class DeleteDataQuery:
         self.table_name = table_name
         self.conditions = conditions
 
+    @metrics.instrument("delete")
     def execute(self):
         try:
+            query = self._build_query()
             with self.db_engine.connect() as c:
                 with c.begin():
-                    condition_str = " ".join(self.conditions)
-                    query = f"DELETE FROM {self.table_name} WHERE {condition_str}"
                     output = c.execute(text(query))
                     rows_deleted = output.rowcount
 
-                if rows_deleted > 0:
-                    return f"Succeed: Deleted {rows_deleted} Row(s)", query
-                else:
-                    return "Warning: Unmatching Data to Delete.", query
+            return self._result_message(rows_deleted), query
         except Exception as e:
-            error_message = str(e)
+            return f"Failed: Data Not Deleted - {self._error_message(e)}", None
 
-            if "(pymysql.err.OperationalError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+    @metrics.instrument("delete")
+    async def execute_async(self):
+        try:
+            query = self._build_query()
+            async with self.db_engine.connect() as c:
+                async with c.begin():
+                    output = await c.execute(text(query))
+                    rows_deleted = output.rowcount
+
+            return self._result_message(rows_deleted), query
+        except Exception as e:
+            return f"Failed: Data Not Deleted - {self._error_message(e)}", None
+
+    def _build_query(self):
+        condition_str = " ".join(self.conditions)
+        return f"DELETE FROM {self.table_name} WHERE {condition_str}"
+
+    @staticmethod
+    def _result_message(rows_deleted):
+        if rows_deleted > 0:
+            return f"Succeed: Deleted {rows_deleted} Row(s)"
+        else:
+            return "Warning: Unmatching Data to Delete."
+
+    @staticmethod
+    def _error_message(e):
+        error_message = str(e)
+
+        if "(pymysql.err.OperationalError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.OperationalError)", "")
 
-            if "(pymysql.err.ProgrammingError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
+        if "(pymysql.err.ProgrammingError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
 
-            error_message = error_message.strip()
-            return f"Failed: Data Not Deleted - {error_message}", None
\ No newline at end of file
+        return error_message.strip()
@@ -1,7 +1,8 @@
 from sqlalchemy import text
+from ..metrics import metrics
 
 class JoinTableQuery:
-    def __init__(self, db_engine, table_name, join_types, join_tables, join_conditions, select_columns, where_conditions):
+    def __init__(self, db_engine, table_name, join_types, join_tables, join_conditions, select_columns, where_conditions, result_cache=None):
         self.db_engine = db_engine
         self.table_name = table_name
         self.join_types = join_types
@@ -9,33 +10,71 @@ class JoinTableQuery:
         self.join_conditions = join_conditions
         self.select_columns = select_columns
         self.where_conditions = where_conditions
+        self.result_cache = result_cache
+        self.served_from_cache = False
 
+    @metrics.instrument("join")
     def execute(self):
         try:
-            with self.db_engine.connect() as c:
-                query = f"SELECT {', '.join(self.select_columns)} FROM {self.table_name}"
-                for join_type, join_table, join_condition in zip(self.join_types, self.join_tables, self.join_conditions):
-                    query += f" {join_type} JOIN {join_table} ON {join_condition}"
-                if self.where_conditions:
-                    query += f" WHERE {' AND '.join(self.where_conditions)}"
-                output = c.execute(text(query))
-                rows = output.fetchall()
-                column_names = list(output.keys())
+            query = self._build_query()
+
+            if self.result_cache is not None:
+                (rows, column_names), self.served_from_cache = self.result_cache.get_or_load(
+                    query, [self.table_name, *self.join_tables], lambda: self._fetch(query)
+                )
+            else:
+                rows, column_names = self._fetch(query)
+            return "Succeed: Join Table", query, rows, column_names
+        except Exception as e:
+            return f"Failed: Unjoin Table - {self._error_message(e)}", query, [], []
+
+    @metrics.instrument("join")
+    async def execute_async(self):
+        try:
+            query = self._build_query()
+
+            if self.result_cache is not None:
+                (rows, column_names), self.served_from_cache = await self.result_cache.get_or_load_async(
+                    query, [self.table_name, *self.join_tables], lambda: self._fetch_async(query)
+                )
+            else:
+                rows, column_names = await self._fetch_async(query)
             return "Succeed: Join Table", query, rows, column_names
         except Exception as e:
-            error_message = str(e)
+            return f"Failed: Unjoin Table - {self._error_message(e)}", query, [], []
+
+    def _build_query(self):
+        query = f"SELECT {', '.join(self.select_columns)} FROM {self.table_name}"
+        for join_type, join_table, join_condition in zip(self.join_types, self.join_tables, self.join_conditions):
+            query += f" {join_type} JOIN {join_table} ON {join_condition}"
+        if self.where_conditions:
+            query += f" WHERE {' AND '.join(self.where_conditions)}"
+        return query
+
+    def _fetch(self, query):
+        with self.db_engine.connect() as c:
+            output = c.execute(text(query))
+            return [tuple(row) for row in output.fetchall()], list(output.keys())
+
+    async def _fetch_async(self, query):
+        async with self.db_engine.connect() as c:
+            output = await c.execute(text(query))
+            return [tuple(row) for row in output.fetchall()], list(output.keys())
+
+    @staticmethod
+    def _error_message(e):
+        error_message = str(e)
+
+        if "(pymysql.err.OperationalError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.OperationalError)", "")
 
-            if "(pymysql.err.OperationalError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+        if "(pymysql.err.ProgrammingError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
 
-            if "(pymysql.err.ProgrammingError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
-                
-            error_message = error_message.strip()
-            return f"Failed: Unjoin Table - {error_message}", query, [], []
\ No newline at end of file
+        return error_message.strip()
@@ -1,4 +1,5 @@
 from sqlalchemy import text
+from ..metrics import metrics
 
 class ModifyTableQuery:
     def __init__(self, db_engine, table_name, command, column_name, column_type, column_new_name):
@@ -9,36 +10,57 @@ class ModifyTableQuery:
         self.column_type = column_type
         self.column_new_name = column_new_name
 
+    @metrics.instrument("modify")
     def execute(self):
         try:
+            query = self._build_query()
+            if query is None:
+                return f"Failed: Wrong Command", None
             with self.db_engine.connect() as c:
-                if self.command == "ADD":
-                    query = f"ALTER TABLE {self.table_name} ADD COLUMN {self.column_name} {self.column_type}"
-                elif self.command == "DROP":
-                    query = f"ALTER TABLE {self.table_name} DROP COLUMN {self.column_name}"
-                elif self.command == "MODIFY":
-                    query = f"ALTER TABLE {self.table_name} MODIFY COLUMN {self.column_name} {self.column_type}"
-                elif self.command == "RENAME":
-                    query = f"ALTER TABLE {self.table_name} RENAME COLUMN {self.column_name} TO {self.column_new_name}"
-                else:
-                    return f"Failed: Wrong Command", None
                 c.execute(text(query))
 
             return "Succeed: Modified Table", query
         except Exception as e:
-            error_message = str(e)
+            return f"Failed: Unmodified Table - {self._error_message(e)}", None
 
-            if "(pymysql.err.OperationalError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+    @metrics.instrument("modify")
+    async def execute_async(self):
+        try:
+            query = self._build_query()
+            if query is None:
+                return f"Failed: Wrong Command", None
+            async with self.db_engine.connect() as c:
+                await c.execute(text(query))
+
+            return "Succeed: Modified Table", query
+        except Exception as e:
+            return f"Failed: Unmodified Table - {self._error_message(e)}", None
+
+    def _build_query(self):
+        if self.command == "ADD":
+            return f"ALTER TABLE {self.table_name} ADD COLUMN {self.column_name} {self.column_type}"
+        elif self.command == "DROP":
+            return f"ALTER TABLE {self.table_name} DROP COLUMN {self.column_name}"
+        elif self.command == "MODIFY":
+            return f"ALTER TABLE {self.table_name} MODIFY COLUMN {self.column_name} {self.column_type}"
+        elif self.command == "RENAME":
+            return f"ALTER TABLE {self.table_name} RENAME COLUMN {self.column_name} TO {self.column_new_name}"
+        return None
+
+    @staticmethod
+    def _error_message(e):
+        error_message = str(e)
+
+        if "(pymysql.err.OperationalError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+
+        if "(pymysql.err.ProgrammingError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
 
-            if "(pymysql.err.ProgrammingError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
-                
-            error_message = error_message.strip()
-            return f"Failed: Unmodified Table - {error_message}", None
\ No newline at end of file
+        return error_message.strip()
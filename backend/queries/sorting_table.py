@@ -1,40 +1,208 @@
-from sqlalchemy import text
+import asyncio
+from sqlalchemy import inspect, text
+from ..metrics import metrics
+from ..cursor_codec import CursorCodec
 
 class SortingTableQuery:
-    def __init__(self, db_engine, table_name, order_columns, order_sortings, select_columns):
+    MAX_PAGE_SIZE = 5000
+    SEEK_ALIAS = "__seek_"
+
+    def __init__(self, db_engine, table_name, order_columns, order_sortings, select_columns, result_cache=None,
+                 page_size=None, cursor=None, schema_cache=None):
         self.db_engine = db_engine
         self.table_name = table_name
         self.order_columns = order_columns
         self.order_sortings = order_sortings
         self.select_columns = select_columns
+        self.result_cache = result_cache
+        self.page_size = max(1, min(int(page_size), self.MAX_PAGE_SIZE)) if page_size else None
+        self.cursor = cursor
+        self.schema_cache = schema_cache
+        self.served_from_cache = False
+        self.next_cursor = None
+        self.approximate_total = None
 
+    @metrics.instrument("sort")
     def execute(self):
         try:
-            with self.db_engine.connect() as c:
-                query = f"SELECT {', '.join(self.select_columns)} FROM {self.table_name}"
-                orders = []
-                for col, sor in zip(self.order_columns, self.order_sortings):
-                    order = f"{col} {sor}"
-                    orders.append(order)
-                query += f" ORDER BY {', '.join(orders)}"
-                output = c.execute(text(query))
-                rows = output.fetchall()
-                column_names = list(output.keys())
+            query = f"SELECT {', '.join(self.select_columns)} FROM {self.table_name}"
+            query, params, seek_keys = self._build_query(self._primary_keys() if self.page_size else None)
+
+            if self.result_cache is not None:
+                (rows, column_names, next_state), self.served_from_cache = self.result_cache.get_or_load(
+                    query, [self.table_name], lambda: self._fetch(query, params, seek_keys), params
+                )
+            else:
+                rows, column_names, next_state = self._fetch(query, params, seek_keys)
+
+            if self.page_size:
+                self.next_cursor = CursorCodec.encode(next_state) if next_state else None
+                if not self.cursor:
+                    self.approximate_total = self._approximate_total()
             return "Succeed: Sorted Table", query, rows, column_names
         except Exception as e:
-            error_message = str(e)
+            return f"Failed: Unsorted Table - {self._error_message(e)}", query, [], []
+
+    @metrics.instrument("sort")
+    async def execute_async(self):
+        try:
+            query = f"SELECT {', '.join(self.select_columns)} FROM {self.table_name}"
+            query, params, seek_keys = self._build_query(await self._primary_keys_async() if self.page_size else None)
+
+            if self.result_cache is not None:
+                (rows, column_names, next_state), self.served_from_cache = await self.result_cache.get_or_load_async(
+                    query, [self.table_name], lambda: self._fetch_async(query, params, seek_keys), params
+                )
+            else:
+                rows, column_names, next_state = await self._fetch_async(query, params, seek_keys)
+
+            if self.page_size:
+                self.next_cursor = CursorCodec.encode(next_state) if next_state else None
+                if not self.cursor:
+                    async with self.db_engine.connect() as c:
+                        self.approximate_total = await c.run_sync(self._read_approximate_total)
+            return "Succeed: Sorted Table", query, rows, column_names
+        except Exception as e:
+            return f"Failed: Unsorted Table - {self._error_message(e)}", query, [], []
+
+    def _build_query(self, primary_keys):
+        orders = []
+        for col, sor in zip(self.order_columns, self.order_sortings):
+            order = f"{col} {sor}"
+            orders.append(order)
+
+        if self.page_size:
+            return self._build_page_query(orders, primary_keys)
+        query = f"SELECT {', '.join(self.select_columns)} FROM {self.table_name} ORDER BY {', '.join(orders)}"
+        return query, {}, []
+
+    def _primary_keys(self):
+        inspector = self.schema_cache if self.schema_cache is not None else inspect(self.db_engine)
+        return inspector.get_pk_constraint(self.table_name).get("constrained_columns", [])
+
+    async def _primary_keys_async(self):
+        if self.schema_cache is not None:
+            return await asyncio.to_thread(self._primary_keys)
+        async with self.db_engine.connect() as c:
+            return await c.run_sync(
+                lambda sync_connection: inspect(sync_connection).get_pk_constraint(self.table_name).get("constrained_columns", [])
+            )
+
+    def _build_page_query(self, orders, primary_keys):
+        state = CursorCodec.decode(self.cursor)
+        params = {"limit": self.page_size + 1}
+
+        if not primary_keys:
+            offset = int(state.get("offset", 0))
+            params["offset"] = offset
+            query = (
+                f"SELECT {', '.join(self.select_columns)} FROM {self.table_name} "
+                f"ORDER BY {', '.join(orders)} LIMIT :limit OFFSET :offset"
+            )
+            return query, params, []
+
+        seek_keys = [
+            (column, str(sorting).strip().upper() == "DESC")
+            for column, sorting in zip(self.order_columns, self.order_sortings)
+        ]
+        seek_keys += [(key, False) for key in primary_keys if key not in self.order_columns]
+        seek_columns = ", ".join(f"{column} AS {self.SEEK_ALIAS}{i}" for i, (column, _) in enumerate(seek_keys))
+        query = f"SELECT {', '.join(self.select_columns)}, {seek_columns} FROM {self.table_name}"
+
+        last_key = state.get("key")
+        if last_key is not None:
+            if len(last_key) != len(seek_keys):
+                raise ValueError("Invalid Cursor")
+            query += f" WHERE {self._seek_condition(seek_keys, last_key, params)}"
+
+        tie_breakers = [f"{column} ASC" for column, _ in seek_keys[len(self.order_columns):]]
+        query += f" ORDER BY {', '.join(orders + tie_breakers)} LIMIT :limit"
+        return query, params, seek_keys
+
+    def _seek_condition(self, seek_keys, last_key, params):
+        branches = []
+        equals = []
+        for i, ((column, descending), value) in enumerate(zip(seek_keys, last_key)):
+            params[f"seek_{i}"] = value
+            if value is None:
+                after = None if descending else f"{column} IS NOT NULL"
+                equal = f"{column} IS NULL"
+            else:
+                after = f"({column} < :seek_{i} OR {column} IS NULL)" if descending else f"{column} > :seek_{i}"
+                equal = f"{column} = :seek_{i}"
+            if after:
+                branches.append("(" + " AND ".join(equals + [after]) + ")")
+            equals.append(equal)
+        return " OR ".join(branches) if branches else "1 = 0"
+
+    def _fetch(self, query, params=None, seek_keys=None):
+        with self.db_engine.connect() as c:
+            output = c.execute(text(query), params or {})
+            rows = output.fetchall()
+            column_names = list(output.keys())
+        return self._page_rows(rows, column_names, params, seek_keys)
+
+    async def _fetch_async(self, query, params=None, seek_keys=None):
+        async with self.db_engine.connect() as c:
+            output = await c.execute(text(query), params or {})
+            rows = output.fetchall()
+            column_names = list(output.keys())
+        return self._page_rows(rows, column_names, params, seek_keys)
+
+    def _page_rows(self, rows, column_names, params, seek_keys):
+        if not self.page_size:
+            return [tuple(row) for row in rows], column_names, None
+
+        next_state = None
+        if len(rows) > self.page_size:
+            rows = rows[:self.page_size]
+            if seek_keys:
+                next_state = {"key": list(rows[-1][-len(seek_keys):])}
+            else:
+                next_state = {"offset": params["offset"] + self.page_size}
+
+        if seek_keys:
+            return [tuple(row[:-len(seek_keys)]) for row in rows], column_names[:-len(seek_keys)], next_state
+        return [tuple(row) for row in rows], column_names, next_state
+
+    def _approximate_total(self):
+        with self.db_engine.connect() as c:
+            return self._read_approximate_total(c)
+
+    def _read_approximate_total(self, c):
+        if c.dialect.name == "mysql":
+            total = c.execute(text(
+                "SELECT TABLE_ROWS FROM INFORMATION_SCHEMA.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+            ), {"table_name": self.table_name}).scalar()
+            return int(total) if total is not None else None
+
+        if c.dialect.name == "sqlite":
+            has_stats = c.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            )).scalar()
+            if has_stats:
+                stat = c.execute(text(
+                    "SELECT stat FROM sqlite_stat1 WHERE tbl = :table_name LIMIT 1"
+                ), {"table_name": self.table_name}).scalar()
+                if stat:
+                    return int(stat.split()[0])
+        return None
+
+    @staticmethod
+    def _error_message(e):
+        error_message = str(e)
+
+        if "(pymysql.err.OperationalError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.OperationalError)", "")
 
-            if "(pymysql.err.OperationalError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+        if "(pymysql.err.ProgrammingError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
 
-            if "(pymysql.err.ProgrammingError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
-                
-            error_message = error_message.strip()
-            return f"Failed: Unsorted Table - {error_message}", query, [], []
+        return error_message.strip()
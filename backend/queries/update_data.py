@@ -1,4 +1,5 @@
 from sqlalchemy import text
+from ..metrics import metrics
 
 class UpdateDataQuery:
     def __init__(self, db_engine, table_name, condition_column, condition_value, target_columns, target_values):
@@ -9,29 +10,48 @@ class UpdateDataQuery:
         self.target_columns = target_columns
         self.target_values = target_values
 
+    @metrics.instrument("update")
     def execute(self):
         try:
+            query = self._build_query()
             with self.db_engine.connect() as c:
                 with c.begin():
-                    target_data = ', '.join([f"{column} = {value}" for column, value in zip(self.target_columns, self.target_values)])
-                    query = f"UPDATE {self.table_name} SET {target_data} WHERE {self.condition_column} = {self.condition_value}"
                     c.execute(text(query))
 
             return "Succeed: Data Updated", query
         except Exception as e:
-            error_message = str(e)
+            return f"Failed: Data Unupdated - {self._error_message(e)}", None
 
-            if "(pymysql.err.OperationalError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+    @metrics.instrument("update")
+    async def execute_async(self):
+        try:
+            query = self._build_query()
+            async with self.db_engine.connect() as c:
+                async with c.begin():
+                    await c.execute(text(query))
+
+            return "Succeed: Data Updated", query
+        except Exception as e:
+            return f"Failed: Data Unupdated - {self._error_message(e)}", None
+
+    def _build_query(self):
+        target_data = ', '.join([f"{column} = {value}" for column, value in zip(self.target_columns, self.target_values)])
+        return f"UPDATE {self.table_name} SET {target_data} WHERE {self.condition_column} = {self.condition_value}"
+
+    @staticmethod
+    def _error_message(e):
+        error_message = str(e)
+
+        if "(pymysql.err.OperationalError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+
+        if "(pymysql.err.ProgrammingError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
 
-            if "(pymysql.err.ProgrammingError)" in error_message:
-                error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
+        if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
 
-            if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
-                error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
-                
-            error_message = error_message.strip()
-            return f"Failed: Data Unupdated - {error_message}", None
\ No newline at end of file
+        return error_message.strip()
@@ -1,29 +1,211 @@
 from sqlalchemy import text
+from .metrics import metrics
 
 class QueryExecutor:
-    def __init__(self, db_engine):
+    DEFAULT_MAX_ROWS = 1000
+    DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+    MAX_ROWS_LIMIT = 50000
+    MAX_BYTES_LIMIT = 32 * 1024 * 1024
+    FETCH_CHUNK_SIZE = 500
+
+    def __init__(self, db_engine, cursor_store=None, owner=None, max_rows=None, max_bytes=None):
         self.db_engine = db_engine
+        self.cursor_store = cursor_store
+        self.owner = owner
+        self.max_rows = self._bounded_limit("max_rows", max_rows, self.DEFAULT_MAX_ROWS, self.MAX_ROWS_LIMIT)
+        self.max_bytes = self._bounded_limit("max_bytes", max_bytes, self.DEFAULT_MAX_BYTES, self.MAX_BYTES_LIMIT)
+        self.truncated = False
+        self.row_count = 0
+        self.cursor_token = None
+
+    @staticmethod
+    def _bounded_limit(name, value, default, limit):
+        if value is None or value == "":
+            return default
+        try:
+            if isinstance(value, bool):
+                raise ValueError
+            value = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {name.replace('_', ' ').title()}")
+        if value <= 0:
+            raise ValueError(f"Invalid {name.replace('_', ' ').title()}")
+        return min(value, limit)
 
+    @metrics.instrument("custom_query")
     def execute_custom_query(self, sql_query):
         if not self.db_engine:
             return "Failed: No Active DB Connection", None, None, None
-        
+
         if not sql_query or not sql_query.strip():
             return "Failed: Empty Query", None, None, None
-        
+
         try:
+            is_select = sql_query.strip().upper().startswith("SELECT")
+
+            if is_select:
+                return self._execute_select(sql_query)
+
             with self.db_engine.connect() as c:
-                is_select = sql_query.strip().upper().startswith("SELECT")
-                
-                if is_select:
+                with c.begin():
                     result = c.execute(text(sql_query))
-                    rows = result.fetchall()
-                    column_names = result.keys()
-                    serializable_rows = [dict(row._mapping) for row in rows]
-                    return "Succeed: Query executed successfully", sql_query, serializable_rows, list(column_names)
-                else:
-                    with c.begin():
-                        result = c.execute(text(sql_query))
-                        return "Succeed: Query executed successfully", sql_query, None, None
+                    return "Succeed: Query executed successfully", sql_query, None, None
         except Exception as e:
-            return f"Failed: {str(e)}", None, None, None 
\ No newline at end of file
+            return f"Failed: {str(e)}", None, None, None
+
+    @metrics.instrument("fetch_rows")
+    def fetch_next_rows(self, cursor_token):
+        if not self.cursor_store:
+            return "Failed: Undefined Cursor Store", None, None, None
+
+        entry = self.cursor_store.take(cursor_token, self.owner)
+        if not entry:
+            return "Failed: Expired or Unknown Cursor", None, None, None
+
+        try:
+            rows, pending_rows = self._fetch_bounded(entry["result"], entry["pending_rows"])
+        except Exception as e:
+            self.cursor_store.close_entry(entry)
+            return f"Failed: {str(e)}", None, None, None
+
+        self.row_count = len(rows)
+        self._keep_or_close(entry["connection"], entry["result"], entry["column_names"], pending_rows, cursor_token)
+        return "Succeed: Fetched next rows", None, rows, entry["column_names"]
+
+    @metrics.instrument("custom_query")
+    async def execute_custom_query_async(self, sql_query):
+        if not self.db_engine:
+            return "Failed: No Active DB Connection", None, None, None
+
+        if not sql_query or not sql_query.strip():
+            return "Failed: Empty Query", None, None, None
+
+        try:
+            is_select = sql_query.strip().upper().startswith("SELECT")
+
+            if is_select:
+                return await self._execute_select_async(sql_query)
+
+            async with self.db_engine.connect() as c:
+                async with c.begin():
+                    await c.execute(text(sql_query))
+                    return "Succeed: Query executed successfully", sql_query, None, None
+        except Exception as e:
+            return f"Failed: {str(e)}", None, None, None
+
+    @metrics.instrument("fetch_rows")
+    async def fetch_next_rows_async(self, cursor_token):
+        if not self.cursor_store:
+            return "Failed: Undefined Cursor Store", None, None, None
+
+        entry = self.cursor_store.take(cursor_token, self.owner)
+        if not entry:
+            return "Failed: Expired or Unknown Cursor", None, None, None
+
+        try:
+            rows, pending_rows = await self._fetch_bounded_async(entry["result"], entry["pending_rows"])
+        except Exception as e:
+            await self.cursor_store.close_entry_async(entry)
+            return f"Failed: {str(e)}", None, None, None
+
+        self.row_count = len(rows)
+        await self._keep_or_close_async(entry["connection"], entry["result"], entry["column_names"], pending_rows, cursor_token)
+        return "Succeed: Fetched next rows", None, rows, entry["column_names"]
+
+    def _execute_select(self, sql_query):
+        c = self.db_engine.connect()
+        try:
+            result = c.execution_options(stream_results=True, max_row_buffer=self.FETCH_CHUNK_SIZE).execute(text(sql_query))
+            column_names = list(result.keys())
+            rows, pending_rows = self._fetch_bounded(result, None)
+        except Exception:
+            c.close()
+            raise
+
+        self.row_count = len(rows)
+        self._keep_or_close(c, result, column_names, pending_rows)
+        return "Succeed: Query executed successfully", sql_query, rows, column_names
+
+    async def _execute_select_async(self, sql_query):
+        c = await self.db_engine.connect()
+        try:
+            result = await c.stream(text(sql_query), execution_options={"max_row_buffer": self.FETCH_CHUNK_SIZE})
+            column_names = list(result.keys())
+            rows, pending_rows = await self._fetch_bounded_async(result, None)
+        except Exception:
+            await c.close()
+            raise
+
+        self.row_count = len(rows)
+        await self._keep_or_close_async(c, result, column_names, pending_rows)
+        return "Succeed: Query executed successfully", sql_query, rows, column_names
+
+    def _fetch_bounded(self, result, pending_rows):
+        rows = []
+        byte_count = 0
+        chunk = list(pending_rows or [])
+
+        while True:
+            if not chunk:
+                if len(rows) >= self.max_rows or byte_count >= self.max_bytes:
+                    return rows, result.fetchmany(1) or None
+                chunk = result.fetchmany(min(self.FETCH_CHUNK_SIZE, self.max_rows - len(rows)))
+                if not chunk:
+                    return rows, None
+
+            for index, row in enumerate(chunk):
+                if len(rows) >= self.max_rows or byte_count >= self.max_bytes:
+                    return rows, chunk[index:]
+                rows.append(tuple(row))
+                byte_count += self._estimate_row_bytes(row)
+            chunk = []
+
+    async def _fetch_bounded_async(self, result, pending_rows):
+        rows = []
+        byte_count = 0
+        chunk = list(pending_rows or [])
+
+        while True:
+            if not chunk:
+                if len(rows) >= self.max_rows or byte_count >= self.max_bytes:
+                    return rows, await result.fetchmany(1) or None
+                chunk = await result.fetchmany(min(self.FETCH_CHUNK_SIZE, self.max_rows - len(rows)))
+                if not chunk:
+                    return rows, None
+
+            for index, row in enumerate(chunk):
+                if len(rows) >= self.max_rows or byte_count >= self.max_bytes:
+                    return rows, chunk[index:]
+                rows.append(tuple(row))
+                byte_count += self._estimate_row_bytes(row)
+            chunk = []
+
+    def _keep_or_close(self, connection, result, column_names, pending_rows, cursor_token=None):
+        self.truncated = pending_rows is not None
+        self.cursor_token = None
+
+        if self.truncated and self.cursor_store is not None:
+            self.cursor_token = self.cursor_store.put(
+                self.owner, connection, result, column_names, pending_rows, cursor_token
+            )
+            return
+
+        result.close()
+        connection.close()
+
+    async def _keep_or_close_async(self, connection, result, column_names, pending_rows, cursor_token=None):
+        self.truncated = pending_rows is not None
+        self.cursor_token = None
+
+        if self.truncated and self.cursor_store is not None:
+            self.cursor_token = self.cursor_store.put(
+                self.owner, connection, result, column_names, pending_rows, cursor_token, is_async=True
+            )
+            return
+
+        await result.close()
+        await connection.close()
+
+    @staticmethod
+    def _estimate_row_bytes(row):
+        return sum(len(str(value)) + 8 for value in row)
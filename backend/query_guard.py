@@ -0,0 +1,161 @@
+import re
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from sqlalchemy import event
+
+_current_query = contextvars.ContextVar("current_query", default=None)
+logger = logging.getLogger("ezdb.query_guard")
+
+class QueryGuard:
+    SELECT_PATTERN = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+    KILL_CONNECT_TIMEOUT = 5
+
+    def __init__(self, default_timeout_ms=None):
+        self.default_timeout_ms = default_timeout_ms
+        self.in_flight = {}
+        self._kill_engines = {}
+        self._lock = threading.Lock()
+
+    def install(self, engine, kill_engine=None):
+        if kill_engine is not None:
+            self._kill_engines[engine] = kill_engine
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute, retval=True)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def uninstall(self, engine):
+        self._kill_engines.pop(engine, None)
+        for name, listener in (
+            ("before_cursor_execute", self._before_cursor_execute),
+            ("after_cursor_execute", self._after_cursor_execute),
+            ("handle_error", self._handle_error),
+        ):
+            if event.contains(engine, name, listener):
+                event.remove(engine, name, listener)
+
+    @contextmanager
+    def track(self, query_id, owner, timeout_ms=None):
+        timeout_ms = timeout_ms or self.default_timeout_ms
+        state = {"query_id": query_id, "owner": owner, "timeout_ms": timeout_ms, "active": {}, "lock": threading.Lock()}
+        if query_id:
+            with self._lock:
+                self.in_flight[query_id] = state
+
+        token = _current_query.set(state)
+        try:
+            yield state
+        finally:
+            _current_query.reset(token)
+            if query_id:
+                with self._lock:
+                    if self.in_flight.get(query_id) is state:
+                        del self.in_flight[query_id]
+
+    def current_owner(self):
+        state = _current_query.get()
+        return state["owner"] if state else None
+
+    def cancel(self, query_id, owner):
+        with self._lock:
+            state = self.in_flight.get(query_id)
+            if not state or state["owner"] != owner:
+                return False
+        with state["lock"]:
+            active = list(state["active"].values())
+
+        for entry in active:
+            self._kill(state, entry)
+        return True
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        state = _current_query.get()
+        if not state:
+            return statement, parameters
+
+        dbapi_connection = self._dbapi_connection(conn, cursor)
+        entry = (conn.engine, dbapi_connection)
+        with state["lock"]:
+            state["active"][id(dbapi_connection)] = entry
+
+        timeout_ms = state["timeout_ms"]
+        if not timeout_ms:
+            return statement, parameters
+
+        if conn.dialect.name == "mysql" and self.SELECT_PATTERN.match(statement) and "/*+" not in statement:
+            statement = self.SELECT_PATTERN.sub(f"SELECT /*+ MAX_EXECUTION_TIME({int(timeout_ms)}) */", statement, count=1)
+        else:
+            timer = threading.Timer(timeout_ms / 1000, self._kill, (state, entry))
+            timer.daemon = True
+            timer.start()
+            context.query_guard_timer = timer
+
+        return statement, parameters
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._finish(context, self._dbapi_connection(conn, cursor))
+
+    def _handle_error(self, exception_context):
+        context = exception_context.execution_context
+        cursor = getattr(context, "cursor", None)
+        self._finish(context, self._dbapi_connection(exception_context.connection, cursor) if cursor is not None else None)
+
+    @staticmethod
+    def _dbapi_connection(conn, cursor):
+        dbapi_connection = getattr(cursor, "connection", None)
+        if dbapi_connection is None and conn is not None:
+            dbapi_connection = conn.connection.dbapi_connection
+        return dbapi_connection
+
+    def _finish(self, context, dbapi_connection):
+        timer = getattr(context, "query_guard_timer", None)
+        if timer:
+            timer.cancel()
+
+        state = _current_query.get()
+        if state and dbapi_connection is not None:
+            with state["lock"]:
+                state["active"].pop(id(dbapi_connection), None)
+
+    def _kill(self, state, entry):
+        engine, dbapi_connection = entry
+        engine = self._kill_engines.get(engine, engine)
+        with state["lock"]:
+            if not self._is_active(state, entry):
+                return
+            if engine.dialect.name != "mysql":
+                self._interrupt(dbapi_connection)
+                return
+            thread_id = getattr(dbapi_connection, "driver_connection", dbapi_connection).thread_id()
+
+        self._kill_query(state, entry, engine, thread_id)
+
+    @staticmethod
+    def _is_active(state, entry):
+        return state["active"].get(id(entry[1])) is entry
+
+    def _kill_query(self, state, entry, engine, thread_id):
+        try:
+            cargs, cparams = engine.dialect.create_connect_args(engine.url)
+            cparams.setdefault("connect_timeout", self.KILL_CONNECT_TIMEOUT)
+            kill_connection = engine.dialect.connect(*cargs, **cparams)
+            try:
+                with state["lock"]:
+                    still_active = self._is_active(state, entry)
+                if still_active:
+                    cursor = kill_connection.cursor()
+                    cursor.execute(f"KILL QUERY {int(thread_id)}")
+                    cursor.close()
+            finally:
+                kill_connection.close()
+        except Exception as e:
+            logger.warning("Failed to kill query on MySQL thread %s: %s", thread_id, e)
+
+    @staticmethod
+    def _interrupt(dbapi_connection):
+        try:
+            if hasattr(dbapi_connection, "interrupt"):
+                dbapi_connection.interrupt()
+        except Exception as e:
+            logger.warning("Failed to interrupt query: %s", e)
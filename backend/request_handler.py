@@ -1,8 +1,19 @@
 from functools import wraps
-from flask import jsonify, session
+from flask import current_app, jsonify, request, session, stream_with_context
 import re
+import json
+import base64
+import decimal
+import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class RequestHandler:
+    RESULT_FORMATS = ("objects", "rows", "columns")
+
     def __init__(self, database_manager):
         self.database_manager = database_manager
 
@@ -12,13 +23,32 @@ class RequestHandler:
             engine = self.get_db_engine()
             if not engine:
                 return self.error_response("Failed: No Active DB Connection")
-            return f(engine, *args, **kwargs)
+
+            hashed_session_key = session.get("hashed_session_key")
+            timeout_ms = request.headers.get("X-Query-Timeout-Ms", type=int)
+            if timeout_ms is None:
+                timeout_ms = self.database_manager.get_query_timeout(hashed_session_key)
+
+            with self.database_manager.query_guard.track(
+                request.headers.get("X-Query-Id"), hashed_session_key, timeout_ms
+            ):
+                return f(engine, *args, **kwargs)
         return decorated_function
 
     def get_db_engine(self):
         hashed_session_key = session.get("hashed_session_key")
         return self.database_manager.get_db_engine(hashed_session_key)
 
+    def get_schema_cache(self):
+        hashed_session_key = session.get("hashed_session_key")
+        return self.database_manager.get_schema_cache(hashed_session_key)
+
+    def get_result_cache(self):
+        if request.headers.get("Cache-Control", "").lower() == "no-cache":
+            return None
+        hashed_session_key = session.get("hashed_session_key")
+        return self.database_manager.get_result_cache(hashed_session_key)
+
     @staticmethod
     def validate_required_fields(fields):
         for field_name, field_value in fields.items():
@@ -36,21 +66,89 @@ class RequestHandler:
             return True
         return False
 
-    @staticmethod
-    def success_response(message, query=None, **kwargs):
+    @classmethod
+    def success_response(cls, message, query=None, **kwargs):
         response = {"message": message}
         if query:
             response["query"] = query
         response.update(kwargs)
-        return jsonify(response)
+        return cls.data_response(response)
+
+    @classmethod
+    def data_response(cls, payload):
+        if "rows" in payload and "column_names" in payload:
+            cls._format_rows(payload, cls.get_result_format())
+        return cls.json_response(payload)
+
+    @staticmethod
+    def get_result_format():
+        result_format = request.headers.get("X-Result-Format") or request.args.get("format")
+        return result_format if result_format in RequestHandler.RESULT_FORMATS else "objects"
+
+    @staticmethod
+    def _format_rows(payload, result_format):
+        column_names = list(payload["column_names"])
+        rows = [RequestHandler._row_values(row, column_names) for row in payload["rows"]]
+
+        if result_format == "columns":
+            payload["columns"] = [list(column) for column in zip(*rows)] if rows else [[] for _ in column_names]
+            del payload["rows"]
+        elif result_format == "rows":
+            payload["rows"] = rows
+        else:
+            payload["rows"] = [dict(zip(column_names, row)) for row in rows]
+        payload["format"] = result_format
+
+    @staticmethod
+    def _row_values(row, column_names):
+        if isinstance(row, dict):
+            return tuple(row.get(column_name) for column_name in column_names)
+        return tuple(row)
+
+    @staticmethod
+    def sse_response(events):
+        def encode():
+            for event, payload in events:
+                yield f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        return current_app.response_class(
+            stream_with_context(encode()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    @staticmethod
+    def json_response(payload):
+        if orjson is not None:
+            body = orjson.dumps(payload, default=RequestHandler._json_default)
+        else:
+            body = json.dumps(payload, default=RequestHandler._json_default, separators=(",", ":"))
+        return current_app.response_class(body, mimetype="application/json")
+
+    @staticmethod
+    def _json_default(value):
+        if isinstance(value, decimal.Decimal):
+            return str(value)
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            value = bytes(value)
+            try:
+                return value.decode("utf-8")
+            except UnicodeDecodeError:
+                return base64.b64encode(value).decode("ascii")
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, datetime.timedelta):
+            return str(value)
+        if isinstance(value, (set, frozenset)):
+            return list(value)
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
 
     @staticmethod
     def error_response(message, query=None):
         return jsonify({"message": message, "query": query})
 
-    @staticmethod
-    def handle_query_response(message, query):
-        return RequestHandler.success_response(message, query) if "Succeed" in message else RequestHandler.error_response(message)
+    @classmethod
+    def handle_query_response(cls, message, query):
+        return cls.success_response(message, query) if "Succeed" in message else cls.error_response(message)
 
     @staticmethod
     def parse_delete_conditions(columns, operators, values, logical_operators):
@@ -96,4 +194,271 @@ class RequestHandler:
                 for i in range(len(column_names))
             }
             data.append(row)
-        return data 
\ No newline at end of file
+        return data
+
+    @staticmethod
+    def parse_batch_updates(updates):
+        if isinstance(updates, str):
+            try:
+                updates = json.loads(updates)
+            except ValueError:
+                raise ValueError("Batch Updates Must Be Valid JSON")
+        if not isinstance(updates, list) or not updates:
+            raise ValueError("Batch Updates Must Be a Non-Empty List")
+
+        parsed = []
+        for item in updates:
+            if isinstance(item, dict):
+                key, values = item.get("key"), item.get("values")
+            elif isinstance(item, (list, tuple)) and len(item) == 2:
+                key, values = item
+            else:
+                raise ValueError("Batch Update Entries Must Be [key, {column: value}] Pairs")
+
+            if key is None or isinstance(key, (dict, list)):
+                raise ValueError("Batch Update Keys Must Be Scalar Values")
+            if not isinstance(values, dict) or not values:
+                raise ValueError(f"No Target Columns for Key {key}")
+            if any(isinstance(value, (dict, list)) for value in values.values()):
+                raise ValueError(f"Target Values for Key {key} Must Be Scalar Values")
+            parsed.append((key, values))
+        return parsed
+
+    @staticmethod
+    def parse_connect_form(form):
+        connection_mode = form.get("connection_mode")
+
+        kwargs = {}
+        if connection_mode == "url":
+            kwargs["db_url"] = form.get("dbURLInput", "").strip()
+        elif connection_mode == "custom":
+            kwargs.update({
+                "username": form.get("username", "").strip(),
+                "password": form.get("password", "").strip(),
+                "host": form.get("host", "").strip(),
+                "port": form.get("port", "").strip(),
+                "database": form.get("database", "").strip(),
+            })
+
+        for option, input_name in (
+            ("pool_size", "poolSizeInput"),
+            ("max_overflow", "maxOverflowInput"),
+            ("pool_timeout", "poolTimeoutInput"),
+            ("pool_recycle", "poolRecycleInput"),
+        ):
+            kwargs[option] = form.get(input_name, type=int)
+        return connection_mode, kwargs
+
+    @classmethod
+    def parse_drop_table_form(cls, form):
+        fields = {"table_name": form.get("dropTableNameInput")}
+        is_valid, error_msg = cls.validate_required_fields(fields)
+        return (fields, None) if is_valid else (None, error_msg)
+
+    @classmethod
+    def parse_insert_form(cls, form):
+        fields = {
+            "table_name": form.get("tableNameInput"),
+            "column_names": form.getlist("columnNameInput"),
+            "column_values": form.getlist("columnValueInput")
+        }
+        is_valid, error_msg = cls.validate_required_fields(fields)
+        if not is_valid:
+            return None, error_msg
+
+        fields["data"] = cls.parse_insert_data(fields["column_names"], fields["column_values"])
+        return fields, None
+
+    @classmethod
+    def parse_update_form(cls, form):
+        fields = {
+            "table_name": form.get("tableNameInput"),
+            "condition_column": form.get("conditionColInput"),
+            "condition_value": form.get("conditionValueInput"),
+            "target_columns": form.getlist("targetColInput"),
+            "target_values": form.getlist("targetValueInput")
+        }
+        is_valid, error_msg = cls.validate_required_fields(fields)
+        return (fields, None) if is_valid else (None, error_msg)
+
+    @staticmethod
+    def batch_update_from_form(form):
+        if not form.get("batchUpdatesInput"):
+            return None
+        return {
+            "table_name": form.get("tableNameInput"),
+            "key_column": form.get("conditionColInput"),
+            "updates": form.get("batchUpdatesInput"),
+            "chunk_size": form.get("batchChunkSizeInput")
+        }
+
+    @classmethod
+    def parse_batch_update(cls, data):
+        data = data or {}
+        fields = {
+            "table_name": data.get("table_name"),
+            "key_column": data.get("key_column"),
+            "updates": data.get("updates")
+        }
+        is_valid, error_msg = cls.validate_required_fields(fields)
+        if not is_valid:
+            return None, error_msg
+
+        try:
+            fields["updates"] = cls.parse_batch_updates(fields["updates"])
+            fields["chunk_size"] = int(data.get("chunk_size") or 0) or None
+        except ValueError as e:
+            return None, f"Failed: {str(e)}"
+        return fields, None
+
+    @classmethod
+    def bulk_update_response(cls, message, query, bulk_update_query):
+        if not message.startswith("Succeed"):
+            return cls.error_response(message, query)
+        return cls.success_response(
+            message, query,
+            rows_submitted=bulk_update_query.rows_submitted,
+            rows_affected=bulk_update_query.rows_updated,
+            elapsed_ms=round(bulk_update_query.elapsed_seconds * 1000, 2),
+            chunks=bulk_update_query.chunks
+        )
+
+    @classmethod
+    def parse_delete_form(cls, form):
+        fields = {
+            "table_name": form.get("tableNameInput"),
+            "columns": form.getlist("columnInput"),
+            "operators": form.getlist("operatorInput"),
+            "values": form.getlist("valueInput")
+        }
+        is_valid, error_msg = cls.validate_required_fields(fields)
+        if not is_valid:
+            return None, error_msg
+
+        fields["conditions"] = cls.parse_delete_conditions(
+            fields["columns"], fields["operators"], fields["values"], form.getlist("logicalOperatorInput")
+        )
+        return fields, None
+
+    @classmethod
+    def parse_modify_form(cls, form):
+        fields = {
+            "table_name": form.get("tableNameInput"),
+            "command": form.get("commandInput"),
+            "column_name": form.get("columnNameInput")
+        }
+        is_valid, error_msg = cls.validate_required_fields(fields)
+        if not is_valid:
+            return None, error_msg
+
+        fields["column_type"] = form.get("columnTypeInput")
+        fields["column_new_name"] = form.get("columnNewNameInput")
+        return fields, None
+
+    @classmethod
+    def parse_join_form(cls, form):
+        fields = {
+            "table_name": form.get("tableNameInput"),
+            "join_types": form.getlist("joinTypes"),
+            "join_tables": form.getlist("joinTables"),
+            "join_conditions": form.getlist("joinConditions"),
+            "select_columns": form.getlist("selectColumns")
+        }
+        is_valid, error_msg = cls.validate_required_fields(fields)
+        if not is_valid:
+            return None, error_msg
+
+        fields["where_conditions"] = form.getlist("whereConditions")
+        return fields, None
+
+    @classmethod
+    def join_response(cls, message, query, rows, column_names, join_query):
+        return cls.success_response(
+            message, query,
+            rows=rows,
+            column_names=column_names,
+            cached=join_query.served_from_cache
+        )
+
+    @classmethod
+    def parse_sorting_form(cls, form):
+        fields = {
+            "table_name": form.get("tableNameInput"),
+            "order_columns": form.getlist("orderColumnNameInput"),
+            "order_sortings": form.getlist("sortingInput"),
+            "select_columns": form.getlist("selectColumnNameInput")
+        }
+        is_valid, error_msg = cls.validate_required_fields(fields)
+        if not is_valid:
+            return None, error_msg
+
+        fields["page_size"] = form.get("sortPageSizeInput", type=int)
+        fields["cursor"] = form.get("sortCursorInput") or None
+        return fields, None
+
+    @classmethod
+    def sorting_response(cls, message, query, rows, column_names, sorting_query):
+        return cls.success_response(
+            message, query,
+            rows=rows,
+            column_names=column_names,
+            cached=sorting_query.served_from_cache,
+            page_size=sorting_query.page_size,
+            next_cursor=sorting_query.next_cursor,
+            approximate_total=sorting_query.approximate_total
+        )
+
+    @classmethod
+    def parse_export_form(cls, form, export_formats):
+        fields = {
+            "table_name": form.get("exportTableNameInput"),
+            "file_format": form.get("exportFormatInput", "xlsx").lower()
+        }
+        is_valid, error_msg = cls.validate_required_fields({"table_name": fields["table_name"]})
+        if not is_valid:
+            return None, error_msg
+        if fields["file_format"] not in export_formats:
+            return None, f"Failed: Unsupported Export Format {fields['file_format']}"
+        return fields, None
+
+    @classmethod
+    def parse_import_form(cls, form, files):
+        fields = {
+            "table_name": form.get("importTableNameInput"),
+            "file": files.get("importExcelFile"),
+            "batch_size": form.get("importBatchSizeInput", type=int),
+            "commit_per_batch": form.get("importCommitModeInput") == "batch",
+            "sheet_name": form.get("importSheetNameInput") or None,
+            "all_sheets": form.get("importAllSheetsInput") is not None
+        }
+        is_valid, error_msg = cls.validate_required_fields({"table_name": fields["table_name"]})
+        if not is_valid:
+            return None, error_msg
+        if not fields["file"] or not fields["file"].filename:
+            return None, "Failed: Undefined Excel File"
+        return fields, None
+
+    @staticmethod
+    def parse_script_form(form, files):
+        fields = {
+            "file": files.get("sqlScriptFile"),
+            "batch_size": form.get("scriptBatchSizeInput", type=int),
+            "continue_on_error": form.get("scriptContinueOnErrorInput") == "on"
+        }
+        if not fields["file"] or not fields["file"].filename:
+            return None, "Failed: Undefined SQL File"
+        return fields, None
+
+    @classmethod
+    def job_response(cls, job_id, message):
+        if job_id:
+            return cls.success_response(message, job_id=job_id)
+        return cls.error_response(message)
+
+    @classmethod
+    def query_rows_response(cls, message, query, rows, column_names, query_executor):
+        return cls.success_response(
+            message, query, rows=rows, column_names=column_names,
+            row_count=query_executor.row_count, truncated=query_executor.truncated,
+            cursor=query_executor.cursor_token
+        )
@@ -0,0 +1,237 @@
+import re
+import json
+import time
+import threading
+from collections import OrderedDict
+from sqlalchemy import event
+
+class ResultCache:
+    IDENTIFIER = r"(?:`[^`]+`|[\w$]+)(?:\.(?:`[^`]+`|[\w$]+))?"
+    IDENTIFIER_PATTERN = re.compile(IDENTIFIER)
+    READ_PREFIXES = (
+        "SELECT", "SHOW", "DESCRIBE", "DESC", "EXPLAIN", "SET", "BEGIN", "START",
+        "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "ANALYZE", "CHECK",
+    )
+    WRITE_PATTERNS = (
+        re.compile(rf"^(?:INSERT|REPLACE)\s+(?:(?:LOW_PRIORITY|DELAYED|HIGH_PRIORITY|IGNORE)\s+)*(?:INTO\s+)?(?P<tables>{IDENTIFIER})", re.IGNORECASE),
+        re.compile(rf"^UPDATE\s+(?:(?:LOW_PRIORITY|IGNORE)\s+)*(?P<tables>{IDENTIFIER})\s+(?:(?:AS\s+)?(?!SET\b)[\w$]+\s+)?SET\b", re.IGNORECASE),
+        re.compile(rf"^DELETE\s+(?:(?:LOW_PRIORITY|QUICK|IGNORE)\s+)*FROM\s+(?P<tables>{IDENTIFIER})\s*(?:WHERE\b|ORDER\b|LIMIT\b|$)", re.IGNORECASE),
+        re.compile(rf"^(?:ALTER|CREATE)\s+(?:TEMPORARY\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<tables>{IDENTIFIER})", re.IGNORECASE),
+        re.compile(rf"^DROP\s+(?:TEMPORARY\s+)?TABLES?\s+(?:IF\s+EXISTS\s+)?(?P<tables>{IDENTIFIER}(?:\s*,\s*{IDENTIFIER})*)", re.IGNORECASE),
+        re.compile(rf"^TRUNCATE\s+(?:TABLE\s+)?(?P<tables>{IDENTIFIER})", re.IGNORECASE),
+        re.compile(rf"^RENAME\s+TABLES?\s+(?P<tables>{IDENTIFIER}\s+TO\s+{IDENTIFIER}(?:\s*,\s*{IDENTIFIER}\s+TO\s+{IDENTIFIER})*)", re.IGNORECASE),
+        re.compile(rf"^(?:CREATE|DROP)\s+(?:UNIQUE\s+|FULLTEXT\s+|SPATIAL\s+)?INDEX\s+{IDENTIFIER}\s+ON\s+(?P<tables>{IDENTIFIER})", re.IGNORECASE),
+    )
+    TABLE_LIST_SEPARATOR = re.compile(r"\s*,\s*|\s+TO\s+", re.IGNORECASE)
+    NORMALIZE_PATTERN = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"|`[^`]*`|\s+", re.DOTALL)
+    PENDING_KEY = "result_cache_pending"
+    ALL_TABLES = "*"
+
+    def __init__(self, db_engine, ttl=60, max_bytes=16 * 1024 * 1024, max_entry_bytes=None, registry=None, scope=None):
+        self.db_engine = db_engine
+        self.ttl = ttl
+        self.registry = registry
+        self.scope = f"result:{scope}"
+        self._shared_generations = {}
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes or max_bytes // 4
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._table_keys = {}
+        self._table_generations = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._engines = []
+        self.watch(self.db_engine)
+
+    def watch(self, engine):
+        for name, listener in self._listeners():
+            event.listen(engine, name, listener)
+        self._engines.append(engine)
+
+    def get_or_load(self, sql, tables, loader, params=None):
+        key, tables, now, cached, generation = self._lookup(sql, tables, params)
+        if generation is None:
+            return cached, True
+        value = loader()
+        self._store(key, tables, now, generation, value)
+        return value, False
+
+    async def get_or_load_async(self, sql, tables, loader, params=None):
+        key, tables, now, cached, generation = self._lookup(sql, tables, params)
+        if generation is None:
+            return cached, True
+        value = await loader()
+        self._store(key, tables, now, generation, value)
+        return value, False
+
+    def _lookup(self, sql, tables, params):
+        key = self.normalize_sql(sql)
+        if params:
+            key = (key, json.dumps(params, sort_keys=True, default=str))
+        tables = {self._normalize_table(table) for table in tables}
+        self._sync_shared(tables)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry["expires_at"] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return key, tables, now, entry["value"], None
+            if entry:
+                self._remove(key)
+            self.misses += 1
+            return key, tables, now, None, self._snapshot(tables)
+
+    def _store(self, key, tables, now, generation, value):
+        size = self._estimate_bytes(value)
+
+        with self._lock:
+            if size <= self.max_entry_bytes and generation == self._snapshot(tables):
+                if key in self._entries:
+                    self._remove(key)
+                self._entries[key] = {
+                    "expires_at": now + self.ttl,
+                    "value": value,
+                    "tables": tables,
+                    "size": size,
+                }
+                self.total_bytes += size
+                for table in tables:
+                    self._table_keys.setdefault(table, set()).add(key)
+                while self.total_bytes > self.max_bytes and self._entries:
+                    self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tables=None):
+        with self._lock:
+            self.invalidations += 1
+            if tables is None:
+                self._entries.clear()
+                self._table_keys.clear()
+                self.total_bytes = 0
+                self._generation += 1
+                return
+
+            for table in tables:
+                table = self._normalize_table(table)
+                self._table_generations[table] = self._table_generations.get(table, 0) + 1
+                for key in list(self._table_keys.get(table, ())):
+                    self._remove(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+            }
+
+    def close(self):
+        for engine in self._engines:
+            for name, listener in self._listeners():
+                if event.contains(engine, name, listener):
+                    event.remove(engine, name, listener)
+        self._engines.clear()
+        self.invalidate()
+
+    def _listeners(self):
+        return (
+            ("after_cursor_execute", self._after_cursor_execute),
+            ("commit", self._after_transaction),
+            ("rollback", self._after_transaction),
+            ("checkin", self._after_checkin),
+        )
+
+    @classmethod
+    def normalize_sql(cls, sql):
+        return cls.NORMALIZE_PATTERN.sub(
+            lambda match: " " if match.group().isspace() else match.group(), sql.strip()
+        ).rstrip(";").strip()
+
+    @classmethod
+    def written_tables(cls, statement):
+        statement = statement.lstrip()
+        keyword = statement[:12].split(None, 1)[0].upper() if statement else ""
+        if keyword in cls.READ_PREFIXES:
+            return set()
+
+        for pattern in cls.WRITE_PATTERNS:
+            match = pattern.match(statement)
+            if match:
+                return {
+                    cls._normalize_table(table)
+                    for table in cls.TABLE_LIST_SEPARATOR.split(match.group("tables"))
+                }
+        return {cls.ALL_TABLES}
+
+    @classmethod
+    def _normalize_table(cls, table):
+        match = cls.IDENTIFIER_PATTERN.match(table.strip())
+        name = match.group() if match else table.strip()
+        return name.split(".")[-1].strip("`").lower()
+
+    def _snapshot(self, tables):
+        return self._generation, tuple(sorted((table, self._table_generations.get(table, 0)) for table in tables))
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry["size"]
+        for table in entry["tables"]:
+            keys = self._table_keys.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._table_keys[table]
+
+    def _estimate_bytes(self, value):
+        rows, column_names = value[0], value[1]
+        return sum(len(str(column)) + 8 for column in column_names) + sum(
+            sum(len(str(item)) + 8 for item in row) for row in rows
+        )
+
+    def _invalidate_written(self, tables):
+        if self.ALL_TABLES in tables:
+            self.invalidate()
+        elif tables:
+            self.invalidate(tables)
+        if tables and self.registry is not None:
+            self.registry.bump_generations(self.scope, sorted(tables))
+
+    def _sync_shared(self, tables):
+        if self.registry is None:
+            return
+        generations = self.registry.generations(self.scope, sorted(tables | {self.ALL_TABLES}))
+        with self._lock:
+            changed = [
+                name for name, generation in generations.items()
+                if self._shared_generations.get(name, generation) != generation
+            ]
+            self._shared_generations.update(generations)
+        if self.ALL_TABLES in changed:
+            self.invalidate()
+        elif changed:
+            self.invalidate(changed)
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        tables = self.written_tables(statement)
+        if not tables:
+            return
+        self._invalidate_written(tables)
+        conn.info.setdefault(self.PENDING_KEY, set()).update(tables)
+
+    def _after_transaction(self, conn):
+        tables = conn.info.get(self.PENDING_KEY)
+        if tables:
+            self._invalidate_written(tables)
+
+    def _after_checkin(self, dbapi_connection, connection_record):
+        tables = connection_record.info.pop(self.PENDING_KEY, None)
+        if tables:
+            self._invalidate_written(tables)
@@ -0,0 +1,149 @@
+import time
+import asyncio
+import secrets
+import threading
+from collections import OrderedDict
+
+class ResultCursorStore:
+    def __init__(self, max_open=32, ttl=120, max_per_owner=2, max_pool_share=0.5, reaper_interval=30):
+        self.max_open = max_open
+        self.ttl = ttl
+        self.max_per_owner = max_per_owner
+        self.max_pool_share = max_pool_share
+        self.reaper_interval = reaper_interval
+        self._entries = OrderedDict()
+        self._closing = set()
+        self._lock = threading.Lock()
+        self._reaper = None
+        self._stop_reaper = threading.Event()
+
+    def put(self, owner, connection, result, column_names, pending_rows, token=None, is_async=False):
+        token = token or secrets.token_urlsafe(24)
+        engine = getattr(connection.engine, "sync_engine", connection.engine)
+        entry = {
+            "owner": owner,
+            "engine": engine,
+            "connection": connection,
+            "result": result,
+            "column_names": column_names,
+            "pending_rows": pending_rows,
+            "is_async": is_async,
+            "loop": asyncio.get_running_loop() if is_async else None,
+            "expires_at": time.monotonic() + self.ttl,
+        }
+
+        with self._lock:
+            stale = self._pop_expired()
+            for key, limit in (("owner", self.max_per_owner), ("engine", self._engine_limit(engine))):
+                if limit is None:
+                    continue
+                held = [held_token for held_token, existing in self._entries.items() if existing[key] == entry[key]]
+                for held_token in held[:max(len(held) - limit + 1, 0)]:
+                    stale.append(self._entries.pop(held_token))
+            while len(self._entries) >= self.max_open:
+                stale.append(self._entries.popitem(last=False)[1])
+            self._entries[token] = entry
+
+        for stale_entry in stale:
+            self.close_entry(stale_entry)
+        self._start_reaper()
+        return token
+
+    def take(self, token, owner):
+        with self._lock:
+            stale = self._pop_expired()
+            entry = self._entries.get(token)
+            if entry and entry["owner"] == owner:
+                del self._entries[token]
+            else:
+                entry = None
+
+        for stale_entry in stale:
+            self.close_entry(stale_entry)
+        return entry
+
+    def close(self, token, owner):
+        entry = self.take(token, owner)
+        if entry:
+            self.close_entry(entry)
+        return entry is not None
+
+    def reap_expired(self):
+        with self._lock:
+            stale = self._pop_expired()
+        for stale_entry in stale:
+            try:
+                self.close_entry(stale_entry)
+            except Exception:
+                continue
+        return len(stale)
+
+    def close_all(self):
+        self._stop_reaper.set()
+        with self._lock:
+            stale = list(self._entries.values())
+            self._entries.clear()
+        for stale_entry in stale:
+            try:
+                self.close_entry(stale_entry)
+            except Exception:
+                continue
+
+    def _engine_limit(self, engine):
+        pool_size = getattr(engine.pool, "size", None)
+        if not callable(pool_size):
+            return None
+        return max(int(pool_size() * self.max_pool_share), 1)
+
+    def _pop_expired(self):
+        now = time.monotonic()
+        expired_tokens = [token for token, entry in self._entries.items() if entry["expires_at"] <= now]
+        return [self._entries.pop(token) for token in expired_tokens]
+
+    def close_entry(self, entry):
+        if entry["is_async"]:
+            loop = entry["loop"]
+            if self._running_loop() is loop:
+                task = loop.create_task(self.close_entry_async(entry))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            elif not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(self.close_entry_async(entry), loop)
+            return
+
+        try:
+            entry["result"].close()
+        finally:
+            entry["connection"].close()
+
+    async def close_entry_async(self, entry):
+        if not entry["is_async"]:
+            self.close_entry(entry)
+            return
+
+        try:
+            await entry["result"].close()
+        finally:
+            await entry["connection"].close()
+
+    @staticmethod
+    def _running_loop():
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _start_reaper(self):
+        with self._lock:
+            if self._reaper and self._reaper.is_alive():
+                return
+            self._stop_reaper.clear()
+            self._reaper = threading.Thread(target=self._reap_loop, name="result-cursor-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self):
+        while not self._stop_reaper.wait(self.reaper_interval):
+            try:
+                self.reap_expired()
+            except Exception:
+                continue
@@ -0,0 +1,104 @@
+import time
+import threading
+from collections import OrderedDict
+from sqlalchemy import event, inspect
+
+class SchemaCache:
+    DDL_PREFIXES = ("CREATE", "DROP", "ALTER", "RENAME", "TRUNCATE")
+    SHARED_NAME = "*"
+
+    def __init__(self, db_engine, ttl=300, max_entries=4096, registry=None, scope=None):
+        self.db_engine = db_engine
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.registry = registry
+        self.scope = f"schema:{scope}"
+        self._shared_generation = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._engines = []
+        self.watch(self.db_engine)
+
+    def watch(self, engine):
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.append(engine)
+
+    def get_table_names(self):
+        return self._get(("table_names",), lambda inspector: inspector.get_table_names())
+
+    def get_columns(self, table_name):
+        return self._get(("columns", table_name), lambda inspector: inspector.get_columns(table_name))
+
+    def get_pk_constraint(self, table_name):
+        return self._get(("pk_constraint", table_name), lambda inspector: inspector.get_pk_constraint(table_name))
+
+    def get_foreign_keys(self, table_name):
+        return self._get(("foreign_keys", table_name), lambda inspector: inspector.get_foreign_keys(table_name))
+
+    def get_indexes(self, table_name):
+        return self._get(("indexes", table_name), lambda inspector: inspector.get_indexes(table_name))
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+            }
+
+    def close(self):
+        for engine in self._engines:
+            if event.contains(engine, "after_cursor_execute", self._after_cursor_execute):
+                event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.clear()
+        self.invalidate()
+
+    def _sync_shared(self):
+        if self.registry is None:
+            return
+        generation = self.registry.generations(self.scope, [self.SHARED_NAME])[self.SHARED_NAME]
+        with self._lock:
+            previous, self._shared_generation = self._shared_generation, generation
+        if previous is not None and previous != generation:
+            self.invalidate()
+
+    def _get(self, key, loader):
+        self._sync_shared()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = loader(inspect(self.db_engine))
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (now + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip()[:8].upper().startswith(self.DDL_PREFIXES):
+            self.invalidate()
+            if self.registry is not None:
+                self.registry.bump_generations(self.scope, [self.SHARED_NAME])
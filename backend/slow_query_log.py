@@ -0,0 +1,154 @@
+import os
+import json
+import time
+import bisect
+import hashlib
+import logging
+import threading
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import RotatingFileHandler
+from sqlalchemy import event
+
+class SlowQueryLog:
+    SKIP_OPTION = "skip_slow_query_log"
+    STATEMENT_PREVIEW = 4096
+
+    def __init__(self, threshold_ms=1000, path=None, max_bytes=10 * 1024 * 1024,
+                 backup_count=5, max_entries=500, max_pending_explains=16, owner_getter=None):
+        self.threshold_ms = threshold_ms
+        self.max_entries = max_entries
+        self.max_pending_explains = max_pending_explains
+        self.owner_getter = owner_getter
+        self._entries = []
+        self._explain_engines = {}
+        self._entry_ids = itertools.count(1)
+        self._pending_explains = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        self._logger = self._build_logger(path, max_bytes, backup_count)
+
+    def _build_logger(self, path, max_bytes, backup_count):
+        logger = logging.getLogger(f"ezdb.slow_query.{id(self)}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, delay=True, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+        return logger
+
+    def install(self, engine, explain_engine=None):
+        if explain_engine is not None:
+            self._explain_engines[engine] = explain_engine
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def uninstall(self, engine):
+        self._explain_engines.pop(engine, None)
+        for name, listener in (
+            ("before_cursor_execute", self._before_cursor_execute),
+            ("after_cursor_execute", self._after_cursor_execute),
+        ):
+            if event.contains(engine, name, listener):
+                event.remove(engine, name, listener)
+
+    def set_threshold(self, threshold_ms):
+        self.threshold_ms = threshold_ms
+
+    def top(self, limit=20, owner=None):
+        with self._lock:
+            entries = [entry for entry in reversed(self._entries) if owner is None or entry["owner"] == owner]
+        return [self._public_entry(entry) for entry in entries[:limit]]
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for handler in list(self._logger.handlers):
+            handler.close()
+            self._logger.removeHandler(handler)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context.slow_query_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "slow_query_start", None)
+        if start is None or self.threshold_ms is None:
+            return
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        if duration_ms < self.threshold_ms or context.execution_options.get(self.SKIP_OPTION):
+            return
+
+        owner = self.owner_getter() if self.owner_getter else None
+        entry = {
+            "id": next(self._entry_ids),
+            "timestamp": time.time(),
+            "duration_ms": round(duration_ms, 3),
+            "rows": cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else None,
+            "session": hashlib.sha256(owner.encode()).hexdigest()[:12] if owner else None,
+            "statement": statement[:self.STATEMENT_PREVIEW],
+            "executemany": executemany,
+            "explain": None,
+            "owner": owner,
+        }
+
+        with self._lock:
+            keys = [item["duration_ms"] for item in self._entries]
+            self._entries.insert(bisect.bisect_left(keys, entry["duration_ms"]), entry)
+            if len(self._entries) > self.max_entries:
+                del self._entries[0]
+        self._write(entry)
+
+        if not executemany and statement.lstrip()[:6].upper() == "SELECT":
+            self._schedule_explain(self._explain_engines.get(conn.engine, conn.engine), entry, statement, parameters)
+
+    def _schedule_explain(self, engine, entry, statement, parameters):
+        with self._lock:
+            if self._pending_explains >= self.max_pending_explains:
+                return
+            self._pending_explains += 1
+        try:
+            self._executor.submit(self._explain, engine, entry, statement, parameters)
+        except RuntimeError:
+            with self._lock:
+                self._pending_explains -= 1
+
+    def _explain(self, engine, entry, statement, parameters):
+        try:
+            if engine.dialect.name == "mysql":
+                explain_statement = f"EXPLAIN FORMAT=JSON {statement}"
+            else:
+                explain_statement = f"EXPLAIN QUERY PLAN {statement}"
+
+            options = {self.SKIP_OPTION: True}
+            if not parameters:
+                options["no_parameters"] = True
+                parameters = None
+
+            with engine.connect() as c:
+                result = c.execution_options(**options).exec_driver_sql(explain_statement, parameters)
+                rows = [list(row) for row in result.fetchall()]
+
+            if engine.dialect.name == "mysql" and rows:
+                explain = json.loads(rows[0][0])
+            else:
+                explain = rows
+        except Exception as e:
+            explain = {"error": str(getattr(e, "orig", None) or e)}
+        finally:
+            with self._lock:
+                self._pending_explains -= 1
+
+        entry["explain"] = explain
+        self._logger.info(json.dumps({"type": "explain", "id": entry["id"], "explain": explain}, default=str))
+
+    def _write(self, entry):
+        self._logger.info(json.dumps({"type": "slow_query", **self._public_entry(entry)}, default=str))
+
+    @staticmethod
+    def _public_entry(entry):
+        return {key: value for key, value in entry.items() if key != "owner"}
@@ -0,0 +1,119 @@
+import datetime
+
+class SpreadsheetReader:
+    READ_BATCH_SIZE = 5000
+    NA_VALUES = frozenset({
+        "", "#N/A", "#N/A N/A", "#NA", "N/A", "n/a", "NA", "<NA>", "NULL", "null",
+        "NaN", "-NaN", "nan", "-nan", "None", "#VALUE!", "#DIV/0!", "#REF!", "#NUM!", "#NAME?", "#NULL!",
+    })
+
+    def __init__(self, file, filename):
+        self.file = file
+        self.filename = filename.lower()
+        self._workbook = None
+
+        if self.filename.endswith(".xlsx"):
+            import openpyxl
+            self._workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        elif self.filename.endswith(".xls"):
+            import xlrd
+            if isinstance(file, str):
+                self._workbook = xlrd.open_workbook(file, on_demand=True)
+            else:
+                self._workbook = xlrd.open_workbook(file_contents=file.read(), on_demand=True)
+        else:
+            raise ValueError("Unsupported file format")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._workbook is None:
+            return
+        if self.filename.endswith(".xlsx"):
+            self._workbook.close()
+        else:
+            self._workbook.release_resources()
+        self._workbook = None
+
+    def sheet_names(self):
+        if self.filename.endswith(".xlsx"):
+            return list(self._workbook.sheetnames)
+        return list(self._workbook.sheet_names())
+
+    def iter_batches(self, sheet_name=None, batch_size=None):
+        batch_size = batch_size or self.READ_BATCH_SIZE
+        rows = self._iter_rows(self._resolve_sheet_name(sheet_name))
+
+        header = next(rows, None)
+        if header is None:
+            return [], iter(())
+        while header and header[-1] is None:
+            header = header[:-1]
+        return list(header), self._batch_rows(rows, len(header), batch_size)
+
+    def _resolve_sheet_name(self, sheet_name):
+        sheet_names = self.sheet_names()
+        if not sheet_names:
+            raise ValueError("Workbook has no sheets")
+        if sheet_name is None or sheet_name == "":
+            return sheet_names[0]
+        if sheet_name not in sheet_names:
+            raise ValueError(f"Sheet {sheet_name} Not Found")
+        return sheet_name
+
+    def _batch_rows(self, rows, width, batch_size):
+        batch = []
+        for row in rows:
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            elif len(row) > width:
+                row = row[:width]
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _iter_rows(self, sheet_name):
+        if self.filename.endswith(".xlsx"):
+            values = self._workbook[sheet_name].iter_rows(values_only=True)
+        else:
+            values = self._iter_xls_rows(sheet_name)
+
+        for row in values:
+            row = tuple(self._to_value(value) for value in row)
+            if any(value is not None for value in row):
+                yield row
+
+    def _iter_xls_rows(self, sheet_name):
+        import xlrd
+        sheet = self._workbook.sheet_by_name(sheet_name)
+        try:
+            for row_index in range(sheet.nrows):
+                values = []
+                for cell in sheet.row(row_index):
+                    if cell.ctype == xlrd.XL_CELL_DATE:
+                        values.append(xlrd.xldate_as_datetime(cell.value, self._workbook.datemode))
+                    elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
+                        values.append(bool(cell.value))
+                    elif cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR):
+                        values.append(None)
+                    else:
+                        values.append(cell.value)
+                yield values
+        finally:
+            self._workbook.unload_sheet(sheet_name)
+
+    def _to_value(self, value):
+        if isinstance(value, str):
+            return None if value in self.NA_VALUES else value
+        if isinstance(value, float) and value.is_integer() and abs(value) < 2**53:
+            return int(value)
+        if isinstance(value, datetime.time):
+            return value.isoformat()
+        return value
@@ -0,0 +1,272 @@
+import io
+import re
+import json
+import time
+from .metrics import metrics
+
+class SQLScriptSplitter:
+    DELIMITER_COMMAND = re.compile(r"^\s*DELIMITER\s+(\S+)\s*$", re.IGNORECASE)
+    QUOTE_CHARS = ("'", '"', "`")
+    KEPT_COMMENT_PREFIXES = ("/*!", "/*+")
+    MAX_STATEMENT_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, delimiter=";", max_statement_size=None):
+        self.max_statement_size = max_statement_size or self.MAX_STATEMENT_SIZE
+        self._set_delimiter(delimiter)
+
+    def _set_delimiter(self, delimiter):
+        self.delimiter = delimiter
+        self._token_pattern = re.compile(
+            r"'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'"
+            r'|"[^"\\]*(?:(?:\\.|"")[^"\\]*)*"'
+            r"|`[^`]*(?:``[^`]*)*`"
+            r"|/\*|#|--|'|\"|`|" + re.escape(delimiter),
+            re.DOTALL,
+        )
+        self._quote_patterns = {
+            "'": re.compile(r"(?:[^'\\]|\\.|'')*'", re.DOTALL),
+            '"': re.compile(r'(?:[^"\\]|\\.|"")*"', re.DOTALL),
+            "`": re.compile(r"(?:[^`]|``)*`"),
+        }
+
+    def split(self, lines):
+        buffer = []
+        buffer_size = 0
+        statement_line = None
+        state = None
+
+        for line_number, line in enumerate(lines, 1):
+            if state is None and statement_line is None:
+                match = self.DELIMITER_COMMAND.match(line)
+                if match:
+                    self._set_delimiter(match.group(1))
+                    continue
+
+            chunks = []
+            position = 0
+            segment_start = 0
+            length = len(line)
+            while position < length:
+                if state in self.QUOTE_CHARS:
+                    match = self._quote_patterns[state].match(line, position)
+                    if not match:
+                        break
+                    position = match.end()
+                    state = None
+                    continue
+
+                if state in ("comment", "kept_comment"):
+                    end = line.find("*/", position)
+                    stop = length if end == -1 else end + 2
+                    if state == "comment":
+                        segment_start = stop
+                    if end != -1:
+                        state = None
+                    position = stop
+                    continue
+
+                match = self._token_pattern.search(line, position)
+                if not match:
+                    break
+
+                start = match.start()
+                token = match.group()
+                position = match.end()
+
+                if len(token) > 1 and token[0] in self.QUOTE_CHARS and token[-1] == token[0]:
+                    continue
+                if token in self.QUOTE_CHARS:
+                    state = token
+                elif token == "/*":
+                    if line.startswith(self.KEPT_COMMENT_PREFIXES, start):
+                        state = "kept_comment"
+                    else:
+                        state = "comment"
+                        chunks.append(line[segment_start:start] + " ")
+                elif token == "#" or (token == "--" and line[position:position + 1] in ("", " ", "\t", "\r", "\n")):
+                    chunks.append(line[segment_start:start] + "\n")
+                    segment_start = position = length
+                elif token == self.delimiter:
+                    chunks.append(line[segment_start:start])
+                    statement = "".join(buffer) + "".join(chunks)
+                    if statement.strip():
+                        yield statement_line or line_number, statement
+                    buffer = []
+                    buffer_size = 0
+                    statement_line = None
+                    chunks = []
+                    segment_start = position
+
+            chunks.append(line[segment_start:])
+            text = "".join(chunks)
+            if statement_line is None:
+                if not text.strip():
+                    continue
+                statement_line = line_number
+            buffer.append(text)
+            buffer_size += len(text)
+            if buffer_size > self.max_statement_size:
+                raise ValueError(f"Statement at line {statement_line} exceeds {self.max_statement_size} characters")
+
+        statement = "".join(buffer)
+        if statement.strip():
+            yield statement_line, statement
+
+class SQLScriptService:
+    SCRIPT_BATCH_SIZE = 100
+    REPORT_STATEMENT_PREVIEW = 200
+    IMPLICIT_COMMIT_DIALECTS = ("mysql",)
+    IMPLICIT_COMMIT_PATTERN = re.compile(
+        r"^\s*(?:/\*!\d*\s*)?(?:"
+        r"(?:CREATE|DROP)\s+(?!TEMPORARY\b)|ALTER\s|RENAME\s|TRUNCATE\s|"
+        r"(?:LOCK|UNLOCK)\s+(?:TABLES?|INSTANCE)\b|GRANT\s|REVOKE\s|SET\s+PASSWORD\b|"
+        r"(?:ANALYZE|CHECK|OPTIMIZE|REPAIR)\s+(?:NO_WRITE_TO_BINLOG\s+|LOCAL\s+)?TABLE\b|"
+        r"(?:BEGIN|COMMIT|START\s+TRANSACTION)\b|FLUSH\s|LOAD\s+(?:DATA|XML|INDEX)\b|CACHE\s+INDEX\b|"
+        r"(?:INSTALL|UNINSTALL)\s+PLUGIN\b)",
+        re.IGNORECASE,
+    )
+
+    def __init__(self, db_engine, progress=None):
+        self.db_engine = db_engine
+        self.progress = progress
+        self.statements_executed = 0
+        self.statements_committed = 0
+        self.statements_failed = 0
+        self.batches_committed = 0
+        self.elapsed_seconds = 0.0
+
+    def _report_progress(self, **counts):
+        if self.progress is not None:
+            self.progress.update(**counts)
+
+    @metrics.instrument("script")
+    def execute_script(self, file, report_path=None, batch_size=None, continue_on_error=False, encoding="utf-8-sig"):
+        if not self.db_engine:
+            return "Failed: No Active DB Connection"
+
+        if not file:
+            return "Failed: Undefined SQL File"
+
+        batch_size = batch_size or self.SCRIPT_BATCH_SIZE
+        lines = io.TextIOWrapper(file, encoding=encoding, newline="")
+        report = open(report_path, "w", encoding="utf-8") if report_path else None
+        start_time = time.perf_counter()
+
+        try:
+            statements = SQLScriptSplitter().split(lines)
+            with self.db_engine.connect() as c:
+                c = c.execution_options(no_parameters=True)
+                transaction = None
+                pending = pending_succeeded = 0
+                try:
+                    for line_number, statement in statements:
+                        if self._commits_implicitly(c.dialect.name, statement):
+                            if transaction is not None:
+                                transaction.commit()
+                                transaction = None
+                                self._commit_batch(pending_succeeded)
+                                pending = pending_succeeded = 0
+
+                            with c.begin():
+                                error_message = self._execute_statement(c, line_number, statement, report, False)
+                            if error_message and not continue_on_error:
+                                self.elapsed_seconds = time.perf_counter() - start_time
+                                return f"Failed: Statement at line {line_number} - {error_message} ({self._committed_summary()})"
+                            if not error_message:
+                                self._commit_batch(1)
+                            continue
+
+                        if transaction is None:
+                            transaction = c.begin()
+
+                        error_message = self._execute_statement(c, line_number, statement, report, continue_on_error)
+                        if error_message and not continue_on_error:
+                            transaction.rollback()
+                            transaction = None
+                            self.elapsed_seconds = time.perf_counter() - start_time
+                            return f"Failed: Statement at line {line_number} - {error_message} ({self._committed_summary()})"
+
+                        pending += 1
+                        if not error_message:
+                            pending_succeeded += 1
+                        if pending >= batch_size:
+                            transaction.commit()
+                            transaction = None
+                            self._commit_batch(pending_succeeded)
+                            pending = pending_succeeded = 0
+
+                    if transaction is not None:
+                        transaction.commit()
+                        transaction = None
+                        self._commit_batch(pending_succeeded)
+                finally:
+                    if transaction is not None:
+                        transaction.rollback()
+
+            self.elapsed_seconds = time.perf_counter() - start_time
+            if self.statements_failed:
+                return f"Succeed: {self._committed_summary()} with {self.statements_failed} Failed Statement(s)"
+            return f"Succeed: {self._committed_summary()}"
+        except Exception as e:
+            self.elapsed_seconds = time.perf_counter() - start_time
+            return f"Failed: {self._clean_error(e)} ({self._committed_summary()})"
+        finally:
+            lines.detach()
+            if report:
+                report.close()
+
+    def _commits_implicitly(self, dialect_name, statement):
+        return dialect_name in self.IMPLICIT_COMMIT_DIALECTS and bool(self.IMPLICIT_COMMIT_PATTERN.match(statement))
+
+    def _execute_statement(self, c, line_number, statement, report, savepoint):
+        statement_start = time.perf_counter()
+        error_message = None
+        try:
+            if savepoint:
+                with c.begin_nested():
+                    c.exec_driver_sql(statement)
+            else:
+                c.exec_driver_sql(statement)
+            self.statements_executed += 1
+        except Exception as e:
+            self.statements_failed += 1
+            error_message = self._clean_error(e)
+
+        elapsed_ms = (time.perf_counter() - statement_start) * 1000
+        if report:
+            report.write(json.dumps({
+                "line": line_number,
+                "status": "error" if error_message else "ok",
+                "elapsed_ms": round(elapsed_ms, 3),
+                "error": error_message,
+                "statement": " ".join(statement[:self.REPORT_STATEMENT_PREVIEW].split()),
+            }, ensure_ascii=False) + "\n")
+        self._report_progress(statements=1)
+        return error_message
+
+    def _commit_batch(self, statement_count):
+        self.statements_committed += statement_count
+        self.batches_committed += 1
+
+    def _committed_summary(self):
+        return (
+            f"Committed {self.statements_committed} Statement(s) in {self.batches_committed} Batch(es) "
+            f"in {self.elapsed_seconds:.2f}s"
+        )
+
+    def _clean_error(self, e):
+        error_message = str(getattr(e, "orig", None) or e)
+
+        if "(pymysql.err.OperationalError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.OperationalError)", "")
+
+        if "(pymysql.err.ProgrammingError)" in error_message:
+            error_message = error_message.replace("(pymysql.err.ProgrammingError) ", "")
+
+        if "(Background on this error at: https://sqlalche.me/e/20/e3q8)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/e3q8)", "")
+
+        if "(Background on this error at: https://sqlalche.me/e/20/f405)" in error_message:
+            error_message = error_message.replace("(Background on this error at: https://sqlalche.me/e/20/f405)", "")
+
+        return error_message.strip()
@@ -19,9 +19,9 @@ class TableCreationService:
         ("CHARACTER SET", "characterSetValueInput", "CHARACTER SET {}")
     ]
     
-    def __init__(self, db_engine):
+    def __init__(self, db_engine, schema_cache=None):
         self.db_engine = db_engine
-        self.fk_validator = ForeignKeyValidator(db_engine)
+        self.fk_validator = ForeignKeyValidator(db_engine, schema_cache)
 
     def create_table_with_constraints(self, table_name, column_names, column_types, form_data):
         if not table_name or not column_names or not column_types:
@@ -1,31 +1,34 @@
 from sqlalchemy import inspect, text
+from .metrics import metrics
+from .cursor_codec import CursorCodec
 
 class TableInfoService:
-    def __init__(self, db_engine):
+    DEFAULT_PAGE_SIZE = 500
+    MAX_PAGE_SIZE = 5000
+
+    def __init__(self, db_engine, schema_cache=None):
         self.db_engine = db_engine
+        self.schema_cache = schema_cache
 
     def get_db_info(self):
         if not self.db_engine:
             return {"db_status": "Unconnected", "status_class": "fail", "tables": []}
 
-        inspector = inspect(self.db_engine)
+        inspector = self._inspector()
         tables = inspector.get_table_names()
         return {"db_status": "Connected", "status_class": "success", "tables": tables}
 
-    def get_table_data(self, table_name):
+    @metrics.instrument("table_data")
+    def get_table_data(self, table_name, page_size=None, cursor=None):
         if not self.db_engine:
             return None
 
+        page_size = max(1, min(int(page_size or self.DEFAULT_PAGE_SIZE), self.MAX_PAGE_SIZE))
         with self.db_engine.connect() as c:
-            query = f"SELECT * FROM {table_name}"
-            output = c.execute(text(query))
-            rows = []
-            column_names = output.keys()
-            for row in output.fetchall():
-                row_dict = dict(zip(column_names, row))
-                rows.append(row_dict)
-            
-            column_names_query = f"SELECT COLUMN_NAME, DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_NAME = '{table_name}' ORDER BY ORDINAL_POSITION"
+            output, next_cursor = self._fetch_page(c, table_name, page_size, cursor)
+            rows = [tuple(row) for row in output]
+
+            column_names_query = f"SELECT COLUMN_NAME, DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{table_name}' ORDER BY ORDINAL_POSITION"
             column_names_output = c.execute(text(column_names_query))
             column_names = []
             column_types = []
@@ -34,10 +37,53 @@ class TableInfoService:
                 column_type = row[1]
                 column_names.append(column_name)
                 column_types.append(column_type)
-                
-        return {
-            "table_name": table_name, 
-            "column_names": column_names, 
-            "column_types": column_types, 
-            "rows": rows
-        } 
\ No newline at end of file
+
+        result = {
+            "table_name": table_name,
+            "column_names": column_names,
+            "column_types": column_types,
+            "rows": rows,
+            "page_size": page_size,
+            "next_cursor": next_cursor
+        }
+        return result
+
+    def _fetch_page(self, c, table_name, page_size, cursor):
+        state = CursorCodec.decode(cursor)
+        primary_keys = self._inspector().get_pk_constraint(table_name).get("constrained_columns", [])
+        params = {"limit": page_size + 1}
+
+        if primary_keys:
+            key_columns = ", ".join(primary_keys)
+            query = f"SELECT * FROM {table_name}"
+            last_key = state.get("key")
+            if last_key is not None:
+                if not isinstance(last_key, list) or len(last_key) != len(primary_keys):
+                    raise ValueError("Invalid Cursor")
+                key_binds = ", ".join(f":key_{i}" for i in range(len(primary_keys)))
+                query += f" WHERE ({key_columns}) > ({key_binds})"
+                params.update({f"key_{i}": value for i, value in enumerate(last_key)})
+            query += f" ORDER BY {key_columns} LIMIT :limit"
+        else:
+            offset = state.get("offset", 0)
+            if not isinstance(offset, int) or offset < 0:
+                raise ValueError("Invalid Cursor")
+            params["offset"] = offset
+            query = f"SELECT * FROM {table_name} LIMIT :limit OFFSET :offset"
+
+        rows = c.execute(text(query), params).fetchall()
+        if len(rows) <= page_size:
+            return rows, None
+
+        rows = rows[:page_size]
+        if primary_keys:
+            last_row = rows[-1]._mapping
+            next_state = {"key": [last_row[key] for key in primary_keys]}
+        else:
+            next_state = {"offset": offset + page_size}
+        return rows, CursorCodec.encode(next_state)
+
+    def _inspector(self):
+        if self.schema_cache is not None:
+            return self.schema_cache
+        return inspect(self.db_engine)
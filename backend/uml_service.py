@@ -1,9 +1,41 @@
-from sqlalchemy import inspect
+import re
+from collections import defaultdict
+from sqlalchemy import bindparam, inspect, text
+from .metrics import metrics
 
 class UMLService:
-    def __init__(self, db_engine):
+    FOREIGN_KEYS_QUERY = """
+        SELECT kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.COLUMN_NAME,
+               kcu.REFERENCED_TABLE_NAME, kcu.REFERENCED_COLUMN_NAME
+        FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+        JOIN INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+          ON rc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA
+         AND rc.TABLE_NAME = kcu.TABLE_NAME
+         AND rc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+        WHERE kcu.TABLE_SCHEMA = DATABASE()
+        ORDER BY kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
+    """
+    COLUMNS_QUERY = """
+        SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_DEFAULT, EXTRA
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :tables
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    """
+    INDEXES_QUERY = """
+        SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE, COLUMN_NAME
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :tables
+        ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+    """
+    COLUMN_TYPE_PATTERN = re.compile(r"^(\w+)(?:\((.*)\))?((?: +\w+)*)$")
+    ENUM_VALUE_PATTERN = re.compile(r"'((?:''|[^'])*)'")
+    TIMESTAMP_DEFAULT_PATTERN = re.compile(r"^(?:CURRENT_TIMESTAMP|NOW|LOCALTIME|LOCALTIMESTAMP)(?:\(\d*\))?$", re.I)
+
+    def __init__(self, db_engine, schema_cache=None):
         self.db_engine = db_engine
+        self.schema_cache = schema_cache
 
+    @metrics.instrument("uml")
     def generate_uml(self, start_table):
         if not self.db_engine:
             return "Failed: No Active DB Connection", None
@@ -11,16 +43,18 @@ class UMLService:
         if not start_table:
             return "Failed: Undefined Table Name", None
 
-        inspector = inspect(self.db_engine)
+        inspector = self.schema_cache if self.schema_cache is not None else inspect(self.db_engine)
         all_tables = inspector.get_table_names()
         if start_table not in all_tables:
             return f"Failed: Table {start_table} Unexist", None
 
-        visited_tables, edges = self._gather_related_tables(inspector, start_table)
+        foreign_keys = self._load_foreign_keys(inspector, all_tables)
+        visited_tables, edges = self._gather_related_tables(foreign_keys, all_tables, start_table)
+        table_metadata = self._load_table_metadata(inspector, sorted(visited_tables))
 
         full_uml_lines = []
         for tbl in sorted(visited_tables):
-            table_uml = self._generate_table_uml(inspector, tbl)
+            table_uml = self._generate_table_uml(tbl, table_metadata[tbl], foreign_keys.get(tbl, []))
             full_uml_lines.extend(table_uml)
             full_uml_lines.append("")
 
@@ -37,66 +71,171 @@ class UMLService:
         uml_text = "\n".join(full_uml_lines)
         return "Succeed: ERD Generated", uml_text
 
-    def _gather_related_tables(self, inspector, start_table):
+    def _is_mysql(self):
+        return self.db_engine.dialect.name == "mysql"
+
+    def _load_foreign_keys(self, inspector, all_tables):
+        if not self._is_mysql():
+            return {table: inspector.get_foreign_keys(table) for table in all_tables}
+
+        foreign_keys = defaultdict(list)
+        constraints = {}
+        with self.db_engine.connect() as c:
+            for table, constraint, column, referred_table, referred_column in c.execute(text(self.FOREIGN_KEYS_QUERY)):
+                fk = constraints.get((table, constraint))
+                if fk is None:
+                    fk = {
+                        "name": constraint,
+                        "constrained_columns": [],
+                        "referred_table": referred_table,
+                        "referred_columns": [],
+                    }
+                    constraints[(table, constraint)] = fk
+                    foreign_keys[table].append(fk)
+                fk["constrained_columns"].append(column)
+                fk["referred_columns"].append(referred_column)
+        return foreign_keys
+
+    def _gather_related_tables(self, foreign_keys, all_tables, start_table):
+        incoming = defaultdict(list)
+        for child_table in all_tables:
+            for fk in foreign_keys.get(child_table, []):
+                parent_table = fk.get("referred_table")
+                if parent_table:
+                    incoming[parent_table].append((child_table, fk))
+
         visited = set()
         edges = []
         seen_edges = set()
 
-        def dfs(table):
-            if table in visited:
-                return
-            visited.add(table)
+        def add_edge(child_table, parent_table, fk):
+            edge_key = (
+                child_table,
+                parent_table,
+                tuple(fk.get("constrained_columns", [])),
+                tuple(fk.get("referred_columns", []))
+            )
+            if edge_key not in seen_edges:
+                seen_edges.add(edge_key)
+                edges.append((child_table, parent_table, fk))
 
-            for fk in inspector.get_foreign_keys(table):
+        def neighbours(table):
+            for fk in foreign_keys.get(table, []):
                 parent_table = fk.get("referred_table")
                 if parent_table:
-                    edge_key = (
-                        table,
-                        parent_table,
-                        tuple(fk.get("constrained_columns", [])),
-                        tuple(fk.get("referred_columns", []))
-                    )
-                    if edge_key not in seen_edges:
-                        seen_edges.add(edge_key)
-                        edges.append((table, parent_table, fk))
-                    if parent_table not in visited:
-                        dfs(parent_table)
-            
-            all_tables = inspector.get_table_names()
-            for other_table in all_tables:
-                if other_table == table:
+                    add_edge(table, parent_table, fk)
+                    yield parent_table
+
+            for child_table, fk in incoming.get(table, []):
+                if child_table == table:
                     continue
-                for fk in inspector.get_foreign_keys(other_table):
-                    if fk.get("referred_table") == table:
-                        edge_key = (
-                            other_table,
-                            table,
-                            tuple(fk.get("constrained_columns", [])),
-                            tuple(fk.get("referred_columns", []))
-                        )
-                        if edge_key not in seen_edges:
-                            seen_edges.add(edge_key)
-                            edges.append((other_table, table, fk))
-                        if other_table not in visited:
-                            dfs(other_table)
-
-        dfs(start_table)
+                add_edge(child_table, table, fk)
+                yield child_table
+
+        visited.add(start_table)
+        stack = [neighbours(start_table)]
+        while stack:
+            table = next(stack[-1], None)
+            if table is None:
+                stack.pop()
+            elif table not in visited:
+                visited.add(table)
+                stack.append(neighbours(table))
+
         return visited, edges
 
-    def _generate_table_uml(self, inspector, table_name):
-        columns = inspector.get_columns(table_name)
-        pk_constraint = inspector.get_pk_constraint(table_name)
-        primary_keys = set(pk_constraint.get("constrained_columns", []))
-        foreign_keys = inspector.get_foreign_keys(table_name)
-        unique_indexes = {
-            col
-            for idx in inspector.get_indexes(table_name)
-            if idx.get("unique")
-            for col in idx.get("column_names", [])
+    def _load_table_metadata(self, inspector, tables):
+        if not self._is_mysql():
+            table_metadata = {}
+            for table in tables:
+                table_metadata[table] = {
+                    "columns": [
+                        {
+                            "name": col["name"],
+                            "type": str(col["type"]),
+                            "nullable": col.get("nullable", True),
+                            "default": col.get("default"),
+                        }
+                        for col in inspector.get_columns(table)
+                    ],
+                    "primary_keys": set(inspector.get_pk_constraint(table).get("constrained_columns", [])),
+                    "unique_columns": {
+                        col
+                        for idx in inspector.get_indexes(table)
+                        if idx.get("unique")
+                        for col in idx.get("column_names", [])
+                    },
+                }
+            return table_metadata
+
+        table_metadata = {
+            table: {"columns": [], "primary_keys": set(), "unique_columns": set()}
+            for table in tables
         }
+        if not tables:
+            return table_metadata
+
+        with self.db_engine.connect() as c:
+            columns_query = text(self.COLUMNS_QUERY).bindparams(bindparam("tables", expanding=True))
+            for table, column, column_type, is_nullable, default, extra in c.execute(columns_query, {"tables": tables}):
+                table_metadata[table]["columns"].append({
+                    "name": column,
+                    "type": self._mysql_column_type(column_type),
+                    "nullable": is_nullable == "YES",
+                    "default": self._mysql_column_default(default, extra or ""),
+                })
+
+            indexes_query = text(self.INDEXES_QUERY).bindparams(bindparam("tables", expanding=True))
+            for table, index_name, non_unique, column in c.execute(indexes_query, {"tables": tables}):
+                if index_name == "PRIMARY":
+                    table_metadata[table]["primary_keys"].add(column)
+                elif not int(non_unique):
+                    table_metadata[table]["unique_columns"].add(column)
+
+        return table_metadata
+
+    def _mysql_column_type(self, column_type):
+        match = self.COLUMN_TYPE_PATTERN.match(column_type.strip())
+        type_class = self.db_engine.dialect.ischema_names.get(match.group(1).lower()) if match else None
+        if type_class is None:
+            return column_type.upper()
+
+        type_name, args, options = match.groups()
+        options = options.lower().split()
+        type_args = []
+        if args and args.startswith("'"):
+            type_args = [value.replace("''", "'") for value in self.ENUM_VALUE_PATTERN.findall(args)]
+        elif args:
+            type_args = [int(value) for value in re.findall(r"\d+", args)]
+
+        type_kwargs = {option: True for option in ("unsigned", "zerofill") if option in options}
+        if type_name.lower() in ("datetime", "time", "timestamp") and type_args:
+            type_kwargs["fsp"] = type_args.pop(0)
+
+        try:
+            return str(type_class(*type_args, **type_kwargs))
+        except Exception:
+            return column_type.upper()
+
+    def _mysql_column_default(self, default, extra):
+        if default is None:
+            return None
+
+        if self.TIMESTAMP_DEFAULT_PATTERN.match(default):
+            on_update = re.search(r"on update (\S+)", extra, re.I)
+            return f"{default} ON UPDATE {on_update.group(1)}" if on_update else default
+        if "DEFAULT_GENERATED" in extra.upper():
+            return f"({default})"
+        if re.match(r"^[bx]'", default, re.I):
+            return default
+        return "'" + default.replace("'", "''") + "'"
+
+    def _generate_table_uml(self, table_name, metadata, foreign_keys):
+        primary_keys = metadata["primary_keys"]
+        unique_indexes = metadata["unique_columns"]
 
         content_lines = [table_name]
-        for col in columns:
+        for col in metadata["columns"]:
             line = col["name"]
 
             if col["name"] in primary_keys:
@@ -116,7 +255,7 @@ class UMLService:
             if default_value is not None:
                 line += f" (DF:{default_value})"
 
-            line += f" : {str(col['type'])}"
+            line += f" : {col['type']}"
             content_lines.append(line)
 
         max_line_length = max(len(line) for line in content_lines)
@@ -129,4 +268,4 @@ class UMLService:
         for line in content_lines[1:]:
             uml_lines.append(f"| {line.ljust(box_width - 3)}|")
         uml_lines.append(border)
-        return uml_lines 
\ No newline at end of file
+        return uml_lines
@@ -0,0 +1,422 @@
+import os
+import io
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, event, text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.file_service import FileService
+from backend.table_info_service import TableInfoService
+from backend.uml_service import UMLService
+from backend.request_handler import RequestHandler
+from backend.queries.drop_table import DropTableQuery
+from backend.queries.update_data import UpdateDataQuery
+from backend.queries.bulk_update_data import BulkUpdateDataQuery
+
+DEFAULT_SIZES = (10000, 100000, 1000000)
+DEFAULT_BENCHMARKS = ("import_csv", "import_xlsx", "export_excel", "table_data", "bulk_update", "uml", "parse_insert_data", "startup")
+STARTUP_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app
+import_seconds = time.perf_counter() - start
+try:
+    with open("/proc/self/status") as status:
+        max_rss_mb = next(int(line.split()[1]) for line in status if line.startswith("VmHWM:")) / 1024
+except (OSError, StopIteration):
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+print(json.dumps({
+    "import_seconds": import_seconds,
+    "max_rss_mb": max_rss_mb,
+    "heavy_modules": sorted(name for name in ("pandas", "numpy", "chardet", "openpyxl", "vertexai", "grpc") if name in sys.modules),
+}))
+"""
+
+class BenchmarkUpload(io.BytesIO):
+    def __init__(self, data, filename):
+        super().__init__(data)
+        self.filename = filename
+
+class SQLiteStandIn:
+    def __init__(self, directory):
+        self.path = os.path.join(directory, "benchmark.sqlite")
+        self.information_schema_path = os.path.join(directory, "information_schema.sqlite")
+        self.engine = create_engine(f"sqlite:///{self.path}")
+        event.listen(self.engine, "connect", self._on_connect)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        dbapi_connection.create_function("DATABASE", 0, lambda: "main")
+        dbapi_connection.execute(f"ATTACH DATABASE '{self.information_schema_path}' AS INFORMATION_SCHEMA")
+
+    def refresh_information_schema(self):
+        connection = sqlite3.connect(self.path)
+        try:
+            tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+            columns = [
+                ("main", table, column[1], column[2].split("(")[0].lower(), column[0] + 1)
+                for table in tables
+                for column in connection.execute(f"PRAGMA table_info('{table}')")
+            ]
+        finally:
+            connection.close()
+
+        connection = sqlite3.connect(self.information_schema_path)
+        try:
+            connection.execute("DROP TABLE IF EXISTS COLUMNS")
+            connection.execute(
+                "CREATE TABLE COLUMNS (TABLE_SCHEMA TEXT, TABLE_NAME TEXT, COLUMN_NAME TEXT, DATA_TYPE TEXT, ORDINAL_POSITION INTEGER)"
+            )
+            connection.executemany("INSERT INTO COLUMNS VALUES (?, ?, ?, ?, ?)", columns)
+            connection.commit()
+        finally:
+            connection.close()
+
+class BenchmarkRunner:
+    def __init__(self, engine, stand_in=None, repeat=3, seed=42):
+        self.engine = engine
+        self.stand_in = stand_in
+        self.repeat = repeat
+        self.seed = seed
+        self.results = []
+        self._datasets = {}
+
+    def run(self, benchmarks, sizes):
+        for size in sizes:
+            if "import_csv" in benchmarks:
+                self.bench_import(size, "csv")
+            if "import_xlsx" in benchmarks:
+                self.bench_import(size, "xlsx")
+            if {"export_excel", "table_data", "bulk_update"} & set(benchmarks):
+                table_name = self.load_table(size)
+                if "export_excel" in benchmarks:
+                    self.bench_export_excel(table_name, size)
+                if "table_data" in benchmarks:
+                    self.bench_table_data(table_name, size)
+                if "bulk_update" in benchmarks:
+                    self.bench_bulk_update(table_name, size)
+            if "parse_insert_data" in benchmarks:
+                self.bench_parse_insert_data(size)
+        if "uml" in benchmarks:
+            self.bench_uml(500)
+        if "startup" in benchmarks:
+            self.bench_startup()
+        return self.results
+
+    def dataset(self, size):
+        if size not in self._datasets:
+            rng = np.random.default_rng(self.seed)
+            self._datasets[size] = pd.DataFrame({
+                "id": np.arange(1, size + 1),
+                "name": [f"name_{value}" for value in rng.integers(0, 1000000, size)],
+                "amount": np.round(rng.random(size) * 10000, 2),
+                "quantity": rng.integers(0, 1000, size),
+                "created_at": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 86400 * 365, size), unit="s"),
+                "active": rng.integers(0, 2, size).astype(bool),
+            })
+        return self._datasets[size]
+
+    def encode_dataset(self, size, file_format):
+        df = self.dataset(size)
+        buffer = io.BytesIO()
+        if file_format == "csv":
+            df.to_csv(buffer, index=False, date_format="%Y-%m-%d %H:%M:%S")
+        else:
+            df.to_excel(buffer, index=False, engine="xlsxwriter")
+        return buffer.getvalue()
+
+    def load_table(self, size):
+        table_name = f"bench_rows_{size}"
+        DropTableQuery(self.engine, table_name).execute()
+        message, _ = FileService(self.engine).import_excel_to_table(
+            table_name, BenchmarkUpload(self.encode_dataset(size, "csv"), f"{table_name}.csv")
+        )
+        if "Failed" in message:
+            raise RuntimeError(message)
+        if self.engine.dialect.name == "sqlite":
+            self._add_sqlite_primary_key(table_name)
+        else:
+            with self.engine.connect() as c:
+                c.execute(text(f"ALTER TABLE {table_name} ADD PRIMARY KEY (id)"))
+                c.commit()
+        self.refresh_schema()
+        return table_name
+
+    def _add_sqlite_primary_key(self, table_name):
+        with self.engine.connect() as c:
+            columns = c.execute(text(f"PRAGMA table_info('{table_name}')")).fetchall()
+            definitions = ", ".join(
+                f"{column[1]} {column[2]}" + (" PRIMARY KEY" if column[1] == "id" else "") for column in columns
+            )
+            c.execute(text(f"ALTER TABLE {table_name} RENAME TO {table_name}_old"))
+            c.execute(text(f"CREATE TABLE {table_name} ({definitions})"))
+            c.execute(text(f"INSERT INTO {table_name} SELECT * FROM {table_name}_old"))
+            c.execute(text(f"DROP TABLE {table_name}_old"))
+            c.commit()
+
+    def refresh_schema(self):
+        if self.stand_in is not None:
+            self.stand_in.refresh_information_schema()
+
+    def measure(self, name, size, func, setup=None, teardown=None, rows=None, **extra):
+        timings = []
+        for _ in range(self.repeat):
+            state = setup() if setup else None
+            start = time.perf_counter()
+            outcome = func(state)
+            timings.append(time.perf_counter() - start)
+            if isinstance(outcome, str) and outcome.startswith("Failed"):
+                raise RuntimeError(f"{name} ({size}): {outcome}")
+            if teardown:
+                teardown(state)
+
+        median = statistics.median(timings)
+        result = {
+            "benchmark": name,
+            "size": size,
+            "repeat": self.repeat,
+            "min_seconds": round(min(timings), 6),
+            "median_seconds": round(median, 6),
+            "mean_seconds": round(statistics.fmean(timings), 6),
+            "max_seconds": round(max(timings), 6),
+            "rows_per_second": round((rows if rows is not None else size) / median, 1) if median and (rows or size) else None,
+            **extra,
+        }
+        self.results.append(result)
+        print(f"{name:<32} {size:>9} rows  median {median:9.4f}s  min {min(timings):9.4f}s", flush=True)
+        return result
+
+    def bench_import(self, size, file_format):
+        payload = self.encode_dataset(size, file_format)
+        table_name = f"bench_import_{file_format}_{size}"
+
+        def setup():
+            DropTableQuery(self.engine, table_name).execute()
+            return BenchmarkUpload(payload, f"{table_name}.{file_format}")
+
+        def run(upload):
+            message, _ = FileService(self.engine).import_excel_to_table(table_name, upload)
+            return message
+
+        self.measure(
+            f"import_{file_format}", size, run, setup,
+            teardown=lambda upload: DropTableQuery(self.engine, table_name).execute(),
+            payload_bytes=len(payload),
+        )
+
+    def bench_export_excel(self, table_name, size):
+        for file_format in FileService.EXPORT_FORMATS:
+            def run(state, file_format=file_format):
+                chunks, message = FileService(self.engine).export_table_stream(table_name, file_format)
+                for _ in chunks or ():
+                    pass
+                return message
+
+            self.measure(f"export_table_stream_{file_format}", size, run)
+
+    def bench_table_data(self, table_name, size, page_size=500):
+        service = TableInfoService(self.engine)
+        self.measure(
+            "get_table_data_default_page", size, lambda state: service.get_table_data(table_name),
+            rows=TableInfoService.DEFAULT_PAGE_SIZE, page_size=TableInfoService.DEFAULT_PAGE_SIZE,
+        )
+        self.measure(
+            "get_table_data_first_page", size, lambda state: service.get_table_data(table_name, page_size),
+            rows=page_size, page_size=page_size,
+        )
+
+        def walk_pages(state):
+            cursor = None
+            while True:
+                result = service.get_table_data(table_name, page_size, cursor)
+                cursor = result["next_cursor"]
+                if not cursor:
+                    return None
+
+        self.measure("get_table_data_paginated_scan", size, walk_pages, page_size=page_size)
+
+    def bench_bulk_update(self, table_name, size, per_row_sample=1000):
+        sample = min(size, per_row_sample)
+
+        def update_per_row(state):
+            for key in range(1, sample + 1):
+                message, _ = UpdateDataQuery(
+                    self.engine, table_name, "id", str(key), ["quantity"], [str(key % 1000)]
+                ).execute()
+                if "Failed" in message:
+                    return message
+            return None
+
+        self.measure("update_data_per_row", sample, update_per_row, rows=sample)
+
+        updates = [(key, {"quantity": key % 997, "name": f"bulk_{key}"}) for key in range(1, size + 1)]
+
+        def update_bulk(state):
+            message, _ = BulkUpdateDataQuery(self.engine, table_name, "id", updates).execute()
+            return message
+
+        self.measure("bulk_update_data", size, update_bulk)
+
+    def bench_uml(self, table_count, fan_out=3):
+        rng = random.Random(self.seed)
+        tables = [f"bench_uml_{index}" for index in range(table_count)]
+        with self.engine.connect() as c:
+            for table_name in reversed(tables):
+                c.execute(text(f"DROP TABLE IF EXISTS {table_name}"))
+            for index, table_name in enumerate(tables):
+                parents = rng.sample(range(index), min(index, rng.randint(0, fan_out)))
+                columns = ["id INTEGER PRIMARY KEY", "label VARCHAR(64)", "created_at DATETIME"]
+                columns += [f"parent_{parent}_id INTEGER" for parent in parents]
+                columns += [
+                    f"FOREIGN KEY (parent_{parent}_id) REFERENCES {tables[parent]}(id)" for parent in parents
+                ]
+                c.execute(text(f"CREATE TABLE {table_name} ({', '.join(columns)})"))
+            c.commit()
+        self.refresh_schema()
+
+        self.measure(
+            "generate_uml_root", table_count,
+            lambda state: UMLService(self.engine).generate_uml(tables[0])[0], rows=table_count,
+        )
+        self.measure(
+            "generate_uml_leaf", table_count,
+            lambda state: UMLService(self.engine).generate_uml(tables[-1])[0], rows=table_count,
+        )
+
+        with self.engine.connect() as c:
+            for table_name in reversed(tables):
+                c.execute(text(f"DROP TABLE IF EXISTS {table_name}"))
+            c.commit()
+        self.refresh_schema()
+
+    def bench_parse_insert_data(self, size, column_count=6):
+        df = self.dataset(size)
+        column_names = list(df.columns[:column_count])
+        column_values = [",".join(str(value) for value in df[column]) for column in column_names]
+        self.measure(
+            "parse_insert_data", size,
+            lambda state: RequestHandler.parse_insert_data(column_names, column_values) and None,
+        )
+
+    def bench_startup(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = {
+            **os.environ,
+            "GCP_PROJECT_ID": os.environ.get("GCP_PROJECT_ID", "benchmark"),
+            "GCP_CREDENTIALS_PATH": os.environ.get("GCP_CREDENTIALS_PATH", "benchmark.json"),
+            "SECRET_KEY": os.environ.get("SECRET_KEY", "benchmark"),
+            "SLOW_QUERY_LOG_PATH": "",
+        }
+        probes = []
+
+        def spawn(state):
+            completed = subprocess.run(
+                [sys.executable, "-c", STARTUP_PROBE], cwd=root, env=env, capture_output=True, text=True
+            )
+            if completed.returncode != 0:
+                return f"Failed: {completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else completed.returncode}"
+            probes.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+        result = self.measure("startup", 0, spawn)
+        result["median_import_seconds"] = round(statistics.median(probe["import_seconds"] for probe in probes), 6)
+        result["max_rss_mb"] = round(max(probe["max_rss_mb"] for probe in probes), 1)
+        result["heavy_modules"] = probes[-1]["heavy_modules"]
+        print(f"{'startup import':<32} median {result['median_import_seconds']:.4f}s  max RSS {result['max_rss_mb']} MB  heavy modules {result['heavy_modules'] or 'none'}")
+
+def environment_metadata(engine):
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "dialect": engine.dialect.name,
+    }
+
+def compare_results(current, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(item["benchmark"], item["size"]): item for item in json.load(f)["results"]}
+
+    comparison = []
+    for item in current:
+        previous = baseline.get((item["benchmark"], item["size"]))
+        if not previous:
+            continue
+        ratio = item["median_seconds"] / previous["median_seconds"] if previous["median_seconds"] else None
+        comparison.append({
+            "benchmark": item["benchmark"],
+            "size": item["size"],
+            "baseline_median_seconds": previous["median_seconds"],
+            "median_seconds": item["median_seconds"],
+            "ratio": round(ratio, 3) if ratio else None,
+        })
+        print(f"{item['benchmark']:<32} {item['size']:>9} rows  x{ratio:.3f} vs baseline" if ratio else item["benchmark"])
+    return comparison
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark EZDB backend hot paths.")
+    parser.add_argument("--db-url", help="SQLAlchemy URL of a disposable database. Defaults to a temporary SQLite file.")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES))
+    parser.add_argument("--benchmarks", default=",".join(DEFAULT_BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Result file. Defaults to benchmarks/results/<timestamp>.json.")
+    parser.add_argument("--compare", help="Earlier result file to compare medians against.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    benchmarks = [name.strip() for name in args.benchmarks.split(",") if name.strip()]
+    unknown = set(benchmarks) - set(DEFAULT_BENCHMARKS)
+    if unknown:
+        raise SystemExit(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory(prefix="ezdb-bench-") as directory:
+        stand_in = None
+        if args.db_url:
+            engine = create_engine(args.db_url)
+        else:
+            stand_in = SQLiteStandIn(directory)
+            engine = stand_in.engine
+
+        try:
+            runner = BenchmarkRunner(engine, stand_in, args.repeat, args.seed)
+            results = runner.run(benchmarks, sizes)
+            report = {"metadata": environment_metadata(engine), "results": results}
+            if args.compare:
+                report["comparison"] = compare_results(results, args.compare)
+        finally:
+            engine.dispose()
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results", time.strftime("%Y%m%d-%H%M%S") + ".json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {output}")
+
+if __name__ == "__main__":
+    main()
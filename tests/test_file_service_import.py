@@ -0,0 +1,98 @@
+import io
+from sqlalchemy import text
+from backend.file_service import FileService
+
+class Upload(io.BytesIO):
+    def __init__(self, content, filename="data.csv"):
+        super().__init__(content.encode("utf-8"))
+        self.filename = filename
+
+class BatchRecorder:
+    def __init__(self):
+        self.batches = []
+
+    def update(self, **counts):
+        if "rows" in counts:
+            self.batches.append(counts["rows"])
+
+def csv_content(rows, header="id,name"):
+    return "\n".join([header, *rows]) + "\n"
+
+def table_rows(db_engine, table_name):
+    with db_engine.connect() as c:
+        return c.execute(text(f"SELECT * FROM {table_name}")).fetchall()
+
+def column_types(db_engine, table_name):
+    with db_engine.connect() as c:
+        return {row[1]: row[2] for row in c.execute(text(f"PRAGMA table_info({table_name})"))}
+
+def test_import_splits_rows_into_batches(db_engine):
+    progress = BatchRecorder()
+    file_service = FileService(db_engine, progress)
+    rows = [f"{i},name{i}" for i in range(23)]
+
+    message, _ = file_service.import_excel_to_table("people", Upload(csv_content(rows)), batch_size=10)
+
+    assert message.startswith("Succeed: Inserted 23 Row(s)")
+    assert progress.batches == [10, 10, 3]
+    assert len(table_rows(db_engine, "people")) == 23
+
+def test_batches_restart_at_each_csv_chunk(db_engine, monkeypatch):
+    monkeypatch.setattr(FileService, "CSV_CHUNK_SIZE", 7)
+    progress = BatchRecorder()
+    rows = [f"{i},name{i}" for i in range(16)]
+
+    message, _ = FileService(db_engine, progress).import_excel_to_table("people", Upload(csv_content(rows)), batch_size=5)
+
+    assert message.startswith("Succeed: Inserted 16 Row(s)")
+    assert progress.batches == [5, 2, 5, 2, 2]
+
+def test_failed_batch_rolls_back_whole_import(db_engine, monkeypatch):
+    monkeypatch.setattr(FileService, "CSV_CHUNK_SIZE", 5)
+    rows = [f"{i},name{i}" for i in range(12)] + ["12,name12,extra"]
+
+    message, _ = FileService(db_engine).import_excel_to_table("people", Upload(csv_content(rows)), batch_size=5)
+
+    assert message.startswith("Failed: Uninserted Data - ")
+    assert "Committed" not in message
+    assert table_rows(db_engine, "people") == []
+
+def test_commit_per_batch_keeps_earlier_batches(db_engine, monkeypatch):
+    monkeypatch.setattr(FileService, "CSV_CHUNK_SIZE", 5)
+    rows = [f"{i},name{i}" for i in range(12)] + ["12,name12,extra"]
+
+    message, _ = FileService(db_engine).import_excel_to_table(
+        "people", Upload(csv_content(rows)), batch_size=5, commit_per_batch=True
+    )
+
+    assert message.startswith("Failed: Uninserted Data after 10 Committed Row(s) - ")
+    assert len(table_rows(db_engine, "people")) == 10
+
+def test_spooled_import_widens_mixed_columns_across_chunks(db_engine, monkeypatch):
+    monkeypatch.setattr(FileService, "IMPLICIT_COMMIT_DIALECTS", ("sqlite",))
+    monkeypatch.setattr(FileService, "CSV_CHUNK_SIZE", 4)
+    rows = [f"{i},{i * 10}," for i in range(8)] + [f"{i},code-{i},{i}.5" for i in range(8, 11)]
+
+    message, _ = FileService(db_engine).import_excel_to_table(
+        "mixed", Upload(csv_content(rows, "id,code,score")), batch_size=3
+    )
+
+    assert message.startswith("Succeed: Inserted 11 Row(s)")
+    types = column_types(db_engine, "mixed")
+    assert types["id"] == "INT"
+    assert types["code"].startswith("VARCHAR")
+    assert types["score"].startswith("DECIMAL")
+    imported = table_rows(db_engine, "mixed")
+    assert [row[0] for row in imported] == list(range(11))
+    assert imported[0][1] == "0" and imported[-1][1] == "code-10"
+
+def test_spooled_import_leaves_no_rows_on_failure(db_engine, monkeypatch):
+    monkeypatch.setattr(FileService, "IMPLICIT_COMMIT_DIALECTS", ("sqlite",))
+    monkeypatch.setattr(FileService, "CSV_CHUNK_SIZE", 5)
+    rows = [f"{i},name{i}" for i in range(12)] + ["12,name12,extra"]
+
+    message, _ = FileService(db_engine).import_excel_to_table("people", Upload(csv_content(rows)), batch_size=5)
+
+    assert message.startswith("Failed: ")
+    with db_engine.connect() as c:
+        assert c.execute(text("SELECT name FROM sqlite_master WHERE name = 'people'")).fetchall() == []
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import text
+from backend import QueryExecutor, ResultCursorStore
+
+@pytest.fixture
+def numbers_engine(db_engine):
+    with db_engine.begin() as c:
+        c.execute(text("CREATE TABLE numbers (id INTEGER PRIMARY KEY, label TEXT)"))
+        c.execute(text("INSERT INTO numbers VALUES (:id, :label)"), [{"id": i, "label": f"n{i}"} for i in range(25)])
+    return db_engine
+
+def test_capped_select_continues_from_cursor(numbers_engine):
+    cursor_store = ResultCursorStore()
+    query_executor = QueryExecutor(numbers_engine, cursor_store, "owner", max_rows=10)
+    message, _, rows, column_names = query_executor.execute_custom_query("SELECT id FROM numbers ORDER BY id")
+
+    assert message.startswith("Succeed")
+    assert column_names == ["id"]
+    assert [row[0] for row in rows] == list(range(10))
+    assert query_executor.truncated and query_executor.cursor_token
+
+    fetched = [row[0] for row in rows]
+    cursor_token = query_executor.cursor_token
+    while cursor_token:
+        query_executor = QueryExecutor(numbers_engine, cursor_store, "owner", max_rows=10)
+        message, _, rows, _ = query_executor.fetch_next_rows(cursor_token)
+        assert message.startswith("Succeed")
+        fetched.extend(row[0] for row in rows)
+        cursor_token = query_executor.cursor_token
+
+    assert fetched == list(range(25))
+    assert not query_executor.truncated
+    assert numbers_engine.pool.checkedout() == 0
+
+def test_select_within_cap_is_not_truncated(numbers_engine):
+    query_executor = QueryExecutor(numbers_engine, ResultCursorStore(), "owner", max_rows=25)
+    _, _, rows, _ = query_executor.execute_custom_query("SELECT * FROM numbers")
+
+    assert len(rows) == 25
+    assert not query_executor.truncated and query_executor.cursor_token is None
+    assert numbers_engine.pool.checkedout() == 0
+
+def test_byte_cap_truncates(numbers_engine):
+    query_executor = QueryExecutor(numbers_engine, ResultCursorStore(), "owner", max_bytes=40)
+    _, _, rows, _ = query_executor.execute_custom_query("SELECT * FROM numbers ORDER BY id")
+
+    assert 0 < len(rows) < 25
+    assert query_executor.truncated
+
+def test_cursor_belongs_to_its_owner(numbers_engine):
+    cursor_store = ResultCursorStore()
+    query_executor = QueryExecutor(numbers_engine, cursor_store, "owner", max_rows=5)
+    query_executor.execute_custom_query("SELECT * FROM numbers")
+
+    message, _, rows, _ = QueryExecutor(numbers_engine, cursor_store, "other").fetch_next_rows(query_executor.cursor_token)
+    assert message == "Failed: Expired or Unknown Cursor" and rows is None
+
+@pytest.mark.parametrize("value", [0, -1, "many", True])
+def test_invalid_caps_are_rejected(numbers_engine, value):
+    with pytest.raises(ValueError):
+        QueryExecutor(numbers_engine, max_rows=value)
+
+def test_caps_are_clamped(numbers_engine):
+    query_executor = QueryExecutor(numbers_engine, max_rows=10 ** 9, max_bytes="1024")
+    assert query_executor.max_rows == QueryExecutor.MAX_ROWS_LIMIT
+    assert query_executor.max_bytes == 1024
@@ -0,0 +1,91 @@
+import time
+import threading
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from backend import QueryGuard
+
+SLOW_QUERY = (
+    "WITH RECURSIVE counter(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM counter WHERE n < 100000000) "
+    "SELECT count(*) FROM counter"
+)
+
+def test_timeout_interrupts_sqlite_statement(db_engine):
+    query_guard = QueryGuard()
+    query_guard.install(db_engine)
+
+    start = time.perf_counter()
+    with query_guard.track("query", "owner", timeout_ms=100):
+        with db_engine.connect() as c:
+            with pytest.raises(OperationalError, match="interrupted"):
+                c.execute(text(SLOW_QUERY))
+    assert time.perf_counter() - start < 5
+
+class FakeKillConnection:
+    def __init__(self, statements, delay):
+        self.statements = statements
+        time.sleep(delay)
+
+    def cursor(self):
+        return self
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+    def close(self):
+        pass
+
+class FakeDialect:
+    name = "mysql"
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.statements = []
+
+    def create_connect_args(self, url):
+        return [], {}
+
+    def connect(self, *cargs, **cparams):
+        return FakeKillConnection(self.statements, self.delay)
+
+class FakeEngine:
+    url = None
+
+    def __init__(self, delay=0):
+        self.dialect = FakeDialect(delay)
+
+class FakeDBAPIConnection:
+    def thread_id(self):
+        return 42
+
+def test_mysql_kill_runs_outside_state_lock():
+    engine = FakeEngine(delay=0.3)
+    dbapi_connection = FakeDBAPIConnection()
+    state = {"active": {}, "lock": threading.Lock()}
+    entry = (engine, dbapi_connection)
+    state["active"][id(dbapi_connection)] = entry
+
+    killer = threading.Thread(target=QueryGuard()._kill, args=(state, entry))
+    killer.start()
+    time.sleep(0.05)
+    assert state["lock"].acquire(timeout=0.1)
+    state["lock"].release()
+    killer.join()
+
+    assert engine.dialect.statements == ["KILL QUERY 42"]
+
+def test_mysql_kill_skips_finished_statement():
+    engine = FakeEngine(delay=0.2)
+    dbapi_connection = FakeDBAPIConnection()
+    state = {"active": {}, "lock": threading.Lock()}
+    entry = (engine, dbapi_connection)
+    state["active"][id(dbapi_connection)] = entry
+
+    killer = threading.Thread(target=QueryGuard()._kill, args=(state, entry))
+    killer.start()
+    time.sleep(0.05)
+    with state["lock"]:
+        state["active"].pop(id(dbapi_connection))
+    killer.join()
+
+    assert engine.dialect.statements == []
@@ -0,0 +1,48 @@
+import time
+from sqlalchemy import create_engine, text
+from backend import QueryExecutor, ResultCursorStore
+
+def park_cursor(engine, cursor_store, owner):
+    query_executor = QueryExecutor(engine, cursor_store, owner, max_rows=1)
+    query_executor.execute_custom_query("SELECT * FROM numbers")
+    return query_executor.cursor_token
+
+def create_numbers_engine(db_path, **pool_options):
+    engine = create_engine(f"sqlite:///{db_path}", **pool_options)
+    with engine.begin() as c:
+        c.execute(text("CREATE TABLE IF NOT EXISTS numbers (id INTEGER PRIMARY KEY)"))
+        c.execute(text("INSERT INTO numbers VALUES (1), (2), (3)"))
+    return engine
+
+def test_reaper_closes_expired_cursors(db_path):
+    engine = create_numbers_engine(db_path)
+    cursor_store = ResultCursorStore(ttl=0.05, reaper_interval=0.02)
+    assert park_cursor(engine, cursor_store, "owner")
+    assert engine.pool.checkedout() == 1
+
+    deadline = time.time() + 2
+    while engine.pool.checkedout() and time.time() < deadline:
+        time.sleep(0.02)
+    assert engine.pool.checkedout() == 0
+    cursor_store.close_all()
+
+def test_parked_cursors_stay_below_pool_size(db_path):
+    engine = create_numbers_engine(db_path, pool_size=4, max_overflow=0, pool_timeout=1)
+    cursor_store = ResultCursorStore(max_per_owner=10)
+    tokens = [park_cursor(engine, cursor_store, f"owner-{i}") for i in range(6)]
+
+    assert all(tokens)
+    assert engine.pool.checkedout() == 2
+    assert cursor_store.take(tokens[0], "owner-0") is None
+    assert cursor_store.take(tokens[-1], "owner-5") is not None
+    cursor_store.close_all()
+
+def test_owner_limit_evicts_oldest_cursor(db_path):
+    engine = create_numbers_engine(db_path)
+    cursor_store = ResultCursorStore(max_per_owner=2)
+    tokens = [park_cursor(engine, cursor_store, "owner") for _ in range(3)]
+
+    assert cursor_store.take(tokens[0], "owner") is None
+    cursor_store.close_entry(cursor_store.take(tokens[2], "owner"))
+    cursor_store.close_all()
+    assert engine.pool.checkedout() == 0
@@ -0,0 +1,47 @@
+import time
+import asyncio
+from sqlalchemy import text
+from backend import DatabaseManager
+
+def wait_for_explain(entry_getter, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        entries = [entry for entry in entry_getter() if entry["explain"] is not None]
+        if entries:
+            return entries[0]["explain"]
+        time.sleep(0.02)
+    raise AssertionError("EXPLAIN was not captured")
+
+def test_explain_runs_for_sync_engine(db_path):
+    database_manager = DatabaseManager(slow_query_ms=0)
+    session_key, _ = database_manager.connect_database("url", db_url=f"sqlite:///{db_path}")
+    engine = database_manager.get_db_engine(session_key)
+    with engine.begin() as c:
+        c.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)"))
+        c.execute(text("SELECT * FROM t WHERE id > 0"))
+
+    explain = wait_for_explain(database_manager.slow_query_log.top)
+    assert isinstance(explain, list) and explain
+    database_manager.dispose_database(session_key)
+
+def test_explain_runs_for_async_engine(db_path):
+    database_manager = DatabaseManager(slow_query_ms=0)
+    session_key, _ = database_manager.connect_database("url", db_url=f"sqlite:///{db_path}")
+    with database_manager.get_db_engine(session_key).begin() as c:
+        c.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)"))
+
+    async def run_query():
+        async_engine = database_manager.get_async_engine(session_key)
+        async with async_engine.connect() as c:
+            await c.execute(text("SELECT name FROM t WHERE id > 0"))
+        await asyncio.to_thread(
+            wait_for_explain,
+            lambda: [entry for entry in database_manager.slow_query_log.top() if "name FROM t" in entry["statement"]]
+        )
+        database_manager.dispose_database(session_key)
+
+    asyncio.run(run_query())
+    entries = [entry for entry in database_manager.slow_query_log.top() if "name FROM t" in entry["statement"]]
+    explain = entries[0]["explain"]
+    assert isinstance(explain, list) and explain
+    assert "t" in str(explain)
@@ -0,0 +1,78 @@
+import io
+import json
+from sqlalchemy import text
+from backend.sql_script_service import SQLScriptService
+
+SCRIPT = """CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT);
+INSERT INTO items VALUES (1, 'one');
+INSERT INTO items VALUES (1, 'duplicate');
+INSERT INTO items VALUES (2, 'two');
+INSERT INTO missing VALUES (3);
+INSERT INTO items VALUES (3, 'three');
+"""
+
+def run_script(db_engine, tmp_path, script=SCRIPT, **options):
+    sql_script_service = SQLScriptService(db_engine)
+    report_path = tmp_path / "report.ndjson"
+    message = sql_script_service.execute_script(io.BytesIO(script.encode("utf-8")), str(report_path), **options)
+    report = [json.loads(line) for line in report_path.read_text(encoding="utf-8").splitlines()]
+    return sql_script_service, message, report
+
+def item_ids(db_engine):
+    with db_engine.connect() as c:
+        return [row[0] for row in c.execute(text("SELECT id FROM items ORDER BY id"))]
+
+def test_continue_on_error_reports_failures(db_engine, tmp_path):
+    sql_script_service, message, report = run_script(db_engine, tmp_path, batch_size=2, continue_on_error=True)
+
+    assert message.startswith("Succeed: Committed 4 Statement(s) in 3 Batch(es)")
+    assert message.endswith("with 2 Failed Statement(s)")
+    assert sql_script_service.statements_failed == 2
+    assert [(entry["line"], entry["status"]) for entry in report] == [
+        (1, "ok"), (2, "ok"), (3, "error"), (4, "ok"), (5, "error"), (6, "ok")
+    ]
+    assert "UNIQUE" in report[2]["error"]
+    assert "missing" in report[4]["error"]
+    assert report[3]["statement"] == "INSERT INTO items VALUES (2, 'two')"
+    assert item_ids(db_engine) == [1, 2, 3]
+
+def test_stop_on_error_rolls_back_open_batch(db_engine, tmp_path):
+    sql_script_service, message, report = run_script(db_engine, tmp_path, batch_size=2)
+
+    assert message.startswith("Failed: Statement at line 3 - ")
+    assert "Committed 2 Statement(s) in 1 Batch(es)" in message
+    assert sql_script_service.statements_committed == 2
+    assert [entry["status"] for entry in report] == ["ok", "ok", "error"]
+    assert item_ids(db_engine) == [1]
+
+def test_stop_on_error_discards_uncommitted_statements(db_engine, tmp_path):
+    script = "CREATE TABLE items (id INTEGER PRIMARY KEY);\nINSERT INTO items VALUES (1);\nINSERT INTO items VALUES (2);\nINSERT INTO items VALUES (2);\n"
+    _, message, _ = run_script(db_engine, tmp_path, script=script, batch_size=3)
+
+    assert message.startswith("Failed: Statement at line 4 - ")
+    assert "Committed 3 Statement(s) in 1 Batch(es)" in message
+    assert item_ids(db_engine) == [1, 2]
+
+    _, message, _ = run_script(db_engine, tmp_path, script="INSERT INTO items VALUES (5);\nINSERT INTO items VALUES (1);\n")
+    assert "Committed 0 Statement(s) in 0 Batch(es)" in message
+    assert item_ids(db_engine) == [1, 2]
+
+class ImplicitCommitScriptService(SQLScriptService):
+    IMPLICIT_COMMIT_DIALECTS = ("sqlite",)
+
+def test_implicit_commit_statements_run_in_their_own_batch(db_engine, tmp_path):
+    script = "CREATE TABLE items (id INTEGER PRIMARY KEY);\nINSERT INTO items VALUES (1);\nCREATE TABLE items (id INTEGER);\nINSERT INTO items VALUES (2);\nINSERT INTO items VALUES (1);\n"
+    sql_script_service = ImplicitCommitScriptService(db_engine)
+    message = sql_script_service.execute_script(io.BytesIO(script.encode("utf-8")), batch_size=10, continue_on_error=True)
+
+    assert message.startswith("Succeed: Committed 3 Statement(s) in 3 Batch(es)")
+    assert message.endswith("with 2 Failed Statement(s)")
+    assert item_ids(db_engine) == [1, 2]
+
+def test_implicit_commit_failure_keeps_earlier_batch(db_engine, tmp_path):
+    script = "CREATE TABLE items (id INTEGER PRIMARY KEY);\nINSERT INTO items VALUES (1);\nCREATE TABLE items (id INTEGER);\nINSERT INTO items VALUES (2);\n"
+    message = ImplicitCommitScriptService(db_engine).execute_script(io.BytesIO(script.encode("utf-8")), batch_size=10)
+
+    assert message.startswith("Failed: Statement at line 3 - ")
+    assert "Committed 2 Statement(s) in 2 Batch(es)" in message
+    assert item_ids(db_engine) == [1]